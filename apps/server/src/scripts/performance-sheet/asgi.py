@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Performance Sheet ASGI Service
+
+Serves the calculation engine over HTTP so callers can reuse keep-alive
+connections instead of spawning a Python process per calculation. Models and
+lookup tables are imported once and stay resident for the life of the server.
+
+Usage:
+    uvicorn asgi:app --host 127.0.0.1 --port 8765
+    python asgi.py --port 8765
+
+Endpoints (JSON in, JSON out):
+    POST /calculate         one sheet (or {"data": sheet, "sections": [...]}) -> section results
+    POST /calculate/batch   {"sheets": [sheet, ...], "sections": [...]} or [sheet, ...] -> {"results": [...]} in input order
+    POST /autofill          one sheet -> auto-fill values
+    POST /feed/limits       {"data": sheet, "length": 7.5} or {"data": sheet, "spm": 60} -> max SPM or max length
+    POST /feed/ranking      {"data": sheet, "sort_by": "margin"} -> every feed model ranked for the sheet
+    POST /feed/map          {"data": sheet, "lengths": [2, 60, 200], "spm": [5, 120, 200]} -> feed_check and margins per point
+    POST /feed/duty-cycle   {"data": sheet, "jobs": [[7.5, 40, 20000], ...]} -> RMS torque, regen and thermal load over the shift
+    POST /feed/angles       {"data": sheet, "feed_angles": [90, 180, 270], "length": 7.5, "spm": 40} -> RMS and SPM per angle, minimum feed angle
+    GET  /health            liveness check and the lookup table version in use
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import sys
+
+import autofill
+from feed_queries import FEED_QUERIES, run_feed_query
+from utils.calculator_loader import preload_calculators
+from utils.table_registry import get_table_version, start_table_watcher
+from main import calculate, get_parallel_flag, get_requested_sections, unwrap_payload
+
+
+class HTTPError(Exception):
+    """Error that maps directly onto an HTTP status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# --- Handlers ---
+def handle_calculate(payload):
+    return calculate(unwrap_payload(payload), get_requested_sections(payload), get_parallel_flag(payload))
+
+def handle_calculate_batch(payload):
+    sheets = payload.get("sheets") if isinstance(payload, dict) else payload
+    if not isinstance(sheets, list):
+        raise HTTPError(400, "Batch request must be a list of sheets or {\"sheets\": [...]}")
+
+    # A batch-level "sections" list applies to every sheet that does not carry its own
+    batch_sections = payload.get("sections") if isinstance(payload, dict) else None
+
+    results = []
+    for sheet in sheets:
+        # One bad sheet must not fail the whole batch
+        try:
+            sections = get_requested_sections(sheet)
+            if sections is None:
+                sections = batch_sections
+            results.append(calculate(unwrap_payload(sheet), sections))
+        except Exception as e:
+            print(f"Error in batch calculation: {e}", file=sys.stderr)
+            results.append({"error": str(e), "status": "failed"})
+    return {"results": results}
+
+def handle_autofill(payload):
+    sheet = unwrap_payload(payload)
+    if not isinstance(sheet, dict) or "data" in sheet:
+        raise HTTPError(400, "Autofill request must be a sheet or {\"data\": sheet}")
+    return autofill.generate_autofill(sheet)
+
+ROUTES = {
+    ("POST", "/calculate"): handle_calculate,
+    ("POST", "/calculate/batch"): handle_calculate_batch,
+    ("POST", "/autofill"): handle_autofill,
+    **{("POST", query.route): functools.partial(run_feed_query, name) for name, query in FEED_QUERIES.items()},
+    ("GET", "/health"): lambda payload: {"status": "ok", "table_version": get_table_version()},
+}
+
+
+# --- ASGI plumbing ---
+async def read_body(receive) -> bytes:
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return body
+
+async def send_json(send, status: int, content) -> None:
+    body = json.dumps(content, default=str).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            preload_calculators()
+            start_table_watcher()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    """ASGI entry point."""
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"].rstrip("/") or "/"
+    method = scope["method"]
+
+    try:
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in ROUTES):
+                raise HTTPError(405, f"Method {method} not allowed for {path}")
+            raise HTTPError(404, f"Unknown endpoint: {path}")
+
+        body = await read_body(receive)
+        try:
+            payload = json.loads(body) if body else {}
+        except json.JSONDecodeError as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}")
+
+        # Calculations are CPU bound; keep the event loop free for other connections
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, handler, payload)
+        await send_json(send, 200, result)
+    except HTTPError as e:
+        await send_json(send, e.status, {"error": e.message})
+    except ValueError as e:
+        # Handlers reject malformed requests with ValueError
+        await send_json(send, 400, {"error": str(e)})
+    except Exception as e:
+        print(f"Error handling {method} {path}: {e}", file=sys.stderr)
+        await send_json(send, 500, {"error": str(e), "status": "failed"})
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="COE Performance Sheet calculation service")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind (defaults to loopback)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    args = parser.parse_args()
+
+    uvicorn.run(app, host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -21,12 +21,9 @@ from calculations.tddbhd import calculate_tbdbhd
 from calculations.reel_drive import calculate_reeldrive
 from calculations.str_utility import calculate_str_utility
 from calculations.rolls.roll_str_backbend import calculate_roll_str_backbend
-from calculations.feeds.sigma_five_feed import calculate_sigma_five
-from calculations.feeds.sigma_five_feed_with_pt import calculate_sigma_five_pt
-from calculations.feeds.allen_bradley_mpl_feed import calculate_allen_bradley
-from calculations.shears.single_rake_hyd_shear import calculate_single_rake_hyd_shear
-from calculations.shears.bow_tie_hyd_shear import calculate_bow_tie_hyd_shear
 from utils.shared import DEFAULTS
+from utils.calculator_loader import load_calculator
+from utils.table_registry import pin_tables
 # from utils.initial.tddbhd_input_finder import get_min_tddbhd_inputs
 # from utils.initial.str_utility_finder import get_min_str_utility_inputs  
 # from utils.initial.get_initial_str_utility_input import get_initial_str_utility_inputs
@@ -1404,7 +1401,7 @@ def generate_minimum_feed_values(data: Dict[str, Any]) -> Dict[str, Any]:
                         feed_data_corrected[k] = v
 
                 feed_obj = base_feed_params(**feed_data_corrected)
-                result = calculate_sigma_five(feed_obj)
+                result = load_calculator("sigma_five")(feed_obj)
 
                 # Check if result is valid and feed_check passes
                 if result and isinstance(result, dict) and "error" not in result:
@@ -1579,9 +1576,9 @@ def generate_minimum_shear_values(data: Dict[str, Any]) -> Dict[str, Any]:
 
                 shear_obj = hyd_shear_input(**shear_data)
                 if shear_type == "single-rake":
-                    result = calculate_single_rake_hyd_shear(shear_obj)
+                    result = load_calculator("single_rake_hyd_shear")(shear_obj)
                 else:
-                    result = calculate_bow_tie_hyd_shear(shear_obj)
+                    result = load_calculator("bow_tie_hyd_shear")(shear_obj)
 
                 # Check if result is valid and force_req_to_shear_check passes
                 if result and isinstance(result, dict) and "error" not in result:
@@ -1705,12 +1702,10 @@ def deep_merge(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
     
     return result
 
-def main():
-    """Main auto-fill function"""
-    try:
-        # Read input data from stdin
-        input_data = json.loads(sys.stdin.read())
-        
+def generate_autofill(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate auto-fill values for every tab of a performance sheet"""
+    # Every tab is searched against the same lookup table version, even if tables reload meanwhile
+    with pin_tables() as tables:
         # Generate auto-fill values for each tab
         autofill_results = []
         
@@ -1723,24 +1718,32 @@ def main():
         autofill_results.append(generate_minimum_roll_str_backbend_values(input_data))
         autofill_results.append(generate_minimum_feed_values(input_data))
         autofill_results.append(generate_minimum_shear_values(input_data))
-        
-        # Merge all results
-        merged_results = merge_auto_fill_results([r for r in autofill_results if r])
-        
-        # Output the results
-        output = {
-            "success": True,
-            "autoFillValues": merged_results,
-            "generatedSections": [
-                "rfq", "material-specs", "tddbhd", "reel-drive",
-                "str-utility", "roll-str-backbend", "feed", "shear"
-            ],
-            "metadata": {
-                "timestamp": "2025-09-25T00:00:00Z",
-                "version": "1.0"
-            }
+    
+    # Merge all results
+    merged_results = merge_auto_fill_results([r for r in autofill_results if r])
+    
+    return {
+        "success": True,
+        "autoFillValues": merged_results,
+        "generatedSections": [
+            "rfq", "material-specs", "tddbhd", "reel-drive",
+            "str-utility", "roll-str-backbend", "feed", "shear"
+        ],
+        "metadata": {
+            "timestamp": "2025-09-25T00:00:00Z",
+            "version": "1.0",
+            "tableVersion": tables.version
         }
+    }
+
+def main():
+    """Main auto-fill function"""
+    try:
+        # Read input data from stdin
+        input_data = json.loads(sys.stdin.read())
         
+        # Output the results
+        output = generate_autofill(input_data)
         print(json.dumps(output, indent=2))
         
     except Exception as e:
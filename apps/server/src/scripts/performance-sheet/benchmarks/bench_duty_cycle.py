@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Feed duty-cycle benchmark.
+
+Checks simulate_duty_cycle in utils/physics/duty_cycle.py against closed forms
+for one stroke at a time: the RMS torque of the time table
+(rms^2 = (moving + loop^2 * dwell) / cycle), and the braking energy of a linear
+deceleration (acceleration torque * peak speed * deceleration time / 2). The
+steps follow the phases, where torque is constant and speed linear, so both
+must agree within --tolerance at every step size. The thermal recurrence is
+checked against a plain loop over the strokes. calculate_regen's per-stroke
+energy is printed beside the simulated regen for the sample feed, on a short
+stroke and on one that reaches full speed. They agree only on the second; see
+utils/physics/duty_cycle.py for which figure to use. The benchmark then times
+a shift of mixed jobs and one where every stroke has its own length.
+
+Usage:
+    python benchmarks/bench_duty_cycle.py [--strokes 100000] [--jobs 50] [--tolerance 1e-9] [--seed 1]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+import numpy as np  # noqa: E402
+
+from main import extract_inputs, select_feed, unwrap_payload  # noqa: E402
+from models import regen_input  # noqa: E402
+from services.feed_calculations import get_feed_constants, prepare_feed  # noqa: E402
+from utils.physics import duty_cycle  # noqa: E402
+from utils.physics import time as time_table  # noqa: E402
+from utils.physics.regen import calculate_regen  # noqa: E402
+
+SHEET = os.path.join(_ROOT, "calculations", "25-00245.json")
+
+
+def closed_form(data, length, spm, feed_angle):
+    """RMS torque and braking energy (J) of one stroke, from the time table's terms."""
+    acceleration_time, runtime, acceleration_torque, peak_torque, index_time = time_table._length_terms(data, length)
+    moving = (((peak_torque ** 2) * acceleration_time) + ((acceleration_torque ** 2) * acceleration_time)
+              + (((data.frictional_torque + data.loop_torque) ** 2) * runtime) + ((data.settle_torque ** 2) * data.settle_time))
+    cycle_time = max(60 / spm, index_time)
+    rms = math.sqrt((moving + ((data.loop_torque ** 2) * (cycle_time - index_time))) / cycle_time)
+    peak_speed = data.acceleration * acceleration_time * (data.rpm / data.velocity) * (2 * math.pi / 60)
+    braking = acceleration_torque * duty_cycle._LB_IN_TO_NM * peak_speed * acceleration_time / 2
+    return rms, braking, acceleration_time, cycle_time
+
+
+def thermal_loop(heating, cycle_time, tau):
+    load, loads = 0.0, []
+    for h, c in zip(heating, cycle_time):
+        decay = math.exp(-c / tau)
+        load = load * decay + h * (1 - decay)
+        loads.append(load)
+    return loads
+
+
+def relative(a, b):
+    return abs(a - b) / abs(b) if b else abs(a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the feed duty-cycle simulator")
+    parser.add_argument("--strokes", type=int, default=100000, help="Strokes in the timed shifts")
+    parser.add_argument("--jobs", type=int, default=50, help="Jobs in the mixed shift")
+    parser.add_argument("--tolerance", type=float, default=1e-9, help="Relative tolerance against the closed forms")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the schedules")
+    args = parser.parse_args()
+
+    with open(SHEET, "r") as f:
+        feed = select_feed(extract_inputs(unwrap_payload(json.load(f))))[1]
+    setup = prepare_feed(feed)
+    data = setup.time
+    specs = get_feed_constants("sigma_five", feed.feed_model)._asdict()
+    feed_angle = data.feed_angle_1
+    rng = random.Random(args.seed)
+
+    worst = {}
+    for step in (duty_cycle.MAX_TIME_STEP, duty_cycle.DEFAULT_TIME_STEP, duty_cycle.MIN_TIME_STEP):
+        worst[step] = [0.0, 0.0]
+        for _ in range(50):
+            length, spm = rng.uniform(0.5, 80), rng.uniform(5, 120)
+            rms, braking, acceleration_time, _ = closed_form(data, length, spm, feed_angle)
+            simulated = duty_cycle.simulate_duty_cycle(data, specs, [(length, spm, 1)], step=step)
+            regen = max(0.0, braking - (acceleration_time * specs["watts_lost"] + specs["ec"]))
+            worst[step][0] = max(worst[step][0], relative(simulated["rms_torque"], rms))
+            worst[step][1] = max(worst[step][1], relative(simulated["regen_energy"], regen) if regen > 1 else 0.0)
+        print(f"step {step * 1e3:5.1f} ms: worst RMS error {worst[step][0]:.2e}, worst regen error {worst[step][1]:.2e}")
+    if max(max(errors) for errors in worst.values()) > args.tolerance:
+        raise SystemExit(f"Simulation is outside the {args.tolerance} tolerance of the closed forms")
+
+    heating = np.array([rng.uniform(0, 2) for _ in range(20000)])
+    cycles = np.array([rng.uniform(0.2, 30) for _ in range(20000)])
+    closed = duty_cycle._thermal_load(np, heating, cycles, 600.0)
+    looped = thermal_loop(heating, cycles, 600.0)
+    error = max(abs(a - b) for a, b in zip(closed, looped))
+    if error > 1e-9:
+        raise SystemExit(f"Thermal recurrence differs from the loop by {error}")
+    print(f"thermal recurrence matches the loop over {len(heating)} strokes ({error:.1e})")
+
+    # calculate_regen assumes rated RPM; the 12 in stroke peaks below it, the 30 in stroke reaches it
+    spm = 30.0
+    for length in (12.0, 30.0):
+        _, _, acceleration_time, cycle_time = closed_form(data, length, spm, feed_angle)
+        simulated = duty_cycle.simulate_duty_cycle(data, specs, [(length, spm, 1)])
+        regen = calculate_regen(regen_input(match=setup.match, motor_inertia=specs["motor_inertia"], rpm=data.rpm,
+                                            acceleration_time=acceleration_time, cycle_time=cycle_time,
+                                            watts_lost=specs["watts_lost"], ec=specs["ec"]))
+        print(f"regen at {length} in, {spm} SPM: calculate_regen {regen * cycle_time:.1f} J (rated RPM), "
+              f"simulated {simulated['regen_energy']:.1f} J (speed reached)")
+
+    per_job = max(1, args.strokes // args.jobs)
+    mixed = [(rng.uniform(2, 60), rng.uniform(10, 60), per_job) for _ in range(args.jobs)]
+    distinct = [(rng.uniform(2, 60), rng.uniform(10, 60), 1) for _ in range(args.strokes)]
+    print(f"\nShift of {args.strokes} strokes at {duty_cycle.DEFAULT_TIME_STEP * 1e3:.0f} ms:")
+    for name, jobs in ((f"{args.jobs} jobs", mixed), ("every stroke distinct", distinct)):
+        started = time.perf_counter()
+        result = duty_cycle.simulate_duty_cycle(data, specs, jobs)
+        elapsed = time.perf_counter() - started
+        print(f"    {name:22s} {elapsed:7.2f} s   {result['samples']:>11,} samples   "
+              f"rms {result['rms_torque']:.1f}   thermal peak {result['thermal_load_peak']:.3f}")
+
+if __name__ == "__main__":
+    main()
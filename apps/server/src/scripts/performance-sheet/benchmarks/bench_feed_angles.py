@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Multi-angle feed evaluation benchmark.
+
+Checks run_sigma_five_calculation(feed_angles=...) in services/feed_calculations.py
+against one full calculation per angle with the angle as feed_angle_1: every
+angle's RMS torque, check and chart columns must be identical, on randomized
+sheets. solve_min_feed_angle in utils/physics/time.py is checked against the
+time table: at the minimum angle the table's cycle time equals the press cycle,
+and the RMS torque there is the table's. The benchmark then times a sweep of
+cam angles both ways.
+
+The timings depend on the time table engine. Under the default "auto" engine a
+fresh process runs the scalar table, since NumPy is only used once it has been
+preloaded; --engine numpy times what a long-lived worker gets.
+
+Usage:
+    python benchmarks/bench_feed_angles.py [--cases 100] [--angles 181] [--iterations 20] [--seed 1] [--engine auto]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from main import extract_inputs, select_feed, unwrap_payload  # noqa: E402
+from services.feed_calculations import prepare_feed, run_sigma_five_calculation  # noqa: E402
+from utils.physics import time as time_table  # noqa: E402
+from bench_feed_ranking import random_sheet  # noqa: E402
+
+SHEET = os.path.join(_ROOT, "calculations", "25-00245.json")
+
+
+def per_angle(data, angles):
+    """One full calculation per angle, the angle in feed_angle_1."""
+    results = [run_sigma_five_calculation(data.copy(update={"feed_angle_1": angle})) for angle in angles]
+    return {
+        "rms_torque": [result["rms_torque_fa1"] for result in results],
+        "rms_torque_check": [result["rms_torque_fa1_check"] for result in results],
+        "rms_torque_chart": [result["table_values"]["rms_torque_fa1"] for result in results],
+        "spm_chart": [result["table_values"]["spm_at_fa1"] for result in results],
+    }
+
+
+def compare(data, angles):
+    expected = per_angle(data, angles)
+    swept = run_sigma_five_calculation(data, feed_angles=angles)["feed_angles"]
+    for key, values in expected.items():
+        if values != swept[key]:
+            return key
+    return None
+
+
+def check_min_angle(data, length, spm):
+    time = prepare_feed(data).time
+    solved = time_table.solve_min_feed_angle(time, length, spm)
+    if solved["min_feed_angle"] is None:
+        return solved["binding"], None
+    angle = solved["min_feed_angle"]
+    # The table at that angle: index_time * 360 / angle is the press cycle
+    _, _, _, _, index_time = time_table._length_terms(time, length)
+    cycle_time = index_time * (360 / angle)
+    moving = time_table._cycle_limit(time, length, angle)[3]
+    rms = math.sqrt((moving + ((time.loop_torque ** 2) * (cycle_time - index_time))) / cycle_time)
+    if not (math.isclose(cycle_time, 60 / spm, rel_tol=1e-12) and math.isclose(rms, solved["rms_torque"], rel_tol=1e-12)):
+        raise SystemExit(f"Minimum feed angle off at {length} in, {spm} SPM: {solved}")
+    return solved["binding"], angle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time evaluating many feed angles at once")
+    parser.add_argument("--cases", type=int, default=100, help="Randomized sheets to compare")
+    parser.add_argument("--angles", type=int, default=181, help="Cam angles from 90 to 270 degrees in the timing")
+    parser.add_argument("--iterations", type=int, default=20, help="Sweeps per timing")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the sheets")
+    parser.add_argument("--engine", choices=("auto", "numpy", "python"), default=None,
+                        help="Time table engine (defaults to PERFORMANCE_SHEET_TIME_ENGINE)")
+    args = parser.parse_args()
+    if args.engine:
+        os.environ["PERFORMANCE_SHEET_TIME_ENGINE"] = args.engine
+
+    with open(SHEET, "r") as f:
+        base = select_feed(extract_inputs(unwrap_payload(json.load(f))))[1]
+    # Columns, so the per-angle path's chart reads the same way as the sweep
+    base = base.copy(update={"chart_format": "columns"})
+
+    rng = random.Random(args.seed)
+    for case in range(args.cases):
+        data = base if case == 0 else random_sheet(rng, base)
+        angles = sorted(rng.uniform(30, 330) for _ in range(rng.randint(1, 12)))
+        mismatch = compare(data, angles)
+        if mismatch:
+            raise SystemExit(f"Mismatch on case {case} in {mismatch}: {angles}\n{data.dict()}")
+    print(f"{args.cases} sheets identical to one calculation per angle")
+
+    bindings = {}
+    for _ in range(500):
+        binding, _ = check_min_angle(base, rng.uniform(0.5, 100), rng.uniform(2, 200))
+        bindings[binding] = bindings.get(binding, 0) + 1
+    print(f"500 minimum feed angles consistent with the time table {bindings}")
+
+    angles = [90 + (180 * i / (args.angles - 1)) if args.angles > 1 else 180.0 for i in range(args.angles)]
+    n = args.iterations
+    per_angle_ms = min(timeit.repeat(lambda: per_angle(base, angles), number=n, repeat=3)) / n * 1e3
+    swept_ms = min(timeit.repeat(lambda: run_sigma_five_calculation(base, feed_angles=angles), number=n, repeat=5)) / n * 1e3
+    vectorized = time_table._numpy_engine() is not None
+    print(f"{args.angles} feed angles from 90 to 270 (best of several x {n}), "
+          f"{time_table.get_time_engine()} engine, {'NumPy' if vectorized else 'scalar'} time table:")
+    print(f"    one calculation per angle  {per_angle_ms:8.2f} ms")
+    print(f"    one call                   {swept_ms:8.2f} ms   {per_angle_ms / swept_ms:5.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Feed model constants benchmark.
+
+Checks the compiled FeedConstants table in services/feed_calculations.py against
+deriving every model's constants from its spec row per call, as the service did
+before: same values for every model of every spec table, and the same error
+for the models that cannot be read. It then times fetching one model's
+constants both ways, and prepare_feed for a sweep over every sigma five model
+with the material terms recomputed per model and computed once.
+
+Usage:
+    python benchmarks/bench_feed_constants.py [--iterations 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from main import extract_inputs, select_feed, unwrap_payload  # noqa: E402
+from services.feed_calculations import (  # noqa: E402
+    SPEC_KEYS_SIGMA_FIVE, derive_feed_constants, feed_material, get_all_specs_for, get_feed_constants, prepare_feed,
+)
+from utils.lookup_tables import FEED_SPEC_TYPES, list_feed_models  # noqa: E402
+
+SHEET = os.path.join(_ROOT, "calculations", "25-00245.json")
+
+
+def per_call_constants(spec_type, feed_model):
+    """The per-call path: fetch the spec row, then derive."""
+    return derive_feed_constants(spec_type, get_all_specs_for(spec_type, feed_model, SPEC_KEYS_SIGMA_FIVE))
+
+
+def outcome(fetch, spec_type, feed_model):
+    try:
+        return fetch(spec_type, feed_model)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the compiled feed model constants")
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per timing")
+    args = parser.parse_args()
+    n = args.iterations
+
+    checked = 0
+    for spec_type in FEED_SPEC_TYPES:
+        for feed_model in list_feed_models(spec_type):
+            for name in (feed_model, feed_model.lower()):
+                expected, actual = outcome(per_call_constants, spec_type, name), outcome(get_feed_constants, spec_type, name)
+                if expected != actual:
+                    raise SystemExit(f"{spec_type} {name}: {expected} != {actual}")
+                checked += 1
+    print(f"{checked} model lookups identical (both cases)")
+
+    with open(SHEET, "r") as f:
+        data = select_feed(extract_inputs(unwrap_payload(json.load(f))))[1]
+    models = [data.copy(update={"feed_model": model}) for model in list_feed_models("sigma_five")]
+    material = feed_material(data)
+
+    print(f"\nOne model's constants (best of 5 x {n}):")
+    per_call_us = min(timeit.repeat(lambda: per_call_constants("sigma_five", "CPRF-S3"), number=n, repeat=5)) / n * 1e6
+    compiled_us = min(timeit.repeat(lambda: get_feed_constants("sigma_five", "CPRF-S3"), number=n, repeat=5)) / n * 1e6
+    print(f"    spec fetch + derive  {per_call_us:7.2f} us")
+    print(f"    compiled table       {compiled_us:7.2f} us   {per_call_us / compiled_us:5.2f}x")
+
+    m = max(1, n // (10 * len(models)))
+    print(f"\nprepare_feed over {len(models)} sigma five models (best of 5 x {m}):")
+    per_model_ms = min(timeit.repeat(lambda: [prepare_feed(model) for model in models], number=m, repeat=5)) / m * 1e3
+    shared_ms = min(timeit.repeat(lambda: [prepare_feed(model, material=material) for model in models], number=m, repeat=5)) / m * 1e3
+    print(f"    material per model   {per_model_ms:7.3f} ms")
+    print(f"    material once        {shared_ms:7.3f} ms   {per_model_ms / shared_ms:5.2f}x")
+
+if __name__ == "__main__":
+    main()
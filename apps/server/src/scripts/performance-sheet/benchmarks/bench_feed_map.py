@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Feed feasibility map benchmark.
+
+Checks calculate_feasibility_map in utils/physics/time.py against a scalar
+double loop: solve_max_spm at every length, then each SPM on the axis with the
+margins worked out one point at a time. The inputs are the sample feed with
+randomized motor, inertia, loop and straightener values and both applications.
+max_spm and the binding check per length must match exactly, and feed_check,
+binding and every margin must match at every point. The benchmark then times
+both at the requested grid size.
+
+Usage:
+    python benchmarks/bench_feed_map.py [--cases 200] [--grid 200] [--seed 1]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from models import time_input  # noqa: E402
+from utils.physics import time as time_table  # noqa: E402
+from bench_time_table import SAMPLE, VARIED  # noqa: E402
+
+
+def margin_of(rating, value):
+    # inf or NaN where the array math gives them; the map reports those as None
+    try:
+        return (rating - value) / rating
+    except ZeroDivisionError:
+        return math.nan
+
+
+def finite_or_none(value):
+    return value if math.isfinite(value) else None
+
+
+def axis(first, last, steps):
+    return [first + (last - first) * i / (steps - 1) if steps > 1 else first for i in range(steps)]
+
+
+def reference_map(data, length_axis, spm_axis, feed_angle=None):
+    """The same map one point at a time."""
+    if feed_angle is None:
+        feed_angle = data.feed_angle_1
+    factor = time_table._feed_angle_factor(data, feed_angle)
+
+    result = {"max_spm": [], "length_binding": [], "feed_check": [], "binding": [],
+              "margins": {check: [] for check in time_table.MAP_MARGINS}}
+    for length in length_axis:
+        solved = time_table.solve_max_spm(data, length, feed_angle)
+        result["max_spm"].append(solved["max_spm"])
+        result["length_binding"].append(solved["binding"])
+        acceleration_time, runtime, acceleration_torque, peak_torque, index_time = time_table._length_terms(data, length)
+        _, _, _, moving = time_table._cycle_limit(data, length, feed_angle)
+        angle_cycle_time = index_time * factor if factor is not None else index_time + feed_angle
+        headroom = (data.motor_rms_torque ** 2) - (data.loop_torque ** 2)
+        rms_cycle_time = (moving - ((data.loop_torque ** 2) * index_time)) / headroom if headroom > 0 else math.inf
+        gates_ok = acceleration_torque < data.motor_peak_torque and data.motor_peak_torque > peak_torque
+
+        rows = {key: [] for key in ("feed_check", "binding", *time_table.MAP_MARGINS)}
+        for strokes in spm_axis:
+            cycle_time = 60 / strokes
+            try:
+                rms_torque = math.sqrt((moving + ((data.loop_torque ** 2) * (cycle_time - index_time))) / cycle_time)
+            except ValueError:
+                rms_torque = math.nan
+            margins = {
+                "acceleration_torque": margin_of(data.motor_peak_torque, acceleration_torque),
+                "peak_torque": margin_of(data.motor_peak_torque, peak_torque),
+                "feed_angle": margin_of(cycle_time, angle_cycle_time),
+                "rms_torque": margin_of(data.motor_rms_torque, rms_torque),
+                "straightener": margin_of(data.str_max_sp_inch, strokes * length) if data.str_max_sp_inch > 0 else math.inf,
+            }
+            # NaN counts as no margin at all; ties go to the earlier check
+            ordered = [(-math.inf if math.isnan(margins[check]) else margins[check], check) for check in time_table.FEED_LIMIT_CHECKS]
+            smallest = min(ordered, key=lambda item: item[0])
+            margins["margin"] = smallest[0]
+            feasible = gates_ok and solved["max_spm"] > 0 and strokes <= solved["max_spm"]
+            if feasible:
+                binding = smallest[1]
+            elif not acceleration_torque < data.motor_peak_torque:
+                binding = "acceleration_torque"
+            elif not data.motor_peak_torque > peak_torque:
+                binding = "peak_torque"
+            elif strokes > 60 / angle_cycle_time:
+                binding = "feed_angle"
+            elif strokes > 60 / rms_cycle_time:
+                binding = "rms_torque"
+            else:
+                binding = "straightener"
+            rows["feed_check"].append("OK" if feasible else "")
+            rows["binding"].append(binding)
+            for check in time_table.MAP_MARGINS:
+                rows[check].append(finite_or_none(margins[check]))
+        result["feed_check"].append(rows["feed_check"])
+        result["binding"].append(rows["binding"])
+        for check in time_table.MAP_MARGINS:
+            result["margins"][check].append(rows[check])
+    return result
+
+
+def close(a, b):
+    if a is None or b is None:
+        return a is b
+    return a == b or math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def compare(data, lengths, spm, batched):
+    for key, values in (("lengths", axis(*lengths)), ("spm", axis(*spm))):
+        if not all(close(a, b) for a, b in zip(values, batched[key])) or len(values) != len(batched[key]):
+            return key
+    reference = reference_map(data, batched["lengths"], batched["spm"])
+    for key in ("max_spm", "length_binding"):
+        if reference[key] != batched[key]:
+            return key
+    for key in ("feed_check", "binding"):
+        if reference[key] != batched[key]:
+            return key
+    for check in time_table.MAP_MARGINS:
+        for ref_row, row in zip(reference["margins"][check], batched["margins"][check]):
+            if not all(close(a, b) for a, b in zip(ref_row, row)):
+                return f"margins.{check}"
+    return None
+
+
+def random_input(rng):
+    values = dict(SAMPLE)
+    for key in VARIED:
+        if rng.random() < 0.5:
+            values[key] = SAMPLE[key] * rng.uniform(0.05, 5)
+    if rng.random() < 0.2:
+        values["str_max_sp_inch"] = 0.0
+    if rng.random() < 0.1:
+        values["application"] = "Standalone"
+    return time_input(**values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the feed feasibility map")
+    parser.add_argument("--cases", type=int, default=200, help="Randomized feeds to compare")
+    parser.add_argument("--grid", type=int, default=200, help="Points per axis for the timing")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the inputs")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for case in range(args.cases):
+        data = random_input(rng)
+        lengths = (rng.uniform(0.5, 10), rng.uniform(10, 200), rng.randint(1, 40))
+        spm = (rng.uniform(1, 20), rng.uniform(20, 300), rng.randint(1, 40))
+        mismatch = compare(data, lengths, spm, time_table.calculate_feasibility_map(data, lengths, spm))
+        if mismatch:
+            raise SystemExit(f"Mismatch on case {case} in {mismatch}: {lengths} x {spm}\n{data.dict()}")
+    print(f"{args.cases} randomized maps identical")
+
+    sample = time_input(**SAMPLE)
+    lengths, spm = (1.0, 120.0, args.grid), (1.0, 200.0, args.grid)
+    length_axis, spm_axis = axis(*lengths), axis(*spm)
+    reference_ms = min(timeit.repeat(lambda: reference_map(sample, length_axis, spm_axis), number=1, repeat=3)) * 1e3
+    batched_ms = min(timeit.repeat(lambda: time_table.calculate_feasibility_map(sample, lengths, spm), number=1, repeat=5)) * 1e3
+    print(f"{args.grid} x {args.grid} map (best of several):")
+    print(f"    scalar double loop  {reference_ms:8.1f} ms")
+    print(f"    NumPy grid          {batched_ms:8.1f} ms   {reference_ms / batched_ms:5.1f}x")
+
+if __name__ == "__main__":
+    main()
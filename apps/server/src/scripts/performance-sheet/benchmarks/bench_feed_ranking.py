@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Feed model ranking benchmark.
+
+Checks rank_feed_models in services/feed_selection.py against the serial path it
+replaces: run_sigma_five_calculation once per model of every spec table, then a
+sort on the same margins. The sample sheet is varied at random (material,
+widths, acceleration, feed angles, loop pit, chart settings), and every
+torque, match ratio and check must agree with the per-model calculation, as must
+which models fail and the resulting order. The benchmark then times ranking one
+sheet both ways.
+
+Usage:
+    python benchmarks/bench_feed_ranking.py [--cases 200] [--iterations 20] [--seed 1]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from main import extract_inputs, select_feed, unwrap_payload  # noqa: E402
+from services.feed_calculations import run_sigma_five_calculation  # noqa: E402
+from services.feed_selection import rank_feed_models  # noqa: E402
+from utils.lookup_tables import FEED_SPEC_TYPES, list_feed_models  # noqa: E402
+
+SHEET = os.path.join(_ROOT, "calculations", "25-00245.json")
+COMPARED = ("match", "peak_torque", "acceleration_torque", "rms_torque_fa1", "rms_torque_fa2")
+MATERIALS = ["COLD ROLLED STEEL", "ALUMINUM", "STAINLESS STEEL", "HOT ROLLED STEEL"]
+
+
+def serial_ranking(data):
+    """The per-model path: one full feed calculation per model, ranked by the tightest margin."""
+    models, failed = [], set()
+    for spec_type in FEED_SPEC_TYPES:
+        for feed_model in list_feed_models(spec_type):
+            try:
+                result = run_sigma_five_calculation(data.copy(update={"feed_model": feed_model}), spec_type)
+            except Exception:
+                failed.add((spec_type, feed_model))
+                continue
+            if result["feed_check"] == "ERROR":
+                failed.add((spec_type, feed_model))
+                continue
+            peak, rms = result["motor_peak_torque"], result["motor_rms_torque"]
+            margin = min(
+                (peak - result["peak_torque"]) / peak,
+                (rms - max(result["rms_torque_fa1"], result["rms_torque_fa2"])) / rms,
+                (peak - result["acceleration_torque"]) / peak,
+            )
+            if not math.isfinite(margin):
+                failed.add((spec_type, feed_model))
+                continue
+            models.append(dict(result, feed_type=spec_type, feed_model=feed_model, margin=margin))
+    models.sort(key=lambda entry: (entry["feed_check"] != "OK", -entry["margin"]))
+    return models, failed
+
+
+def close(a, b):
+    return a == b or math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def compare(data):
+    serial, serial_failed = serial_ranking(data)
+    batched = rank_feed_models(data)
+    batched_failed = {(entry["feed_type"], entry["feed_model"]) for entry in batched["errors"]}
+    if serial_failed != batched_failed:
+        return f"failed models differ: {sorted(serial_failed ^ batched_failed)}"
+    if [(e["feed_type"], e["feed_model"]) for e in serial] != [(e["feed_type"], e["feed_model"]) for e in batched["models"]]:
+        # Ties on margin can order differently only if the margins themselves differ
+        if [e["margin"] for e in serial] != [e["margin"] for e in batched["models"]]:
+            return "ranking differs"
+    by_model = {(e["feed_type"], e["feed_model"]): e for e in batched["models"]}
+    for entry in serial:
+        other = by_model[(entry["feed_type"], entry["feed_model"])]
+        for key in COMPARED + ("margin",):
+            if not close(entry[key], other[key]):
+                return f"{entry['feed_type']} {entry['feed_model']} {key}: {entry[key]} != {other[key]}"
+        for key in ("feed_check", "match_check"):
+            if entry[key] != other[key]:
+                return f"{entry['feed_type']} {entry['feed_model']} {key}: {entry[key]!r} != {other[key]!r}"
+    return None
+
+
+def random_sheet(rng, base):
+    data = base.copy()
+    updates = {}
+    if rng.random() < 0.5:
+        updates["material_type"] = rng.choice(MATERIALS)
+    for key in ("material_width", "material_thickness", "acceleration_rate", "friction_in_die", "press_bed_length"):
+        if rng.random() < 0.5:
+            updates[key] = getattr(base, key) * rng.uniform(0.2, 3)
+    for key in ("feed_angle_1", "feed_angle_2"):
+        if rng.random() < 0.3:
+            updates[key] = rng.uniform(90, 300)
+    if rng.random() < 0.2:
+        updates["loop_pit"] = rng.choice(["yes", "no"])
+    if rng.random() < 0.3:
+        updates["chart_rows"] = rng.randint(2, 200)
+    if rng.random() < 0.2:
+        updates["chart_max_length"] = rng.uniform(10, 200)
+    return data.copy(update=updates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the batched feed model ranking")
+    parser.add_argument("--cases", type=int, default=200, help="Randomized sheets to compare")
+    parser.add_argument("--iterations", type=int, default=20, help="Rankings per timing")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the sheets")
+    args = parser.parse_args()
+
+    with open(SHEET, "r") as f:
+        inputs = extract_inputs(unwrap_payload(json.load(f)))
+    base = select_feed(inputs)[1]
+
+    rng = random.Random(args.seed)
+    for case in range(args.cases):
+        data = base if case == 0 else random_sheet(rng, base)
+        mismatch = compare(data)
+        if mismatch:
+            raise SystemExit(f"Mismatch on case {case}: {mismatch}\n{data.dict()}")
+    ranked = rank_feed_models(base)
+    print(f"{args.cases} sheets identical ({len(ranked['models'])} models ranked, "
+          f"{len(ranked['errors'])} not evaluable on the sample sheet)")
+
+    n = args.iterations
+    serial_ms = min(timeit.repeat(lambda: serial_ranking(base), number=n, repeat=5)) / n * 1e3
+    batched_ms = min(timeit.repeat(lambda: rank_feed_models(base), number=n, repeat=5)) / n * 1e3
+    print(f"Rank every model for one sheet (best of 5 x {n}):")
+    print(f"    one calculation per model  {serial_ms:8.2f} ms")
+    print(f"    batched                    {batched_ms:8.2f} ms   {serial_ms / batched_ms:5.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Inverse feed query benchmark.
+
+Checks solve_max_spm and solve_max_length in utils/physics/time.py on randomized
+feeds:
+    - where the feed angle binds, max_spm and rms_torque equal the time table's row
+      at the same length, and where the straightener binds max_spm does;
+    - max_length reaches the SPM and a slightly longer length does not;
+    - when no length is found, a dense scan of lengths finds none either.
+
+It then times one query of each kind against building and scanning a time table.
+
+Usage:
+    python benchmarks/bench_feed_solvers.py [--cases 2000] [--iterations 2000] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from models import time_input  # noqa: E402
+from utils.physics import time as time_table  # noqa: E402
+from bench_time_table import SAMPLE, VARIED  # noqa: E402
+
+SCAN_POINTS = 4000
+
+
+def random_feed(rng):
+    values = dict(SAMPLE)
+    for key in VARIED:
+        if rng.random() < 0.5:
+            values[key] = SAMPLE[key] * rng.uniform(0.2, 5)
+    if rng.random() < 0.2:
+        values["application"] = "Standalone"
+        values["feed_angle_1"] = rng.uniform(0, 2)
+    if rng.random() < 0.2:
+        values["str_max_sp_inch"] = 0.0
+    return time_input(**values)
+
+
+def check_rows(data, rows=24):
+    for row in time_table.calculate_feed_time(data, data.feed_angle_1, rows)[1:]:
+        solved = time_table.solve_max_spm(data, row["length"])
+        # The table keeps the natural cycle's RMS torque under the straightener cap; the solver
+        # reports it at the capped cycle
+        if solved["binding"] == "straightener":
+            matches = solved["max_spm"] == row["strokes_per_minute"]
+        else:
+            matches = solved["binding"] != "feed_angle" or (solved["max_spm"], solved["rms_torque"]) == (row["strokes_per_minute"], row["rms_torque"])
+        if not matches:
+            raise SystemExit(f"Row mismatch at length {row['length']}: {solved} vs {row} for {data.dict()}")
+
+
+def check_length(data, spm):
+    solved = time_table.solve_max_length(data, spm)
+    length = solved["max_length"]
+    if length is not None:
+        if solved["max_spm"] < spm or time_table.solve_max_spm(data, length * (1 + 1e-6))["max_spm"] >= spm:
+            raise SystemExit(f"max_length {length} is not the longest length at {spm} SPM for {data.dict()}")
+        return True
+    # Scan up to the time it takes to index anything at all at this SPM
+    top = 12 * data.velocity * (60 / spm) + 12 * data.acceleration * (60 / spm) ** 2
+    for i in range(1, SCAN_POINTS + 1):
+        if time_table.solve_max_spm(data, top * (i / SCAN_POINTS) ** 2)["max_spm"] >= spm:
+            raise SystemExit(f"No max_length found at {spm} SPM but length {top * (i / SCAN_POINTS) ** 2} reaches it")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the inverse feed queries")
+    parser.add_argument("--cases", type=int, default=2000, help="Randomized feeds to check")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per timing")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the feeds")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    found = 0
+    for _ in range(args.cases):
+        data = random_feed(rng)
+        check_rows(data)
+        found += check_length(data, rng.uniform(1, 200))
+    print(f"{args.cases} randomized feeds checked ({found} SPM targets reachable)")
+
+    data = time_input(**SAMPLE)
+    n = args.iterations
+    os.environ["PERFORMANCE_SHEET_TIME_ENGINE"] = "numpy"
+
+    def scan_spm():
+        table = time_table.calculate_time(data)["feed_angle_1"]
+        return next(row["strokes_per_minute"] for row in table if row["length"] >= 24.0)
+
+    def scan_length(rows=500):
+        table = time_table.calculate_time(data, rows=rows, columnar=True)["feed_angle_1"]
+        return max(length for length, spm in zip(table["length"][1:], table["strokes_per_minute"][1:]) if spm >= 60)
+
+    cases = [
+        ("max SPM at 24 in", scan_spm, lambda: time_table.solve_max_spm(data, 24.0), "24-row table"),
+        ("max length at 60 SPM", scan_length, lambda: time_table.solve_max_length(data, 60), "500-row table"),
+        ("max length, bisection", scan_length, lambda: time_table.solve_max_length(data, 100), "500-row table"),
+    ]
+    print(f"\nPer query (best of 5 x {n}):")
+    for label, scan, solve, table in cases:
+        scan_us = min(timeit.repeat(scan, number=n, repeat=5)) / n * 1e6
+        solve_us = min(timeit.repeat(solve, number=n, repeat=5)) / n * 1e6
+        print(f"    {label:24s} {table} scan {scan_us:8.1f} us   solver {solve_us:7.1f} us   {scan_us / solve_us:6.1f}x")
+
+if __name__ == "__main__":
+    main()
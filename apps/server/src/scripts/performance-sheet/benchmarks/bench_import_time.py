@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Cold-start import report.
+
+Runs the process-per-request entry points under `python -X importtime` and
+reports the import cost of each one: the total, the most expensive modules,
+and which feed/shear calculators and model configs were actually loaded.
+
+Usage:
+    python benchmarks/bench_import_time.py [--sheet calculations/25-00245.json] [--runs 5] [--top 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that should only be imported when a sheet selects them
+LAZY_MODULES = [
+    "calculations.feeds.sigma_five_feed",
+    "calculations.feeds.sigma_five_feed_with_pt",
+    "calculations.feeds.allen_bradley_mpl_feed",
+    "calculations.shears.single_rake_hyd_shear",
+    "calculations.shears.bow_tie_hyd_shear",
+    "services.feed_calculations",
+    "utils.physics.inertia",
+]
+
+
+def parse_importtime(stderr: str):
+    """Parse -X importtime output into [(module, self_us, cumulative_us)] plus the lazy modules that were loaded."""
+    rows = []
+    loaded = []
+    for line in stderr.splitlines():
+        if line.startswith("LAZY_LOADED "):
+            loaded = [name for name in line[len("LAZY_LOADED "):].split(",") if name]
+            continue
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line.split(":", 1)[1].split("|")]
+        rows.append((name, int(self_us), int(cumulative_us)))
+    return rows, loaded
+
+
+def run_importtime(code, stdin_data=None):
+    """
+    Run a snippet under `python -X importtime` once.
+
+    importlib.import_module() does not show up in -X importtime, so the snippet
+    also reports which LAZY_MODULES ended up in sys.modules.
+
+    Returns:
+        tuple: (wall seconds, import rows, lazy modules loaded)
+    """
+    script = (
+        "import sys\n"
+        "try:\n"
+        + "".join(f"    {line}\n" for line in code.splitlines())
+        + "finally:\n"
+        f"    sys.stderr.write('LAZY_LOADED ' + ','.join(m for m in {LAZY_MODULES!r} if m in sys.modules) + '\\n')\n"
+    )
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        input=stdin_data, capture_output=True, text=True, cwd=_ROOT,
+    )
+    elapsed = time.perf_counter() - start
+    rows, loaded = parse_importtime(proc.stderr)
+    return elapsed, rows, loaded
+
+
+def sheet_variants(sheet):
+    """The sample sheet with no feed/shear, with a sigma five feed, and with a feed and a shear."""
+    no_feed = json.loads(json.dumps(sheet))
+    no_feed.setdefault("common", {}).setdefault("equipment", {}).setdefault("feed", {})["type"] = "none"
+    no_feed.setdefault("shear", {}).setdefault("shear", {})["model"] = ""
+
+    feed_only = json.loads(json.dumps(sheet))
+    feed_only.setdefault("shear", {}).setdefault("shear", {})["model"] = ""
+
+    with_shear = json.loads(json.dumps(sheet))
+    with_shear.setdefault("shear", {}).setdefault("shear", {})["model"] = "single_rake"
+
+    return {"no feed, no shear": no_feed, "sheet feed, no shear": feed_only, "sheet feed + shear": with_shear}
+
+
+def report(label, runs, top):
+    walls = [wall for wall, _, _ in runs]
+    _, rows, loaded = runs[-1]
+    total = sum(self_us for _, self_us, _ in rows)
+
+    print(f"\n== {label} ==")
+    print(f"wall (median of {len(walls)}): {statistics.median(walls) * 1000:8.1f} ms")
+    print(f"imports (self total):      {total / 1000:8.1f} ms, {len(rows)} modules")
+    print("lazy modules loaded:       " + (", ".join(loaded) or "none"))
+    print(f"top {top} by cumulative time:")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:top]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report cold-start import cost of main.py and autofill.py")
+    parser.add_argument("--sheet", default=os.path.join(_ROOT, "calculations", "25-00245.json"), help="Sample sheet JSON")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per scenario (median wall time is reported)")
+    parser.add_argument("--top", type=int, default=10, help="Modules to list per scenario")
+    args = parser.parse_args()
+
+    with open(args.sheet, "r") as f:
+        sheet = json.load(f)
+
+    report("import main", [run_importtime("import main") for _ in range(args.runs)], args.top)
+    report("import autofill", [run_importtime("import autofill") for _ in range(args.runs)], args.top)
+
+    # Same path as `python main.py < sheet.json`
+    one_shot = "import runpy\nsys.argv = ['main.py']\nrunpy.run_path('main.py', run_name='__main__')"
+    for label, variant in sheet_variants(sheet).items():
+        payload = json.dumps(variant)
+        runs = [run_importtime(one_shot, payload) for _ in range(args.runs)]
+        report(f"main.py one-shot: {label}", runs, args.top)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Reflected inertia benchmark.
+
+Checks the compiled inertia coefficients in utils/physics/inertia.py against the
+element walk, to within 1e-12 relative, for every model in all three feed model configs. Each model runs
+with every roll width class, the model name as configured and in lower case,
+several widths and gear ratios, and the inputs the walk rejects (negative
+width, zero ratio). The coefficients sum the elements in a different order than
+the walk, so floats can differ in the last bits; the worst relative difference
+is reported. The benchmark then times both paths per call.
+
+Usage:
+    python benchmarks/bench_inertia.py [--iterations 20000]
+"""
+
+import argparse
+import math
+import os
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from models import inertia_input  # noqa: E402
+from utils.physics import inertia  # noqa: E402
+
+ROLL_WIDTHS = ["Yes", "No", ""]
+WIDTHS = [0, 1, 6, 24, 60, 120, -1]
+RATIOS = [0.5, 1.0, 4.8, 20.0, 0.0]
+
+
+def sample(feed_model, roll_width, width, ratio):
+    return inertia_input(
+        feed_model=feed_model, width=width, thickness=0.25, density=0.283, press_bed_length=48,
+        material_loop=12, ratio=ratio, efficiency=1.0, roll_width=roll_width, material_width=12,
+    )
+
+
+def same(compiled, walked):
+    if isinstance(compiled, float) and isinstance(walked, float):
+        return math.isclose(compiled, walked, rel_tol=1e-12, abs_tol=1e-15)
+    return compiled == walked
+
+def relative_difference(compiled, walked):
+    if isinstance(compiled, float) and isinstance(walked, float) and walked:
+        return abs(compiled - walked) / abs(walked)
+    return 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the compiled inertia coefficients")
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per timing")
+    args = parser.parse_args()
+
+    checked = walked_models = 0
+    worst = 0.0
+    for config_name in inertia.MODEL_CONFIG_FILES:
+        coefficients = inertia.get_table(inertia.COEFFICIENT_TABLES[config_name])
+        for model_key in inertia.get_model_config(config_name):
+            walked_models += coefficients[model_key] is None
+            for feed_model in (model_key, model_key.lower()):
+                for roll_width in ROLL_WIDTHS:
+                    for width in WIDTHS:
+                        for ratio in RATIOS:
+                            data = sample(feed_model, roll_width, width, ratio)
+                            compiled = inertia.calculate_total_refl_inertia(data)
+                            walked = inertia.walk_total_refl_inertia(data)
+                            if not same(compiled, walked):
+                                raise SystemExit(f"{config_name} {feed_model!r} roll width {roll_width!r} width {width} "
+                                                 f"ratio {ratio}: compiled {compiled} vs walk {walked}")
+                            worst = max(worst, relative_difference(compiled, walked))
+                            checked += 1
+    print(f"{checked} inputs match the element walk within 1e-12 relative "
+          f"(worst {worst:.1e}; {walked_models} models left to the walk)")
+
+    n = args.iterations
+    print(f"\nPer call (best of 5 x {n}):")
+    for feed_model in ("CPRF-S1", "CPRF-S5", "CPRF-S7", "300_AB_MPL"):
+        data = sample(feed_model, "No", 24, 4.8)
+        walk_us = min(timeit.repeat(lambda: inertia.walk_total_refl_inertia(data), number=n, repeat=5)) / n * 1e6
+        compiled_us = min(timeit.repeat(lambda: inertia.calculate_total_refl_inertia(data), number=n, repeat=5)) / n * 1e6
+        print(f"    {feed_model:14s} walk {walk_us:7.2f} us   coefficients {compiled_us:6.2f} us   {walk_us / compiled_us:5.1f}x")
+
+if __name__ == "__main__":
+    main()
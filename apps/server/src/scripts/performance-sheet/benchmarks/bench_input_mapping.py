@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Input mapping microbenchmark.
+
+Compares building every calculator input for one sheet the old way (one
+parse_*_with_default call per field, each walking the sheet from the root)
+against the compiled INPUT_SPEC extractor (one walk, one conversion per
+distinct path/type/default).
+
+Usage:
+    python benchmarks/bench_input_mapping.py [--sheet calculations/25-00245.json] [--iterations 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from main import unwrap_payload  # noqa: E402
+from utils.input_mapping import INPUT_SPEC, compile_spec, parse_float, parse_int, str2bool  # noqa: E402
+from utils.shared import DEFAULTS  # noqa: E402
+
+
+# --- Per-field path (what main.py did before the spec) ---
+def get_nested(d, keys, default=None):
+    for k in keys:
+        if isinstance(d, dict) and k in d:
+            d = d[k]
+        else:
+            return default
+    return d
+
+def parse_float_with_default(data, keys, default_category, default_key):
+    """Parse float with fallback to centralized default"""
+    value = get_nested(data, keys)
+    parsed = parse_float(value)
+    if parsed is None:
+        return DEFAULTS[default_category][default_key]
+    return parsed
+
+def parse_int_with_default(data, keys, default_category, default_key):
+    """Parse int with fallback to centralized default"""
+    value = get_nested(data, keys)
+    parsed = parse_int(value)
+    if parsed is None:
+        return DEFAULTS[default_category][default_key]
+    return parsed
+
+def parse_str_with_default(data, keys, default_category, default_key):
+    """Parse string with fallback to centralized default"""
+    value = get_nested(data, keys)
+    if value is None:
+        return DEFAULTS[default_category][default_key]
+    return str(value)
+
+def parse_boolean_with_default(data, keys, default_category, default_key):
+    """Parse boolean with fallback to centralized default"""
+    value = get_nested(data, keys)
+    if value is None:
+        return DEFAULTS[default_category][default_key]
+    return bool(value)
+
+def legacy_field(data, f):
+    keys = list(f.path)
+    if f.kind == "float":
+        return parse_float_with_default(data, keys, f.default_category, f.default_key)
+    if f.kind == "int":
+        return parse_int_with_default(data, keys, f.default_category, f.default_key)
+    if f.kind == "str":
+        return parse_str_with_default(data, keys, f.default_category, f.default_key)
+    if f.kind == "bool":
+        return parse_boolean_with_default(data, keys, f.default_category, f.default_key)
+    if f.kind == "upper_str":
+        return (get_nested(data, keys) or DEFAULTS[f.default_category][f.default_key]).upper()
+    if f.kind == "bool_flag":
+        return str2bool(get_nested(data, keys)) or DEFAULTS[f.default_category][f.default_key]
+    if f.kind == "lower_str":
+        return get_nested(data, keys, "").lower()
+    return get_nested(data, keys)
+
+def legacy_group(data, group):
+    return {name: legacy_field(data, f) for name, f in INPUT_SPEC[group].items()}
+
+def legacy_extract(data):
+    """Resolve the groups one calculation reads, field by field, the way the section code used to."""
+    groups = {}
+    for group in ("rfq_average", "rfq_min", "rfq_max", "material_specs", "reel_drive", "tddbhd_reel"):
+        groups[group] = legacy_group(data, group)
+    if groups["tddbhd_reel"]["reel_model"] != "CPR-040":
+        groups["tddbhd_threading"] = legacy_group(data, "tddbhd_threading")
+    for group in ("tddbhd", "str_utility_coil", "str_utility", "roll_str_backbend", "feed_select"):
+        groups[group] = legacy_group(data, group)
+
+    selection = groups["feed_select"]
+    if "sigma" in selection["feed_type"] and selection["is_pull_thru"].lower() == "yes":
+        groups["feed_sigma_five_pt"] = legacy_group(data, "feed_sigma_five_pt")
+    elif "sigma" in selection["feed_type"]:
+        groups["feed_sigma_five"] = legacy_group(data, "feed_sigma_five")
+    elif "allen" in selection["feed_type"] or "mpl" in selection["feed_type"]:
+        groups["feed_allen_bradley"] = legacy_group(data, "feed_allen_bradley")
+
+    groups["shear_select"] = legacy_group(data, "shear_select")
+    if groups["shear_select"]["shear_model"] in ("single_rake", "bow_tie"):
+        groups["shear"] = legacy_group(data, "shear")
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-field parsing against the compiled input spec")
+    parser.add_argument("--sheet", default=os.path.join(_ROOT, "calculations", "25-00245.json"), help="Sheet JSON to map")
+    parser.add_argument("--iterations", type=int, default=20000, help="Extractions per measurement")
+    args = parser.parse_args()
+
+    with open(args.sheet, "r") as f:
+        data = unwrap_payload(json.load(f))
+
+    compiled = compile_spec()
+
+    # Both paths must agree before timing means anything
+    extracted = compiled.extract(data)
+    for group, values in legacy_extract(data).items():
+        if extracted.group(group) != values:
+            raise SystemExit(f"Mismatch in group {group}")
+
+    compile_time = timeit.timeit(compile_spec, number=100) / 100
+    legacy = min(timeit.repeat(lambda: legacy_extract(data), number=args.iterations, repeat=5)) / args.iterations
+    spec = min(timeit.repeat(lambda: compiled.extract(data), number=args.iterations, repeat=5)) / args.iterations
+
+    fields = sum(len(fields) for fields in INPUT_SPEC.values())
+    print(f"Sheet: {os.path.relpath(args.sheet, _ROOT)}")
+    print(f"Spec: {len(INPUT_SPEC)} groups, {fields} fields, {compiled._slot_count} distinct paths")
+    print(f"Compile (once per process): {compile_time * 1e6:8.1f} us")
+    print(f"Per-field parse_* calls:    {legacy * 1e6:8.1f} us per sheet")
+    print(f"Compiled extractor:         {spec * 1e6:8.1f} us per sheet (all groups)")
+    print(f"Speed-up:                   {legacy / spec:8.2f}x")
+
+if __name__ == "__main__":
+    main()
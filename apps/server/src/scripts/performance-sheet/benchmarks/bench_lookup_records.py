@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Lookup record benchmark.
+
+Compares the typed lookup records in utils/lookup_tables.py against the plain
+dict path they replaced (upper-case the key, nested dict lookup, try/except on
+every call): memory held by each representation of the per-model tables, and
+per-call latency of the accessors the calculators use. The pull-thru service
+(run_sigma_five_pt_calculation) is run for every pull-thru model, and its
+straightener torque is checked against the same formula on the dict path.
+
+Usage:
+    python benchmarks/bench_lookup_records.py [--iterations 100000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from main import extract_inputs, unwrap_payload  # noqa: E402
+from models import feed_w_pull_thru_input  # noqa: E402
+from utils import lookup_tables  # noqa: E402
+from services.feed_calculations import SPEC_KEYS_SIGMA_FIVE, get_all_specs_for, run_sigma_five_pt_calculation  # noqa: E402
+
+SHEET = os.path.join(_ROOT, "calculations", "25-00245.json")
+
+TABLES = [
+    "lookup_material", "lookup_reel_dimensions", "lookup_str_model",
+    "lookup_sigma5_feed", "lookup_sigma5_feed_pt", "lookup_ab_feed", "lookup_holddown_matrix",
+]
+
+
+# The current table version's raw dicts, bound once so the dict path pays no registry lookup
+RAW = lookup_tables._tables()
+
+
+# --- Dict path (what the accessors did before the records) ---
+def legacy_material_density(material):
+    try:
+        return RAW.lookup_material[material.upper()]["density"]
+    except KeyError:
+        raise ValueError(f"Unknown material: {material}")
+
+def legacy_str_model_value(model, field, label=None):
+    try:
+        return RAW.lookup_str_model[model.upper()][field]
+    except KeyError:
+        raise ValueError(f"Unknown model or missing field: {label or field} for model '{model}'")
+
+def legacy_sigma_five_specs(feed_model, field, label=None):
+    try:
+        return RAW.lookup_sigma5_feed[feed_model.upper()][field]
+    except KeyError:
+        raise ValueError(f"Unknown model or missing field: {label or feed_model} for model '{feed_model}'")
+
+def legacy_all_specs_for(feed_model, spec_keys):
+    results = {}
+    for var_name, (lookup1, lookup2) in spec_keys.items():
+        try:
+            results[var_name] = legacy_sigma_five_specs(feed_model, lookup1, lookup2)
+        except ValueError:
+            if lookup1 == "fric_torque" or lookup2 == "friction_torque":
+                results[var_name] = 0
+            else:
+                raise
+    return results
+
+def legacy_straightener_torque(data):
+    """Straightener torque of run_sigma_five_pt_calculation, from the pull-thru dicts."""
+    row = RAW.lookup_sigma5_feed_pt[data.feed_model.upper()]
+    k_const = {5: data.straightening_rolls / 3.5 + 0.1, 7: data.straightening_rolls / 3.5,
+               9: data.straightening_rolls / 3.5 - 0.1}.get(data.straightening_rolls, 3)
+    return ((0.667 * data.yield_strength * data.material_width * (data.material_thickness ** 2) / row["cent_dist"])
+            * k_const * row["u_roll"] * 0.125 / row["ratio"] / row["efficiency"])
+
+def check_pull_thru():
+    """Run the pull-thru service for every pull-thru model; returns (models matching, errors by message)."""
+    with open(SHEET, "r") as f:
+        group = extract_inputs(unwrap_payload(json.load(f))).group("feed_sigma_five_pt")
+    matched, errors = 0, {}
+    for model in RAW.lookup_sigma5_feed_pt:
+        data = feed_w_pull_thru_input(feed_type="sigma_five", feed_model=model, **group)
+        try:
+            result = run_sigma_five_pt_calculation(data)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            # Models whose own calculation fails (the inertia lookup of several pull-thru rows)
+            errors[str(e)] = errors.get(str(e), 0) + 1
+            continue
+        if result["straightner_torque"] != legacy_straightener_torque(data):
+            raise SystemExit(f"Pull-thru straightener torque differs for {model}")
+        matched += 1
+    if not matched:
+        raise SystemExit(f"No pull-thru model could be calculated: {errors}")
+    return matched, errors
+
+def legacy_holddown_entry(key):
+    entry = next((entry for entry in RAW.lookup_holddown_matrix if entry["key"] == key), None)
+    if entry is None:
+        raise ValueError(f"Holddown matrix key {key} not found")
+    return entry
+
+
+def traced_size(build):
+    """Bytes still allocated by the object build() returns."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return size
+
+def build_dict_tables():
+    with open(lookup_tables._JSON_FILE, "r") as f:
+        data = json.load(f)
+    return {name: data[name] for name in TABLES}
+
+def build_record_tables():
+    tables = build_dict_tables()
+    records = {
+        name: lookup_tables._compile_table(schema, tables[schema.table])[0]
+        for name, schema in lookup_tables.TABLE_SCHEMAS.items()
+    }
+    records.update({
+        "holddown": {
+            row["key"]: lookup_tables._make_record(lookup_tables.HolddownEntry, row, lookup_tables._HOLDDOWN_COLUMNS)
+            for row in tables["lookup_holddown_matrix"]
+        },
+    })
+    del tables
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark typed lookup records against the dict path")
+    parser.add_argument("--iterations", type=int, default=100000, help="Calls per measurement")
+    args = parser.parse_args()
+    n = args.iterations
+
+    # Both paths must agree before timing means anything
+    if legacy_all_specs_for("CPRF-S3", SPEC_KEYS_SIGMA_FIVE) != get_all_specs_for("sigma_five", "CPRF-S3", SPEC_KEYS_SIGMA_FIVE):
+        raise SystemExit("Feed specs differ")
+    last_key = RAW.lookup_holddown_matrix[-1]["key"]
+    if legacy_holddown_entry(last_key)["MinWidth"] != lookup_tables.get_holddown_matrix_entry(last_key).min_width:
+        raise SystemExit("Holddown entries differ")
+    matched, errors = check_pull_thru()
+    print(f"Pull-thru: {matched} models match the dict path" + "".join(f"; {count} fail with {error!r}" for error, count in errors.items()))
+
+    dict_bytes = traced_size(build_dict_tables)
+    record_bytes = traced_size(build_record_tables)
+    print("Memory (per-model tables, tracemalloc):")
+    print(f"    dicts from JSON:  {dict_bytes / 1024:8.1f} KiB")
+    print(f"    typed records:    {record_bytes / 1024:8.1f} KiB  (both cases indexed)")
+
+    cases = [
+        ("material density", lambda: legacy_material_density("cold rolled steel"),
+         lambda: lookup_tables.get_material_density("cold rolled steel")),
+        ("str model, 11 fields", lambda: [legacy_str_model_value("CPPS-250", f) for f in lookup_tables.StrModel._fields[:11]],
+         lambda: lookup_tables.get_str_model("CPPS-250")[:11]),
+        ("feed spec set (12 keys)", lambda: legacy_all_specs_for("CPRF-S3", SPEC_KEYS_SIGMA_FIVE),
+         lambda: get_all_specs_for("sigma_five", "CPRF-S3", SPEC_KEYS_SIGMA_FIVE)),
+        ("holddown entry (last row)", lambda: legacy_holddown_entry(last_key),
+         lambda: lookup_tables.get_holddown_matrix_entry(last_key)),
+    ]
+    print(f"\nPer-call latency (best of 5 x {n}):")
+    for label, legacy, records in cases:
+        legacy_us = min(timeit.repeat(legacy, number=n, repeat=5)) / n * 1e6
+        record_us = min(timeit.repeat(records, number=n, repeat=5)) / n * 1e6
+        print(f"    {label:28s} dict {legacy_us:7.3f} us   records {record_us:7.3f} us   {legacy_us / record_us:5.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Feed time table benchmark.
+
+Checks the vectorized time table in utils/physics/time.py against the scalar
+reference (calculate_feed_time per feed angle) on randomized inputs. The inputs
+include zero, negative and non-finite values, and a quarter of the cases use a
+random row count and columnar output. Every value must match exactly, including
+which values are ints. The benchmark then times calculate_time with each engine
+at the default 24 rows and at chart resolution, as rows and as columns.
+
+Usage:
+    python benchmarks/bench_time_table.py [--cases 5000] [--iterations 2000] [--rows 500] [--seed 1]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from models import time_input  # noqa: E402
+from utils.physics import time as time_table  # noqa: E402
+
+# The sample sheet's feed (calculations/25-00245.json) as calculate_time sees it
+SAMPLE = {
+    "acceleration": 40.0, "application": "Press Feed", "feed_angle_1": 180.0, "feed_angle_2": 240.0,
+    "frictional_torque": 25.425, "increment": 4.0, "loop_torque": 62.51278506791566, "match": 2.112583426495788,
+    "min_length": 4.0, "motor_inertia": 0.21535, "motor_rms_torque": 620.0, "motor_peak_torque": 1406.0,
+    "ratio": 4.8, "efficiency": 1.0, "refl_inertia": 0.45494484089586795, "rpm": 1500.0,
+    "settle_time": 0.035, "settle_torque": 20.0, "str_max_sp": 200.0, "str_max_sp_inch": 2400.0,
+    "velocity": 6.81769239060285, "width": 18.0, "material_width": 12.0, "material_thickness": 0.25,
+    "press_bed_length": 48.0, "density": 0.283, "material_loop": 282.7433388230814,
+}
+
+VARIED = [
+    "acceleration", "velocity", "min_length", "increment", "feed_angle_1", "feed_angle_2", "str_max_sp_inch",
+    "motor_peak_torque", "refl_inertia", "efficiency", "settle_time", "loop_torque", "frictional_torque",
+    "settle_torque", "motor_inertia", "rpm",
+]
+SPECIAL_VALUES = [0.0, -0.0, -1.0, 1e-300, 1e300, float("inf"), float("nan")]
+
+
+def run_engine(engine, data, rows, columnar):
+    os.environ["PERFORMANCE_SHEET_TIME_ENGINE"] = engine
+    return time_table.calculate_time(data, rows=rows, columnar=columnar)
+
+
+def fingerprint(result):
+    """JSON text plus the type of every value, so 0 and 0.0 do not compare equal."""
+    types = {}
+    for key, table in result.items():
+        if isinstance(table, list):
+            types[key] = [[type(v).__name__ for v in row.values()] for row in table]
+        elif isinstance(table, dict):
+            types[key] = {field: [type(v).__name__ for v in column] for field, column in table.items()}
+    return json.dumps(result, sort_keys=True), types
+
+
+def random_input(rng):
+    values = dict(SAMPLE)
+    for key in VARIED:
+        roll = rng.random()
+        if roll < 0.03:
+            values[key] = rng.choice(SPECIAL_VALUES)
+        elif roll < 0.5:
+            values[key] = SAMPLE[key] * rng.uniform(0.01, 10)
+    if rng.random() < 0.1:
+        values["application"] = rng.choice(["Standalone", "press FEED", ""])
+    return time_input(**values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the vectorized feed time table")
+    parser.add_argument("--cases", type=int, default=5000, help="Randomized inputs to compare")
+    parser.add_argument("--iterations", type=int, default=2000, help="calculate_time calls per timing")
+    parser.add_argument("--rows", type=int, default=500, help="Rows per table for the chart resolution timing")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the inputs")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    errors = 0
+    for case in range(args.cases):
+        data = random_input(rng)
+        rows, columnar = time_table.TIME_TABLE_ROWS, False
+        if rng.random() < 0.25:
+            rows, columnar = rng.randint(2, 600), rng.random() < 0.5
+        reference = run_engine("python", data, rows, columnar)
+        if "error" in reference:
+            errors += 1
+        if fingerprint(reference) != fingerprint(run_engine("numpy", data, rows, columnar)):
+            raise SystemExit(f"Mismatch on case {case} ({rows} rows, columnar={columnar}): {data.dict()}")
+    print(f"{args.cases} randomized inputs identical ({errors} ending in a time calculation error)")
+
+    sample = time_input(**SAMPLE)
+    for rows in (time_table.TIME_TABLE_ROWS, args.rows):
+        # Fewer calls at chart resolution so each timing takes about as long
+        n = max(1, args.iterations * time_table.TIME_TABLE_ROWS // rows)
+        print(f"calculate_time, 2 feed angles x {rows} rows (best of 5 x {n}):")
+        for columnar in (False, True):
+            timings = {"python": [], "numpy": []}
+            for _ in range(5):
+                for engine in timings:
+                    os.environ["PERFORMANCE_SHEET_TIME_ENGINE"] = engine
+                    timings[engine].append(timeit.timeit(
+                        lambda: time_table.calculate_time(sample, rows=rows, columnar=columnar), number=n) / n * 1e6)
+            python_us, numpy_us = min(timings["python"]), min(timings["numpy"])
+            layout = "columns" if columnar else "rows"
+            print(f"    {layout:7s}  scalar reference  {python_us:9.1f} us")
+            print(f"    {layout:7s}  NumPy             {numpy_us:9.1f} us   {python_us / numpy_us:5.2f}x")
+
+if __name__ == "__main__":
+    main()
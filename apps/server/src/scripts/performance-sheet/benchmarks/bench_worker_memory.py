@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Worker pool memory benchmark.
+
+Starts worker_pool.py with 1, 4 and 16 workers. Each pool is driven with calculate and autofill
+requests for several feed models until every worker has touched the tables.
+The benchmark then reads /proc/<pid>/smaps_rollup for the dispatcher and every
+worker. Rss counts shared pages once per process. Pss splits them between the
+processes that share them, so the Pss total is the pool's real footprint.
+
+There is no shared-table mode to compare against. The tables are shared only as
+the forked pages in worker_pool.py are; with 16 workers each one still holds
+about 6 MiB of private pages.
+
+Linux only.
+
+Usage:
+    python benchmarks/bench_worker_memory.py [--workers 1 4 16] [--sheet calculations/25-00245.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FEED_MODELS = ["CPRF-S1", "CPRF-S3", "CPRF-S5", "CPRF-S7"]
+FIELDS = ("Rss", "Pss", "Private_Clean", "Private_Dirty")
+
+
+def smaps_rollup(pid):
+    """{field: KiB} from /proc/<pid>/smaps_rollup."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+        for line in f:
+            parts = line.split()
+            if parts and parts[0].rstrip(":") in FIELDS:
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return values
+
+
+def child_pids(pid):
+    with open(f"/proc/{pid}/task/{pid}/children", "r") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def requests_for(sheet, count):
+    """count NDJSON request lines cycling through feed models and both entry points."""
+    lines = []
+    for i in range(count):
+        data = json.loads(json.dumps(sheet))
+        data["common"]["equipment"]["feed"]["model"] = FEED_MODELS[i % len(FEED_MODELS)]
+        entry = "autofill" if i % 2 else "calculate"
+        lines.append(json.dumps({"id": str(i), "entry": entry, "data": data}) + "\n")
+    return lines
+
+
+def measure(workers, sheet):
+    """Run one pool, returning (dispatcher stats, [worker stats])."""
+    env = dict(os.environ, PERFORMANCE_SHEET_TABLE_POLL="0")
+    proc = subprocess.Popen(
+        [sys.executable, "worker_pool.py", "--workers", str(workers)],
+        cwd=_ROOT, env=env, text=True,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    try:
+        lines = requests_for(sheet, workers * 8)
+
+        # Feed stdin from a thread so neither pipe fills while the other waits
+        def feed():
+            for line in lines:
+                proc.stdin.write(line)
+            proc.stdin.flush()
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        for _ in lines:
+            if not proc.stdout.readline():
+                raise SystemExit("Worker pool exited early")
+
+        dispatcher = smaps_rollup(proc.pid)
+        worker_stats = [smaps_rollup(pid) for pid in child_pids(proc.pid)]
+        feeder.join()
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=60)
+    return dispatcher, worker_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure worker pool memory")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16], help="Pool sizes to measure")
+    parser.add_argument("--sheet", default=os.path.join(_ROOT, "calculations", "25-00245.json"), help="Sample sheet JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        raise SystemExit("This benchmark needs /proc/<pid>/smaps_rollup (Linux)")
+    with open(args.sheet, "r") as f:
+        sheet = json.load(f)
+
+    print(f"{'workers':>7s} | {'Rss total':>10s} {'Pss total':>10s} | "
+          f"{'Pss/worker':>10s} {'Private/worker':>14s}   (KiB)")
+    for workers in args.workers:
+        dispatcher, worker_stats = measure(workers, sheet)
+        processes = [dispatcher] + worker_stats
+        rss = sum(p["Rss"] for p in processes)
+        pss = sum(p["Pss"] for p in processes)
+        worker_pss = sum(p["Pss"] for p in worker_stats) / len(worker_stats)
+        worker_private = sum(p["Private_Clean"] + p["Private_Dirty"] for p in worker_stats) / len(worker_stats)
+        print(f"{workers:7d} | {rss:10d} {pss:10d} | {worker_pss:10.0f} {worker_private:14.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,14 @@ Material Specifications Calculation Module
 import math
 from models import material_specs_input
 from utils.to_float import to_float
-from utils.lookup_tables import get_material
+from utils.lookup_tables import get_material_record
 
 def get_material_properties(material_type):
-    """Fetch material properties from lookup table."""
+    """Fetch material properties from lookup table, or None for an unknown material."""
     try:
-        return get_material(material_type)
+        return get_material_record(material_type)
     except ValueError:
-        return {}
+        return None
 
 def calculate_min_bend_radius(thickness, yield_strength, modulus):
     """Calculate minimum bend radius."""
@@ -45,8 +45,8 @@ def calculate_variant(data: material_specs_input):
     Calculate material specifications for a single variant.
     """
     mat = get_material_properties(data.material_type)
-    modulus = mat.get("modulus")
-    density = to_float(mat.get("density"))
+    modulus = mat.modulus if mat else None
+    density = to_float(mat.density if mat else None)
     min_bend_radius = calculate_min_bend_radius(
         data.material_thickness, data.yield_strength, modulus
     )
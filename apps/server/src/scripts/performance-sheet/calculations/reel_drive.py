@@ -12,8 +12,8 @@ from utils.shared import (
 )
 
 from utils.lookup_tables import (
-    get_reel_dimensions,
-    get_material,
+    get_reel_dimensions_record,
+    get_material_record,
     get_motor_inertia,
     get_type_of_line,
     get_fpm_buffer
@@ -21,8 +21,8 @@ from utils.lookup_tables import (
 
 def get_lookup_data(data: reel_drive_input):
     """Fetch all lookup table data needed for calculations."""
-    reel = get_reel_dimensions(data.model)
-    material = get_material(data.material_type)
+    reel = get_reel_dimensions_record(data.model)
+    material = get_material_record(data.material_type)
     motor_inertia = get_motor_inertia(str(int(data.motor_hp)) if data.motor_hp != 7.5 else str(data.motor_hp))
     reel_type = get_type_of_line(data.type_of_line)
     fpm_buffer = get_fpm_buffer("DEFAULT")
@@ -30,7 +30,7 @@ def get_lookup_data(data: reel_drive_input):
 
 def calc_mandrel_specs(reel, reel_width, brg_dist, total_ratio):
     """Calculate mandrel (central shaft) specifications."""
-    mandrel_dia = reel["mandrel_dia"]
+    mandrel_dia = reel.mandrel_dia
     mandrel_length = reel_width + 17 + brg_dist
     mandrel_weight = ((mandrel_dia/2)**2) * pi * mandrel_length * 0.283
     mandrel_inertia = mandrel_weight / 32.3 / 2 * ((mandrel_dia/2)**2 / 144) * 12
@@ -127,10 +127,10 @@ def calculate_reeldrive(data: reel_drive_input) -> Dict[str, Any]:
     total_ratio = calc_total_ratio(MOTOR_RPM, mandrel_max_rpm)
     reducer_ratio = calc_reducer_ratio(total_ratio, CHAIN_RATIO)
 
-    reel_size = reel["coil_weight"]
-    brg_dist = reel["bearing_dist"]
-    f_brg_dia = reel["fbearing_dia"]
-    r_brg_dia = reel["rbearing_dia"]
+    reel_size = reel.coil_weight
+    brg_dist = reel.bearing_dist
+    f_brg_dia = reel.fbearing_dia
+    r_brg_dia = reel.rbearing_dia
 
     mandrel_dia, mandrel_length, mandrel_weight, mandrel_inertia, mandrel_refl = calc_mandrel_specs(
         reel, data.reel_width, brg_dist, total_ratio
@@ -139,7 +139,7 @@ def calculate_reeldrive(data: reel_drive_input) -> Dict[str, Any]:
         data.backplate_diameter, total_ratio, mandrel_dia
     )
     coil_density, coil_width, coil_inertia, coil_refl = calc_coil_specs(
-        reel_size, data.coil_od, data.coil_id, material["density"], total_ratio, material["density"]
+        reel_size, data.coil_od, data.coil_id, material.density, total_ratio, material.density
     )
     chain_weight, chain_inertia, chain_refl = calc_chain_specs(CHAIN_SPRKT_OD, CHAIN_SPRKT_THICKNESS, total_ratio)
 
@@ -187,7 +187,7 @@ def calculate_reeldrive(data: reel_drive_input) -> Dict[str, Any]:
         },
         "backplate": {
             "diameter": data.backplate_diameter,
-            "thickness": reel["backplate_thickness"],
+            "thickness": reel.backplate_thickness,
             "weight": backplate_weight,
             "inertia": backplate_inertia,
             "refl_inert": backplate_refl
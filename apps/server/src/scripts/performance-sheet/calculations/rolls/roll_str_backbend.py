@@ -11,18 +11,19 @@ from utils.shared import (
 )
 
 from utils.lookup_tables import (
-    get_str_model_value,
+    get_str_model,
     get_material_modulus,
 )
 
 def get_str_model_lookups(str_model):
+    model = get_str_model(str_model, "str_roll_dia")
     return {
-        "str_roll_dia": float(get_str_model_value(str_model, "roll_diameter", "str_roll_dia")),
-        "center_dist": float(get_str_model_value(str_model, "center_distance", "center_dist")),
-        "jack_force_available": float(get_str_model_value(str_model, "jack_force_avail", "jack_force_available")),
-        "max_roll_depth_without_material": float(get_str_model_value(str_model, "min_roll_depth", "max_roll_depth_without_material")),
-        "top": float(get_str_model_value(str_model, "top", "top")),
-        "bottom": float(get_str_model_value(str_model, "bottom", "bottom")),
+        "str_roll_dia": float(model.roll_diameter),
+        "center_dist": float(model.center_distance),
+        "jack_force_available": float(model.jack_force_avail),
+        "max_roll_depth_without_material": float(model.min_roll_depth),
+        "top": float(model.top),
+        "bottom": float(model.bottom),
     }
 
 def get_material_modulus_lookup(material_type):
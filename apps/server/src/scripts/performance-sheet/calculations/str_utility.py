@@ -11,31 +11,33 @@ from utils.shared import (
 )
 
 from utils.lookup_tables import (
-    get_material_density, get_material_modulus, get_str_model_value, get_motor_inertia
+    get_material_record, get_str_model, get_motor_inertia
 )
 
 def get_horsepower_string(horsepower):
     return "7.5" if horsepower == 7.5 else str(int(horsepower))
 
 def get_str_model_lookups(str_model):
+    model = get_str_model(str_model, "str_roll_dia")
     return {
-        "str_roll_dia": float(get_str_model_value(str_model, "roll_diameter", "str_roll_dia")),
-        "center_dist": float(get_str_model_value(str_model, "center_distance", "center_dist")),
-        "pinch_roll_dia": float(get_str_model_value(str_model, "pinch_roll_dia", "pinch_roll_dia")),
-        "jack_force_available": float(get_str_model_value(str_model, "jack_force_avail", "jack_force_available")),
-        "max_roll_depth": float(get_str_model_value(str_model, "min_roll_depth", "max_roll_depth")),
-        "str_gear_torque": float(get_str_model_value(str_model, "str_gear_torq", "str_gear_torque")),
-        "pinch_roll_teeth": int(get_str_model_value(str_model, "pr_teeth", "pinch_roll_teeth")),
-        "pinch_roll_dp": int(get_str_model_value(str_model, "proll_dp", "pinch_roll_dp")),
-        "str_roll_teeth": int(get_str_model_value(str_model, "sroll_teeth", "str_roll_teeth")),
-        "str_roll_dp": int(get_str_model_value(str_model, "sroll_dp", "str_roll_dp")),
-        "face_width": float(get_str_model_value(str_model, "face_width", "face_width"))
+        "str_roll_dia": float(model.roll_diameter),
+        "center_dist": float(model.center_distance),
+        "pinch_roll_dia": float(model.pinch_roll_dia),
+        "jack_force_available": float(model.jack_force_avail),
+        "max_roll_depth": float(model.min_roll_depth),
+        "str_gear_torque": float(model.str_gear_torq),
+        "pinch_roll_teeth": int(model.pr_teeth),
+        "pinch_roll_dp": int(model.proll_dp),
+        "str_roll_teeth": int(model.sroll_teeth),
+        "str_roll_dp": int(model.sroll_dp),
+        "face_width": float(model.face_width)
     }
 
 def get_material_lookups(material_type, horsepower_string):
+    material = get_material_record(material_type)
     return {
-        "density": get_material_density(material_type),
-        "modulus": get_material_modulus(material_type),
+        "density": material.density,
+        "modulus": material.modulus,
         "motor_inertia": get_motor_inertia(horsepower_string)
     }
 
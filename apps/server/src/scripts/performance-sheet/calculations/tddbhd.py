@@ -8,7 +8,7 @@ from utils.shared import (
 )
 from utils.lookup_tables import (
     get_cylinder_bore, get_hold_down_matrix_label, get_material_density, get_material_modulus, get_reel_max_weight, 
-    get_pressure_psi, get_holddown_force_available, get_min_material_width, get_type_of_line, get_drive_key, get_drive_torque 
+    get_holddown_matrix_entry, get_type_of_line, get_drive_key, get_drive_torque 
 )
 
 # --- Lookup Wrappers ---
@@ -27,14 +27,8 @@ def lookup_cylinder_bore(brake_model):
 def lookup_holddown_matrix_key(reel_model, hold_down_assy, cylinder):
     return get_hold_down_matrix_label(reel_model, hold_down_assy, cylinder)
 
-def lookup_holddown_pressure(matrix_key, air_pressure):
-    return get_pressure_psi(matrix_key, air_pressure)
-
-def lookup_hold_down_force(matrix_key, holddown_pressure):
-    return get_holddown_force_available(matrix_key, holddown_pressure)
-
-def lookup_min_material_width(matrix_key):
-    return get_min_material_width(matrix_key)
+def lookup_holddown_entry(matrix_key):
+    return get_holddown_matrix_entry(matrix_key)
 
 def lookup_reel_type(type_of_line):
     return get_type_of_line(type_of_line)
@@ -168,9 +162,10 @@ def calculate_tbdbhd(data: tddbhd_input):
         modulus = lookup_modulus(data.material_type)
         cylinder_bore = lookup_cylinder_bore(data.brake_model)
         holddown_matrix_key = lookup_holddown_matrix_key(data.reel_model, data.hold_down_assy, data.cylinder)
-        holddown_pressure = lookup_holddown_pressure(holddown_matrix_key, data.air_pressure)
-        hold_down_force_available = lookup_hold_down_force(holddown_matrix_key, holddown_pressure)
-        min_material_width = lookup_min_material_width(holddown_matrix_key)
+        holddown_entry = lookup_holddown_entry(holddown_matrix_key)
+        holddown_pressure = holddown_entry.pressure_psi(data.air_pressure)
+        hold_down_force_available = holddown_entry.force_available(holddown_pressure)
+        min_material_width = holddown_entry.min_width
         reel_type = lookup_reel_type(data.type_of_line)
         # Fix: data.air_clutch is already a string ("Yes"/"No"), not a boolean
         air_clutch = data.air_clutch if data.air_clutch in ["Yes", "No"] else "No"
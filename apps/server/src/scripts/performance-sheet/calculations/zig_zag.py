@@ -4,18 +4,12 @@ Zig Zag Calculation Module
 """
 from models import zig_zag_input
 from math import pi, sqrt, floor, atan
-import json
-import os
 
+from utils.lookup_bundle import load_source
 from utils.physics.time import calculate_feed_time
 
-# Build path to the JSON file in utils
-json_file_path = os.path.join(os.path.dirname(__file__), '..', 'utils', 'zig_zag_lookups.json')
-json_file_path = os.path.abspath(json_file_path)
-
-# Load the JSON data from the file
-with open(json_file_path, 'r') as file:
-    zig_zag_data = json.load(file)
+# Load the JSON data (from the precompiled bundle when it is fresh)
+zig_zag_data = load_source("zig_zag_lookups")
 
 # Separate zig zag data
 zz_42_tooth = zig_zag_data.get("42_tooth", {})
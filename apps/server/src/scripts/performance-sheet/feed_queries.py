@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Performance Sheet Feed Queries
+
+Queries answered for the feed a sheet selects rather than for the whole sheet.
+Each query is one FEED_QUERIES entry naming the service function that answers
+it and the request arguments it takes; main.py --serve, worker_pool.py and
+asgi.py all register their feed entries from that table and answer them
+through run_feed_query().
+
+Requests carry the sheet under "data" beside the query's arguments:
+    feed_limits     {"data": sheet, "length": 7.5} or {"data": sheet, "spm": 60} -> max SPM or max length
+    feed_ranking    {"data": sheet, "sort_by": "margin", "feed_types": [...]} -> every feed model ranked for the sheet
+    feed_map        {"data": sheet, "lengths": [2, 60, 200], "spm": [5, 120, 200]} -> feed_check and margins per point
+    feed_duty_cycle {"data": sheet, "jobs": [[7.5, 40, 20000], ...]} -> RMS torque, regen and thermal load over the shift
+    feed_angles     {"data": sheet, "feed_angles": [90, 180, 270], "length": 7.5, "spm": 40} -> RMS and SPM per angle, minimum feed angle
+"""
+
+from typing import Any, Callable, NamedTuple, Tuple
+
+from main import extract_inputs, select_feed, unwrap_payload
+from models import base_feed_params
+from services.feed_calculations import evaluate_feed_angles, map_feed_limits, simulate_feed_shift, solve_feed_limits
+from services.feed_selection import RANK_KEYS, rank_feed_models
+from utils.lookup_tables import FEED_SPEC_TYPES
+from utils.physics.duty_cycle import DEFAULT_THERMAL_TIME_CONSTANT, DEFAULT_TIME_STEP
+from utils.table_registry import pin_tables
+
+# --- Argument parsers ---
+# Each takes the request value (or the argument's default) and its key, and raises ValueError when it is malformed
+def parse_number(value, key):
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        raise ValueError(f'"{key}" must be a number')
+    return None if value is None else float(value)
+
+def parse_axis(value, key):
+    if not isinstance(value, (list, tuple)) or len(value) != 3 or any(isinstance(v, bool) or not isinstance(v, (int, float)) for v in value):
+        raise ValueError(f'"{key}" must be [first, last, steps]')
+    return tuple(value)
+
+def parse_angles(value, key):
+    if value is not None and not isinstance(value, list):
+        raise ValueError(f'"{key}" must be a list of feed angles')
+    return value
+
+def parse_jobs(value, key):
+    if not isinstance(value, list) or not value:
+        raise ValueError(f'"{key}" must be a list of [length, spm, strokes]')
+    return value
+
+def parse_string(value, key):
+    if not isinstance(value, str):
+        raise ValueError(f'"{key}" must be a string')
+    return value
+
+def parse_feed_types(value, key):
+    if not isinstance(value, (list, tuple)) or not all(isinstance(t, str) for t in value):
+        raise ValueError(f'"{key}" must be a list of feed types')
+    return tuple(value)
+
+
+class FeedQuery(NamedTuple):
+    """
+    One feed query: its HTTP route, the service answering it and its (name, parser, default) arguments.
+
+    An any_feed query compares feed models, so it runs on the sheet's feed inputs whichever
+    feed is selected, or the sigma five inputs when none is, and its service takes no spec_type.
+    """
+    route: str
+    service: Callable
+    arguments: Tuple[Tuple[str, Callable, Any], ...]
+    any_feed: bool = False
+
+
+FEED_QUERIES = {
+    "feed_limits": FeedQuery("/feed/limits", solve_feed_limits, (
+        ("length", parse_number, None),
+        ("spm", parse_number, None),
+        ("feed_angle", parse_number, None),
+    )),
+    "feed_ranking": FeedQuery("/feed/ranking", rank_feed_models, (
+        ("feed_types", parse_feed_types, FEED_SPEC_TYPES),
+        ("sort_by", parse_string, RANK_KEYS[0]),
+    ), any_feed=True),
+    "feed_map": FeedQuery("/feed/map", map_feed_limits, (
+        ("lengths", parse_axis, None),
+        ("spm", parse_axis, None),
+        ("feed_angle", parse_number, None),
+    )),
+    "feed_duty_cycle": FeedQuery("/feed/duty-cycle", simulate_feed_shift, (
+        ("jobs", parse_jobs, None),
+        ("feed_angle", parse_number, None),
+        ("step", parse_number, DEFAULT_TIME_STEP),
+        ("thermal_time_constant", parse_number, DEFAULT_THERMAL_TIME_CONSTANT),
+    )),
+    "feed_angles": FeedQuery("/feed/angles", evaluate_feed_angles, (
+        ("feed_angles", parse_angles, None),
+        ("length", parse_number, None),
+        ("spm", parse_number, None),
+    )),
+}
+
+def get_query_arguments(query: FeedQuery, payload) -> dict:
+    """Keyword arguments for a query's service from a request; unset values take the defaults."""
+    if not isinstance(payload, dict):
+        raise ValueError("Feed query must be a JSON object")
+    arguments = {}
+    for key, parse, default in query.arguments:
+        value = payload.get(key)
+        arguments[key] = parse(default if value is None else value, key)
+    return arguments
+
+def run_feed_query(name: str, payload) -> dict:
+    """
+    Answer one feed query for the sheet's selected feed.
+
+    Args:
+        name (str): Key of the query in FEED_QUERIES.
+        payload (dict): {"data": sheet, ...} with the query's arguments.
+
+    Returns:
+        dict: The service's result, tagged with the lookup table version used.
+
+    Raises:
+        ValueError: If the query is unknown, an argument is malformed, the sheet selects
+            no feed or the service rejects the query.
+    """
+    if name not in FEED_QUERIES:
+        raise ValueError(f"Unknown feed query: {name}")
+    query = FEED_QUERIES[name]
+    arguments = get_query_arguments(query, payload)
+    inputs = extract_inputs(unwrap_payload(payload))
+    with pin_tables() as tables:
+        selected = select_feed(inputs)
+        if query.any_feed:
+            if selected is None:
+                feed_obj = base_feed_params(feed_type="sigma_five", feed_model="", **inputs.group("feed_sigma_five"))
+            else:
+                feed_obj = selected[1]
+            result = query.service(feed_obj, **arguments)
+        else:
+            if selected is None:
+                raise ValueError("The sheet does not select a feed type")
+            spec_type, feed_obj = selected
+            result = query.service(feed_obj, spec_type=spec_type, **arguments)
+        result["table_version"] = tables.version
+        return result
@@ -1,6 +1,11 @@
 import json
 import argparse
+import contextlib
+import functools
 import sys
+import threading
+from dataclasses import dataclass
+from typing import Callable, Tuple
 from models import (
     rfq_input, material_specs_input, tddbhd_input, reel_drive_input, str_utility_input, roll_str_backbend_input,
     base_feed_params, feed_w_pull_thru_input, hyd_shear_input
@@ -11,258 +16,138 @@ from calculations.tddbhd import calculate_tbdbhd
 from calculations.reel_drive import calculate_reeldrive
 from calculations.str_utility import calculate_str_utility
 from calculations.rolls.roll_str_backbend import calculate_roll_str_backbend
-from calculations.feeds.sigma_five_feed import calculate_sigma_five
-from calculations.feeds.sigma_five_feed_with_pt import calculate_sigma_five_pt
-from calculations.feeds.allen_bradley_mpl_feed import calculate_allen_bradley
-from calculations.shears.single_rake_hyd_shear import calculate_single_rake_hyd_shear
-from calculations.shears.bow_tie_hyd_shear import calculate_bow_tie_hyd_shear
 from utils.shared import DEFAULTS
-from utils.feed_controls_mapping import map_controls_level_to_feed_controls, get_default_feed_model_for_controls
-
-# --- Helper functions ---
-def str2bool(val):
-    if isinstance(val, bool):
-        return val
-    if isinstance(val, (int, float)):
-        return bool(val)
-    if val is None:
+from utils.feed_controls_mapping import get_default_feed_model_for_controls
+from utils.ndjson import serve_ndjson, write_line
+from utils.result_cache import cached_calculator
+from utils.calculator_loader import load_calculator, preload_calculators
+from utils.input_mapping import extract_inputs, section_input_paths, str2bool
+from utils.table_registry import TableVersionUnavailable, pin_tables, registry, start_table_watcher
+
+# --- Result cache ---
+# Identical inputs give identical results, so repeated equipment/material combinations
+# are answered from utils.result_cache instead of being recalculated
+calculate_reeldrive = cached_calculator(calculate_reeldrive)
+calculate_tbdbhd = cached_calculator(calculate_tbdbhd)
+calculate_str_utility = cached_calculator(calculate_str_utility)
+calculate_roll_str_backbend = cached_calculator(calculate_roll_str_backbend)
+
+@functools.lru_cache(maxsize=None)
+def get_calculator(name):
+    """Feed or shear calculator, imported when a sheet first selects it and wrapped in the result cache"""
+    return cached_calculator(load_calculator(name))
+
+# --- Main mapping and calculation logic ---
+def unwrap_payload(payload):
+    """Accept either a bare sheet or a {"data": sheet} envelope"""
+    if isinstance(payload, dict) and "data" in payload and isinstance(payload["data"], dict):
+        return payload["data"]
+    return payload
+
+def get_requested_sections(payload):
+    """Sections listed in a {"data": sheet, "sections": [...]} envelope, or None for all of them"""
+    if not (isinstance(payload, dict) and isinstance(payload.get("data"), dict)):
         return None
-    return str(val).strip().lower() in ("yes", "true", "1", "y")
+    sections = payload.get("sections")
+    if sections is None:
+        return None
+    if isinstance(sections, str):
+        sections = [sections]
+    if not isinstance(sections, list):
+        raise ValueError("sections must be a list of section names")
+    return sections
 
-def get_nested(d, keys, default=None):
-    for k in keys:
-        if isinstance(d, dict) and k in d:
-            d = d[k]
-        else:
-            return default
-    return d
+def get_parallel_flag(payload):
+    """Whether a request envelope asks for parallel section execution: {"data": ..., "parallel": true}"""
+    return isinstance(payload, dict) and str2bool(payload.get("parallel")) is True
 
-def parse_float(val, default=None):
+def resolve_feed_model(selection):
+    """Feed model from the sheet, defaulted from the controls level when it is not set"""
+    controls_level = selection["controls_level"]
+    feed_model = selection["feed_model"]
+    if controls_level and not feed_model:
+        return get_default_feed_model_for_controls(controls_level)
+    if feed_model is None:
+        return DEFAULTS["feed"]["model"]
+    return str(feed_model)
+
+# --- Section calculations ---
+def run_rfq(inputs, results):
+    """RFQ feed rates for the average, min and max operating points"""
     try:
-        return float(val)
-    except (TypeError, ValueError):
-        return default
+        rfq_average_obj = rfq_input(**inputs.group("rfq_average"))
+        rfq_min_obj = rfq_input(**inputs.group("rfq_min"))
+        rfq_max_obj = rfq_input(**inputs.group("rfq_max"))
+        
+        rfq_result = {
+            "average": calculate_fpm(rfq_average_obj),
+            "min": calculate_fpm(rfq_min_obj),
+            "max": calculate_fpm(rfq_max_obj)
+        }
+    except Exception as e:
+        print(f"Error in RFQ calculation: {e}", file=sys.stderr)
+        rfq_result = {"error": str(e)}
+    return rfq_result
 
-def parse_int(val, default=None):
+def run_material_specs(inputs, results):
+    """Material specs, including the calculated coil OD used by later sections"""
     try:
-        return int(val)
-    except (TypeError, ValueError):
-        return default
-
-def parse_str(val, default=None):
-    if val is None:
-        return default
-    return str(val)
-
-def get_with_default(data, keys, default_category, default_key):
-    """Get nested value with fallback to centralized default"""
-    value = get_nested(data, keys)
-    if value is None:
-        return DEFAULTS[default_category][default_key]
-    return value
-
-def parse_float_with_default(data, keys, default_category, default_key):
-    """Parse float with fallback to centralized default"""
-    value = get_nested(data, keys)
-    parsed = parse_float(value)
-    if parsed is None:
-        return DEFAULTS[default_category][default_key]
-    return parsed
-
-def parse_int_with_default(data, keys, default_category, default_key):
-    """Parse int with fallback to centralized default"""
-    value = get_nested(data, keys)
-    parsed = parse_int(value)
-    if parsed is None:
-        return DEFAULTS[default_category][default_key]
-    return parsed
-
-def parse_str_with_default(data, keys, default_category, default_key):
-    """Parse string with fallback to centralized default"""
-    value = get_nested(data, keys)
-    if value is None:
-        return DEFAULTS[default_category][default_key]
-    return str(value)
-
-def parse_boolean_with_default(data, keys, default_category, default_key):
-    """Parse boolean with fallback to centralized default"""
-    value = get_nested(data, keys)
-    if value is None:
-        return DEFAULTS[default_category][default_key]
-    return bool(value)
+        mat_data = inputs.group("material_specs")
+        mat_data["selected_roll"] = None  # Not present
+        mat_obj = material_specs_input(**mat_data)
+        mat_result = calculate_variant(mat_obj)
+    except Exception as e:
+        print(f"Error in Material Specs calculation: {e}", file=sys.stderr)
+        mat_result = {"error": str(e)}
+    return mat_result
 
-# --- Main mapping and calculation logic ---
-def main():
+def run_reel_drive(inputs, results):
+    """Reel drive sizing"""
     try:
-        # Try to read from stdin first, then fall back to command line arguments
-        if not sys.stdin.isatty():
-            # Data is being piped in via stdin
-            try:
-                stdin_data = sys.stdin.read()
-                data = json.loads(stdin_data)
-                if "data" in data and isinstance(data["data"], dict):
-                    data = data["data"]
-            except json.JSONDecodeError as e:
-                print(f"Error: Invalid JSON data from stdin: {e}", file=sys.stderr)
-                sys.exit(1)
-        else:
-            # Fall back to command line arguments
-            parser = argparse.ArgumentParser(description="COE Performance Sheet JSON Calculator")
-            parser.add_argument("--json", type=str, required=True, help="JSON data as string")
-            args = parser.parse_args()
-            
-            try:
-                data = json.loads(args.json)
-            except json.JSONDecodeError as e:
-                parser.error(f"Invalid JSON data: {e}")
+        reel_drive_obj = reel_drive_input(**inputs.group("reel_drive"))
+        reel_drive_result = calculate_reeldrive(reel_drive_obj)
+    except Exception as e:
+        print(f"Error in Reel Drive calculation: {e}", file=sys.stderr)
+        reel_drive_result = {"error": str(e)}
+    return reel_drive_result
 
-        # --- RFQ (calculate for average, min, and max) ---
-        try:
-            rfq_average_data = {
-                "feed_length": parse_float_with_default(data, ["common", "feedRates", "average", "length"], "feed", "rate"),
-                "spm": parse_float_with_default(data, ["common", "feedRates", "average", "spm"], "feed", "rate"),
-            }
-            rfq_min_data = {
-                "feed_length": parse_float_with_default(data, ["common", "feedRates", "min", "length"], "feed", "rate"),
-                "spm": parse_float_with_default(data, ["common", "feedRates", "min", "spm"], "feed", "rate"),
-            }
-            rfq_max_data = {
-                "feed_length": parse_float_with_default(data, ["common", "feedRates", "max", "length"], "feed", "rate"),
-                "spm": parse_float_with_default(data, ["common", "feedRates", "max", "spm"], "feed", "rate"),
-            }
-
-            rfq_average_obj = rfq_input(**rfq_average_data)
-            rfq_min_obj = rfq_input(**rfq_min_data)
-            rfq_max_obj = rfq_input(**rfq_max_data)
-            
-            rfq_result = {
-                "average": calculate_fpm(rfq_average_obj),
-                "min": calculate_fpm(rfq_min_obj),
-                "max": calculate_fpm(rfq_max_obj)
-            }
-        except Exception as e:
-            print(f"Error in RFQ calculation: {e}", file=sys.stderr)
-            rfq_result = {"error": str(e)}
+def run_tddbhd(inputs, results):
+    """Threading drive, drag brake and hold down"""
+    try:
+        # Get reel model first to determine family-specific constraints
+        reel_model = inputs.group("tddbhd_reel")["reel_model"]
+        
+        # Force correct parameters for CPR-040 (D1 family) - only supports air_clutch="No"
+        if reel_model == "CPR-040":
+            threading = {"air_clutch": "No", "hyd_threading_drive": "None"}
+        else:
+            threading = inputs.group("tddbhd_threading")
+        
+        tddbhd_data = inputs.group("tddbhd")
+        tddbhd_data.update(threading)
+        tddbhd_data["reel_drive_tqempty"] = None  # Not present
+        tddbhd_data["reel_model"] = reel_model
         
-        # --- Material Specs ---
-        try:
-            mat_data = {
-                "material_type": parse_str_with_default(data, ["common", "material", "materialType"], "material", "material_type"),
-                "material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                "yield_strength": parse_float_with_default(data, ["common", "material", "maxYieldStrength"], "material", "yield_strength"),
-                "coil_width": parse_float_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                "coil_weight": parse_float_with_default(data, ["common", "material", "coilWeight"], "material", "coil_weight"),
-                "coil_id": parse_float_with_default(data, ["common", "coil", "coilID"], "material", "coil_id"),
-                "feed_direction": parse_str_with_default(data, ["common", "equipment", "feed", "direction"], "feed", "direction"),
-                "controls_level": parse_str_with_default(data, ["common", "equipment", "feed", "controlsLevel"], "feed", "controls_level"),
-                "type_of_line": parse_str_with_default(data, ["common", "equipment", "feed", "typeOfLine"], "feed", "type_of_line"),
-                "feed_controls": parse_str_with_default(data, ["common", "equipment", "feed", "controls"], "feed", "controls"),
-                "passline": parse_float_with_default(data, ["common", "equipment", "feed", "passline"], "feed", "passline"),
-                "selected_roll": None,  # Not present
-                "reel_backplate": parse_float_with_default(data, ["common", "equipment", "reel", "backplate", "diameter"], "reel", "backplate_diameter"),
-                "reel_style": parse_str_with_default(data, ["materialSpecs", "reel", "style"], "reel", "style"),
-                "light_gauge_non_marking": str2bool(get_nested(data, ["common", "equipment", "feed", "lightGuageNonMarking"])) or DEFAULTS["feed"]["light_gauge_non_marking"],
-                "non_marking": str2bool(get_nested(data, ["common", "equipment", "feed", "nonMarking"])) or DEFAULTS["feed"]["non_marking"],
-            }
-            mat_obj = material_specs_input(**mat_data)
-            mat_result = calculate_variant(mat_obj)
-        except Exception as e:
-            print(f"Error in Material Specs calculation: {e}", file=sys.stderr)
-            mat_result = {"error": str(e)}
-
-        # Map controls level to feed controls if controls level is provided
-        controls_level = get_nested(data, ["common", "equipment", "feed", "controlsLevel"])
-        if controls_level:
-            calculated_feed_controls = map_controls_level_to_feed_controls(controls_level)
-            default_feed_model = get_default_feed_model_for_controls(controls_level)
-            
-            # Update the data structure with calculated values
-            if "common" not in data:
-                data["common"] = {}
-            if "equipment" not in data["common"]:
-                data["common"]["equipment"] = {}
-            if "feed" not in data["common"]["equipment"]:
-                data["common"]["equipment"]["feed"] = {}
-            
-            # Set the calculated feed controls
-            data["common"]["equipment"]["feed"]["controls"] = calculated_feed_controls
-            
-            # Set default model if not already set
-            if not get_nested(data, ["common", "equipment", "feed", "model"]):
-                data["common"]["equipment"]["feed"]["model"] = default_feed_model
+        tddbhd_obj = tddbhd_input(**tddbhd_data)
+        tddbhd_result = calculate_tbdbhd(tddbhd_obj)
+    except Exception as e:
+        print(f"Error in TDDBHD calculation: {e}", file=sys.stderr)
+        tddbhd_result = {"error": str(e)}
+    return tddbhd_result
 
+def run_str_utility(inputs, results):
+    """Straightener utility; needs the material specs, reel drive and TDDBHD results"""
+    try:
         # Get calculated coil OD from material specs, fallback to JSON value if not available
+        mat_result = results["material_specs"]
         calculated_coil_od = None
         if isinstance(mat_result, dict) and "coil_od_calculated" in mat_result:
             calculated_coil_od = mat_result.get("coil_od_calculated")
         if not calculated_coil_od or calculated_coil_od == 0:
-            calculated_coil_od = parse_float_with_default(data, ["coil", "maxCoilOD"], "material", "max_coil_od")
-
-        # --- Reel Drive ---
-        try:
-            reel_drive_data = {
-                "model": parse_str_with_default(data, ["common", "equipment", "reel", "model"], "reel", "model"),
-                "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                "coil_id": parse_float_with_default(data, ["common", "coil", "coilID"], "material", "coil_id"),
-                "coil_od": parse_float_with_default(data, ["common", "coil", "maxCoilOD"], "material", "max_coil_od"),
-                "reel_width": parse_float_with_default(data, ["common", "equipment", "reel", "width"], "reel", "width"),
-                "backplate_diameter": parse_float_with_default(data, ["common", "equipment", "reel", "backplate", "diameter"], "reel", "backplate_diameter"),
-                "motor_hp": parse_float_with_default(data, ["common", "equipment", "reel", "horsepower"], "reel", "horsepower"),
-                "type_of_line": parse_str_with_default(data, ["common", "equipment", "feed", "typeOfLine"], "feed", "type_of_line"),
-                "required_max_fpm": parse_float_with_default(data, ["common", "material", "reqMaxFPM"], "feed", "rate"),
-            }
-            reel_drive_obj = reel_drive_input(**reel_drive_data)
-            reel_drive_result = calculate_reeldrive(reel_drive_obj)
-        except Exception as e:
-            print(f"Error in Reel Drive calculation: {e}", file=sys.stderr)
-            reel_drive_result = {"error": str(e)}
-
-        # --- TDDBHD ---
-        try:
-            # Get reel model first to determine family-specific constraints
-            reel_model = parse_str_with_default(data, ["common", "equipment", "reel", "model"], "reel", "model")
-            
-            # Force correct parameters for CPR-040 (D1 family) - only supports air_clutch="No"
-            if reel_model == "CPR-040":
-                air_clutch_value = "No"
-                hyd_threading_drive_value = "None"
-            else:
-                air_clutch_value = str2bool(get_nested(data, ["tddbhd", "reel", "threadingDrive", "airClutch"])) or DEFAULTS["reel"]["threading_drive_air_clutch"]
-                hyd_threading_drive_value = parse_str_with_default(data, ["tddbhd", "reel", "threadingDrive", "hydThreadingDrive"], "reel", "threading_drive_hyd")
-            
-            tddbhd_data = {
-                "type_of_line": parse_str_with_default(data, ["common", "equipment", "feed", "typeOfLine"], "feed", "type_of_line"),
-                "reel_drive_tqempty": None,  # Not present
-                "motor_hp": parse_float_with_default(data, ["common", "equipment", "reel", "horsepower"], "reel", "horsepower"),
-                "yield_strength": parse_float_with_default(data, ["common", "material", "maxYieldStrength"], "material", "yield_strength"),
-                "thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                "width": parse_float_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                "coil_id": parse_float_with_default(data, ["common", "coil", "coilID"], "material", "coil_id"),
-                "coil_od": parse_float_with_default(data, ["common", "coil", "maxCoilOD"], "material", "max_coil_od"),
-                "coil_weight": parse_float_with_default(data, ["common", "material", "coilWeight"], "material", "coil_weight"),
-                "confirmed_min_width": parse_boolean_with_default(data, ["tddbhd", "reel", "confirmedMinWidth"], "reel", "confirmed_min_width"),
-                "decel": parse_float_with_default(data, ["tddbhd", "reel", "requiredDecelRate"], "reel", "required_decel_rate"),
-                "friction": parse_float_with_default(data, ["tddbhd", "reel", "coefficientOfFriction"], "reel", "coefficient_of_friction"),
-                "air_pressure": parse_float_with_default(data, ["tddbhd", "reel", "airPressureAvailable"], "reel", "air_pressure_available"),
-                "brake_qty": parse_int_with_default(data, ["tddbhd", "reel", "dragBrake", "quantity"], "reel", "drag_brake_quantity"),
-                "brake_model": parse_str_with_default(data, ["tddbhd", "reel", "dragBrake", "model"], "reel", "drag_brake_model"),
-                "cylinder": parse_str_with_default(data, ["tddbhd", "reel", "holddown", "cylinder"], "reel", "holddown_cylinder"),
-                "hold_down_assy": parse_str_with_default(data, ["tddbhd", "reel", "holddown", "assy"], "reel", "holddown_assy"),
-                "hyd_threading_drive": hyd_threading_drive_value,
-                "air_clutch": air_clutch_value,
-                "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                "reel_model": reel_model,
-                "reel_width": parse_float_with_default(data, ["common", "equipment", "reel", "width"], "reel", "width"),
-                "backplate_diameter": parse_float_with_default(data, ["common", "equipment", "reel", "backplate", "diameter"], "reel", "backplate_diameter"),
-            }
-            
-            tddbhd_obj = tddbhd_input(**tddbhd_data)
-            tddbhd_result = calculate_tbdbhd(tddbhd_obj)
-        except Exception as e:
-            print(f"Error in TDDBHD calculation: {e}", file=sys.stderr)
-            tddbhd_result = {"error": str(e)}
+            calculated_coil_od = inputs.group("str_utility_coil")["max_coil_od"]
 
         # Get the final coil OD from TDDBHD calculation (if it updates it) or use the calculated one
+        tddbhd_result = results["tddbhd"]
         final_coil_od = calculated_coil_od
         if isinstance(tddbhd_result, dict) and "coil_od" in tddbhd_result:
             final_coil_od = tddbhd_result.get("coil_od", calculated_coil_od)
@@ -270,193 +155,484 @@ def main():
         if not final_coil_od:
             final_coil_od = calculated_coil_od
 
-        # --- Str Utility ---
-        try:
-            str_util_data = {
-                "max_coil_weight": parse_float_with_default(data, ["common", "coil", "maxCoilWeight"], "material", "max_coil_weight"),
-                "coil_id": parse_float_with_default(data, ["common", "coil", "coilID"], "material", "coil_id"),
-                "coil_od": final_coil_od,
-                "coil_width": parse_float_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                "material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                "yield_strength": parse_float_with_default(data, ["common", "material", "maxYieldStrength"], "material", "yield_strength"),
-                "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                "yield_met": reel_drive_result.get("yield_met", DEFAULTS.get("reel", {}).get("yield_met", False)) if isinstance(reel_drive_result, dict) else False,
-                "str_model": parse_str_with_default(data, ["common", "equipment", "straightener", "model"], "straightener", "model"),
-                "str_width": parse_float_with_default(data, ["common", "equipment", "straightener", "width"], "straightener", "width"),
-                "horsepower": parse_float_with_default(data, ["strUtility", "straightener", "horsepower"], "straightener", "horsepower"),
-                "feed_rate": parse_float_with_default(data, ["strUtility", "straightener", "feedRate"], "feed", "rate"),
-                "max_feed_rate": parse_float_with_default(data, ["strUtility", "straightener", "feedRate"], "feed", "rate"),
-                "auto_brake_compensation": parse_str_with_default(data, ["strUtility", "straightener", "autoBrakeCompensation"], "straightener", "auto_brake_compensation"),
-                "acceleration": parse_float_with_default(data, ["strUtility", "straightener", "acceleration"], "straightener", "acceleration"),
-                "num_str_rolls": parse_int_with_default(data, ["common", "equipment", "straightener", "numberOfRolls"], "straightener", "number_of_rolls"),
-            }
-            str_util_obj = str_utility_input(**str_util_data)
-            str_util_result = calculate_str_utility(str_util_obj)
-        except Exception as e:
-            print(f"Error in Str Utility calculation: {e}", file=sys.stderr)
-            str_util_result = {"error": str(e)}
-
-        # --- Roll Str Backbend ---
-        try:
-            roll_str_backbend_data = {
-                "yield_strength": parse_float_with_default(data, ["common", "material", "maxYieldStrength"], "material", "yield_strength"),
-                "thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                "width": parse_float_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                "material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                "str_model": parse_str_with_default(data, ["common", "equipment", "straightener", "model"], "straightener", "model"),
-                "num_str_rolls": parse_int_with_default(data, ["common", "equipment", "straightener", "numberOfRolls"], "straightener", "number_of_rolls"),
-            }
-            roll_str_backbend_obj = roll_str_backbend_input(**roll_str_backbend_data)
-            roll_str_backbend_result = calculate_roll_str_backbend(roll_str_backbend_obj)
-        except Exception as e:
-            print(f"Error in Roll Str Backbend calculation: {e}", file=sys.stderr)
-            roll_str_backbend_result = {"error": str(e)}
-
-        # --- Feed (choose which) ---
-        feed_result = None
-        try:
-            is_pull_thru = parse_str_with_default(data, ["feed", "feed", "pullThru", "isPullThru"], "feed", "pull_thru")
-            feed_type = parse_str_with_default(data, ["common", "equipment", "feed", "type"], "feed", "type")
-            
-            if "sigma" in feed_type and is_pull_thru.lower() == "yes":            
-                feed_data = {
-                    "feed_type": feed_type,
-                    "feed_model": parse_str_with_default(data, ["common", "equipment", "feed", "model"], "feed", "model"),
-                    "width": parse_int_with_default(data, ["feed", "feed", "machineWidth"], "feed", "machine_width"),
-                    "loop_pit": parse_str_with_default(data, ["common", "equipment","feed", "loopPit"], "feed", "loop_pit"),
-                    "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                    "application": parse_str_with_default(data, ["feed", "feed", "application"], "feed", "application"),
-                    "type_of_line": parse_str_with_default(data, ["common", "equipment", "feed", "typeOfLine"], "feed", "type_of_line"),
-                    "roll_width": parse_str_with_default(data, ["feed", "feed", "fullWidthRolls"], "feed", "roll_width"),
-                    "feed_rate": parse_float_with_default(data, ["common", "feedRates", "average", "fpm"], "feed", "rate"),
-                    "material_width": parse_int_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                    "material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                    "press_bed_length": parse_int_with_default(data, ["common", "press", "bedLength"], "press", "bed_length"),
-                    "friction_in_die": parse_float_with_default(data, ["feed", "feed", "frictionInDie"], "feed", "friction_in_die"),
-                    "acceleration_rate": parse_float_with_default(data, ["feed", "feed", "accelerationRate"], "feed", "acceleration_rate"),
-                    "chart_min_length": parse_float_with_default(data, ["feed", "feed", "chartMinLength"], "feed", "chart_min_length"),
-                    "length_increment": parse_float_with_default(data, ["feed", "feed", "lengthIncrement"], "feed", "length_increment"),
-                    "feed_angle_1": parse_float_with_default(data, ["feed", "feed", "feedAngle1"], "feed", "feed_angle_1"),
-                    "feed_angle_2": parse_float_with_default(data, ["feed", "feed", "feedAngle2"], "feed", "feed_angle_2"),
-                    "straightening_rolls": parse_int_with_default(data, ["feed", "feed", "pullThru", "straightenerRolls"], "feed", "straightening_rolls"),
-                    "yield_strength": parse_float_with_default(data, ["common", "material", "maxYieldStrength"], "material", "yield_strength"),
-                    "str_pinch_rolls": parse_str_with_default(data, ["feed", "feed", "pullThru", "pinchRolls"], "feed", "pinch_rolls"),
-                    "req_max_fpm": parse_float_with_default(data, ["feed", "feed", "strMaxSpeed"], "feed", "rate"),
-                }
-                feed_obj = feed_w_pull_thru_input(**feed_data)
-                feed_result = calculate_sigma_five_pt(feed_obj)
-            elif "sigma" in feed_type:
-                feed_data = {
-                    "feed_type": feed_type,
-                    "feed_model": parse_str_with_default(data, ["common", "equipment", "feed", "model"], "feed", "model"),
-                    "width": parse_int_with_default(data, ["feed", "feed", "machineWidth"], "feed", "machine_width"),
-                    "loop_pit": parse_str_with_default(data, ["common", "equipment", "feed", "loopPit"], "feed", "loop_pit"),
-                    "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                    "application": parse_str_with_default(data, ["feed", "feed", "application"], "feed", "application"),
-                    "type_of_line": parse_str_with_default(data, ["common", "equipment", "feed", "typeOfLine"], "feed", "type_of_line"),
-                    "roll_width": parse_str_with_default(data, ["feed", "feed", "fullWidthRolls"], "feed", "roll_width"),
-                    "feed_rate": parse_float_with_default(data, ["feed", "feed", "strMaxSpeed"], "feed", "rate"),
-                    "material_width": parse_int_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                    "material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                    "press_bed_length": parse_int_with_default(data, ["common", "press", "bedLength"], "press", "bed_length"),
-                    "friction_in_die": parse_float_with_default(data, ["feed", "feed", "frictionInDie"], "feed", "friction_in_die"),
-                    "acceleration_rate": parse_float_with_default(data, ["feed", "feed", "accelerationRate"], "feed", "acceleration_rate"),
-                    "chart_min_length": parse_float_with_default(data, ["feed", "feed", "chartMinLength"], "feed", "chart_min_length"),
-                    "length_increment": parse_float_with_default(data, ["feed", "feed", "lengthIncrement"], "feed", "length_increment"),
-                    "feed_angle_1": parse_float_with_default(data, ["feed", "feed", "feedAngle1"], "feed", "feed_angle_1"),
-                    "feed_angle_2": parse_float_with_default(data, ["feed", "feed", "feedAngle2"], "feed", "feed_angle_2"),
-                }
-                feed_obj = base_feed_params(**feed_data)
-                feed_result = calculate_sigma_five(feed_obj)
-            elif "allen" in feed_type or "mpl" in feed_type:
-                feed_data = {
-                    "feed_type": feed_type,
-                    "feed_model": parse_str_with_default(data, ["common", "equipment","feed", "model"], "feed", "model"),
-                    "width": parse_int_with_default(data, ["feed", "feed", "machineWidth"], "feed", "machine_width"),
-                    "loop_pit": parse_str_with_default(data, ["common", "equipment", "feed", "loopPit"], "feed", "loop_pit"),
-                    "material_type": (get_nested(data, ["common", "material", "materialType"]) or DEFAULTS["material"]["material_type"]).upper(),
-                    "application": parse_str_with_default(data, ["feed", "feed", "application"], "feed", "application"),
-                    "type_of_line": parse_str_with_default(data, ["common", "equipment", "feed", "typeOfLine"], "feed", "type_of_line"),
-                    "roll_width": parse_str_with_default(data, ["feed", "feed", "fullWidthRolls"], "feed", "roll_width"),
-                    "feed_rate": parse_float_with_default(data, ["common", "feedRates", "average", "fpm"], "feed", "rate"),
-                    "material_width": parse_int_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                    "material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                    "press_bed_length": parse_int_with_default(data, ["common", "press", "bedLength"], "press", "bed_length"),
-                    "friction_in_die": parse_float_with_default(data, ["feed", "feed", "frictionInDie"], "feed", "friction_in_die"),
-                    "acceleration_rate": parse_float_with_default(data, ["feed", "feed", "accelerationRate"], "feed", "acceleration_rate"),
-                    "chart_min_length": parse_float_with_default(data, ["feed", "feed", "chartMinLength"], "feed", "chart_min_length"),
-                    "length_increment": parse_float_with_default(data, ["feed", "feed", "lengthIncrement"], "feed", "length_increment"),
-                    "feed_angle_1": parse_float_with_default(data, ["feed", "feed", "feedAngle1"], "feed", "feed_angle_1"),
-                    "feed_angle_2": parse_float_with_default(data, ["feed", "feed", "feedAngle2"], "feed", "feed_angle_2"),
-                }
-                feed_obj = base_feed_params(**feed_data)
-                feed_result = calculate_allen_bradley(feed_obj)
+        reel_drive_result = results["reel_drive"]
+        str_util_data = inputs.group("str_utility")
+        str_util_data["coil_od"] = final_coil_od
+        str_util_data["yield_met"] = reel_drive_result.get("yield_met", DEFAULTS.get("reel", {}).get("yield_met", False)) if isinstance(reel_drive_result, dict) else False
+        str_util_obj = str_utility_input(**str_util_data)
+        str_util_result = calculate_str_utility(str_util_obj)
+    except Exception as e:
+        print(f"Error in Str Utility calculation: {e}", file=sys.stderr)
+        str_util_result = {"error": str(e)}
+    return str_util_result
+
+def run_roll_str_backbend(inputs, results):
+    """Roll straightener backbend"""
+    try:
+        roll_str_backbend_obj = roll_str_backbend_input(**inputs.group("roll_str_backbend"))
+        roll_str_backbend_result = calculate_roll_str_backbend(roll_str_backbend_obj)
+    except Exception as e:
+        print(f"Error in Roll Str Backbend calculation: {e}", file=sys.stderr)
+        roll_str_backbend_result = {"error": str(e)}
+    return roll_str_backbend_result
+
+def select_feed(inputs):
+    """(calculator name, feed params) for the selected feed type, or None when no feed is selected"""
+    selection = inputs.group("feed_select")
+    is_pull_thru = selection["is_pull_thru"]
+    feed_type = selection["feed_type"]
+
+    if "sigma" in feed_type and is_pull_thru.lower() == "yes":
+        feed_data = {"feed_type": feed_type, "feed_model": resolve_feed_model(selection), **inputs.group("feed_sigma_five_pt")}
+        return "sigma_five_pt", feed_w_pull_thru_input(**feed_data)
+    if "sigma" in feed_type:
+        feed_data = {"feed_type": feed_type, "feed_model": resolve_feed_model(selection), **inputs.group("feed_sigma_five")}
+        return "sigma_five", base_feed_params(**feed_data)
+    if "allen" in feed_type or "mpl" in feed_type:
+        feed_data = {"feed_type": feed_type, "feed_model": resolve_feed_model(selection), **inputs.group("feed_allen_bradley")}
+        return "allen_bradley", base_feed_params(**feed_data)
+    return None
+
+def run_feed(inputs, results):
+    """Feed calculation for the selected feed type"""
+    feed_result = None
+    try:
+        selected = select_feed(inputs)
+        if selected is not None:
+            name, feed_obj = selected
+            feed_result = get_calculator(name)(feed_obj)
+    except Exception as e:
+        print(f"Error in Feed calculation: {e}", file=sys.stderr)
+        feed_result = {"error": str(e)}
+    return feed_result
+
+def run_shear(inputs, results):
+    """Shear calculation for the selected shear model"""
+    shear_result = None
+    try:
+        shear_model = inputs.group("shear_select")["shear_model"]
+        if shear_model == "single_rake":
+            shear_obj = hyd_shear_input(**inputs.group("shear"))
+            shear_result = get_calculator("single_rake_hyd_shear")(shear_obj)
+        elif shear_model == "bow_tie":
+            shear_obj = hyd_shear_input(**inputs.group("shear"))
+            shear_result = get_calculator("bow_tie_hyd_shear")(shear_obj)
+    except Exception as e:
+        print(f"Error in Shear calculation: {e}", file=sys.stderr)
+        shear_result = {"error": str(e)}
+    return shear_result
+
+# --- Sections ---
+@dataclass(frozen=True)
+class Section:
+    """A calculator section and the sections whose results it reads"""
+    name: str
+    run: Callable
+    depends_on: Tuple[str, ...] = ()
+
+# Listed in evaluation order; a section only runs after everything it depends on
+SECTIONS = {
+    section.name: section for section in (
+        Section("rfq", run_rfq),
+        Section("material_specs", run_material_specs),
+        Section("reel_drive", run_reel_drive),
+        Section("tddbhd", run_tddbhd),
+        Section("str_utility", run_str_utility, ("material_specs", "reel_drive", "tddbhd")),
+        Section("roll_str_backbend", run_roll_str_backbend),
+        Section("feed", run_feed),
+        Section("shear", run_shear),
+    )
+}
+
+# Every input path each section reads (dotted, relative to the sheet), derived from INPUT_SPEC.
+# calculate_incremental() relies on it to decide what to re-run.
+SECTION_INPUTS = section_input_paths()
+
+def build_input_path_map(section_inputs):
+    """Invert a section -> input paths map into input path -> sections (in evaluation order)"""
+    path_map = {}
+    for name in SECTIONS:
+        for path in section_inputs.get(name, ()):
+            path_map.setdefault(path, [])
+            if name not in path_map[path]:
+                path_map[path].append(name)
+    return path_map
+
+# Input path -> sections that consume it, e.g. "common.material.coilWidth" -> ["material_specs", "tddbhd", ...]
+INPUT_PATH_SECTIONS = build_input_path_map(SECTION_INPUTS)
+
+# Key order of the output document
+OUTPUT_ORDER = ["rfq", "material_specs", "tddbhd", "reel_drive", "str_utility", "roll_str_backbend", "feed", "shear"]
+
+def resolve_sections(sections=None):
+    """
+    Expand a requested list of sections with everything they depend on.
+
+    Args:
+        sections (list, optional): Section names to compute. None means every section.
+
+    Returns:
+        list: Section names to run, in evaluation order.
+
+    Raises:
+        ValueError: If a section name is not known.
+    """
+    if sections is None:
+        return list(SECTIONS)
+
+    unknown = [name for name in sections if name not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown section(s): {', '.join(map(str, unknown))}")
+
+    selected = set()
+    pending = list(sections)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(SECTIONS[name].depends_on)
+
+    return [name for name in SECTIONS if name in selected]
+
+def build_output(results, table_version):
+    """Assemble section results into the output document, tagged with the lookup table version used"""
+    output = {name: results[name] for name in OUTPUT_ORDER if name in results}
+    if output.get("shear", 0) is None:
+        del output["shear"]
+    output["table_version"] = table_version
+    return output
+
+def calculate(data, sections=None, parallel=False):
+    """
+    Run the section calculations for one performance sheet.
+
+    Args:
+        data (dict): Performance sheet payload (same shape as calculations/25-00245.json).
+        sections (list, optional): Only compute these sections (plus their dependencies).
+            Defaults to every section.
+        parallel (bool): Run independent sections concurrently on a process pool.
+
+    Returns:
+        dict: Section results keyed by section name. A section that fails carries {"error": ...}.
+            "table_version" names the lookup tables every section was computed against.
+    """
+    names = resolve_sections(sections)
+    inputs = extract_inputs(data)
+    # Tables reloaded mid-calculation only take effect for the next one
+    with pin_tables() as tables:
+        if parallel and can_run_parallel():
+            return build_output(run_sections_parallel(inputs, names, tables.version), tables.version)
+
+        results = {}
+        for name in names:
+            results[name] = SECTIONS[name].run(inputs, results)
+
+        return build_output(results, tables.version)
+
+# --- Parallel execution ---
+_section_executor = None
+_section_executor_lock = threading.Lock()
+
+def can_run_parallel():
+    """Daemonic processes (worker_pool workers) may not start children of their own"""
+    import multiprocessing
+    return not multiprocessing.current_process().daemon
+
+def get_section_executor():
+    """Process pool shared by every parallel calculation in this process"""
+    # Only parallel mode pays for importing the pool machinery
+    from concurrent.futures import ProcessPoolExecutor
+    from worker_pool import get_thread_safe_context
+
+    global _section_executor
+    with _section_executor_lock:
+        if _section_executor is None:
+            # The pool starts workers on demand, while the table watcher (--serve) or the
+            # ASGI executor threads run, so they come from a fork server rather than a fork
+            _section_executor = ProcessPoolExecutor(mp_context=get_thread_safe_context())
+        return _section_executor
+
+def shutdown_section_executor(executor=None):
+    """Shut the pool down; with an executor given, only if it is still the current one"""
+    global _section_executor
+    with _section_executor_lock:
+        if _section_executor is not None and executor in (None, _section_executor):
+            _section_executor.shutdown(wait=False)
+            _section_executor = None
+
+def section_waves(names):
+    """
+    Group sections into waves: every section in a wave only depends on earlier waves.
+
+    With the full section list this is [rfq, material_specs, reel_drive, tddbhd,
+    roll_str_backbend, feed, shear] followed by [str_utility].
+    """
+    waves = []
+    done = set()
+    pending = list(names)
+    while pending:
+        wave = [name for name in pending if all(dep in done or dep not in names for dep in SECTIONS[name].depends_on)]
+        waves.append(wave)
+        done.update(wave)
+        pending = [name for name in pending if name not in done]
+    return waves
+
+def run_section(name, inputs, dependency_results, table_version):
+    """Worker-side entry point: run one section with the results it depends on"""
+    # Pool workers load the tables when they start; catch up if the parent reloaded since
+    with pin_tables(registry.ensure(table_version)):
+        # Calculator prints must not reach the worker's stdout (the response stream in --serve)
+        with contextlib.redirect_stdout(sys.stderr):
+            return SECTIONS[name].run(inputs, dependency_results)
+
+def submit_section(name, inputs, dependency_results, table_version):
+    """Queue one section on the pool, replacing the pool once if an earlier crash broke it"""
+    from concurrent.futures.process import BrokenProcessPool
+
+    executor = get_section_executor()
+    try:
+        return executor.submit(run_section, name, inputs, dependency_results, table_version)
+    except BrokenProcessPool:
+        shutdown_section_executor(executor)
+        return get_section_executor().submit(run_section, name, inputs, dependency_results, table_version)
+
+def run_sections_parallel(inputs, names, table_version):
+    """
+    Run sections wave by wave, each wave concurrently on the process pool.
+
+    The run_* functions already turn calculator failures into {"error": ...}; anything
+    that goes wrong in the pool itself (a worker dying, a result that cannot be sent
+    back) is reported the same way for the affected section only. A section whose
+    worker can no longer read the pinned table version is run here instead.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    results = {}
+    for wave in section_waves(names):
+        futures = {}
+        for name in wave:
+            dependency_results = {dep: results[dep] for dep in SECTIONS[name].depends_on if dep in results}
+            try:
+                futures[name] = submit_section(name, inputs, dependency_results, table_version)
+            except Exception as e:
+                print(f"Error scheduling {name} calculation: {e}", file=sys.stderr)
+                results[name] = {"error": str(e)}
+
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except TableVersionUnavailable:
+                # The tables were reloaded after this calculation pinned its snapshot
+                dependency_results = {dep: results[dep] for dep in SECTIONS[name].depends_on if dep in results}
+                results[name] = SECTIONS[name].run(inputs, dependency_results)
+            except BrokenProcessPool as e:
+                # A broken pool cannot take more work; the next wave starts a fresh one
+                print(f"Error in parallel {name} calculation: {e}", file=sys.stderr)
+                results[name] = {"error": str(e)}
+                shutdown_section_executor()
+            except Exception as e:
+                print(f"Error in parallel {name} calculation: {e}", file=sys.stderr)
+                results[name] = {"error": str(e)}
+
+    return results
+
+# --- Incremental recalculation ---
+def flatten_paths(value, prefix=""):
+    """Flatten nested dicts into {"a.b.c": leaf}; lists and scalars are leaves"""
+    if not isinstance(value, dict):
+        return {prefix: value}
+    if not value and prefix:
+        return {prefix: value}
+    flat = {}
+    for key, child in value.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        flat.update(flatten_paths(child, path))
+    return flat
+
+def changed_input_paths(prev_input, new_input):
+    """Dotted paths whose value differs between two sheets (added and removed paths included)"""
+    prev_flat = flatten_paths(prev_input or {})
+    new_flat = flatten_paths(new_input or {})
+    missing = object()
+    return sorted(
+        path for path in prev_flat.keys() | new_flat.keys()
+        if prev_flat.get(path, missing) != new_flat.get(path, missing)
+    )
+
+def sections_affected_by(paths):
+    """
+    Sections that must be re-run after the given input paths changed.
+
+    A changed path hits every section reading that path, a path below it (a whole
+    subtree was replaced) or a path above it. Sections depending on a hit section
+    are re-run as well.
+    """
+    affected = set()
+    for path in paths:
+        for input_path, names in INPUT_PATH_SECTIONS.items():
+            if (input_path == path
+                    or input_path.startswith(path + ".")
+                    or path.startswith(input_path + ".")):
+                affected.update(names)
+
+    # Pull in dependents until nothing new is added
+    changed = True
+    while changed:
+        changed = False
+        for name, section in SECTIONS.items():
+            if name not in affected and affected.intersection(section.depends_on):
+                affected.add(name)
+                changed = True
+
+    return [name for name in SECTIONS if name in affected]
+
+def calculate_incremental(prev_input, prev_output, new_input):
+    """
+    Recalculate a sheet after an edit, re-running only the sections whose inputs changed.
+
+    Args:
+        prev_input (dict): Sheet the previous output was calculated from.
+        prev_output (dict): Output of calculate() for prev_input.
+        new_input (dict): Edited sheet.
+
+    Returns:
+        dict: Same document calculate(new_input) would return. Sections whose inputs
+            did not change are taken from prev_output, unless prev_output was computed
+            against other lookup tables, in which case every section is re-run.
+    """
+    prev_output = prev_output if isinstance(prev_output, dict) else {}
+    rerun = set(sections_affected_by(changed_input_paths(prev_input, new_input)))
+    inputs = extract_inputs(new_input)
+
+    with pin_tables() as tables:
+        if prev_output.get("table_version") != tables.version:
+            prev_output = {}
+
+        results = {}
+        for name, section in SECTIONS.items():
+            # A section missing from the previous output was never computed (or was empty); run it
+            if name in rerun or name not in prev_output:
+                results[name] = section.run(inputs, results)
             else:
-                feed_result = None
-        except Exception as e:
-            print(f"Error in Feed calculation: {e}", file=sys.stderr)
-            feed_result = {"error": str(e)}
-
-        # --- Shear (choose which) ---
-        shear_result = None
-        try:
-            shear_model = get_nested(data, ["shear", "shear", "model"], "").lower()
-            if shear_model == "single_rake":
-                shear_data = {
-                    "max_material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                    "coil_width": parse_float_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                    "material_tensile": parse_float_with_default(data, ["shear", "shear", "strength"], "shear", "strength"),
-                    "rake_of_blade": parse_float_with_default(data, ["shear", "shear", "blade", "rakeOfBladePerFoot"], "shear", "rake_of_blade_per_foot"),
-                    "overlap": parse_float_with_default(data, ["shear", "shear", "blade", "overlap"], "shear", "overlap"),
-                    "blade_opening": parse_float_with_default(data, ["shear", "shear", "blade", "bladeOpening"], "shear", "blade_opening"),
-                    "percent_of_penetration": parse_float_with_default(data, ["shear", "shear", "blade", "percentOfPenetration"], "shear", "percent_of_penetration"),
-                    "bore_size": parse_float_with_default(data, ["shear", "shear", "cylinder", "boreSize"], "shear", "bore_size"),
-                    "rod_dia": parse_float_with_default(data, ["shear", "shear", "cylinder", "rodDiameter"], "shear", "rod_diameter"),
-                    "stroke": parse_float_with_default(data, ["shear", "shear", "cylinder", "stroke"], "shear", "stroke"),
-                    "pressure": parse_float_with_default(data, ["shear", "shear", "hydraulic", "pressure"], "shear", "hydraulic_pressure"),
-                    "time_for_down_stroke": parse_float_with_default(data, ["shear", "shear", "time", "forDownwardStroke"], "shear", "time_for_down_stroke"),
-                    "dwell_time": parse_float_with_default(data, ["shear", "shear", "time", "dwellTime"], "shear", "dwell_time"),
-                }
-                shear_obj = hyd_shear_input(**shear_data)
-                shear_result = calculate_single_rake_hyd_shear(shear_obj)
-            elif shear_model == "bow_tie":
-                shear_data = {
-                    "max_material_thickness": parse_float_with_default(data, ["common", "material", "materialThickness"], "material", "material_thickness"),
-                    "coil_width": parse_float_with_default(data, ["common", "material", "coilWidth"], "material", "coil_width"),
-                    "material_tensile": parse_float_with_default(data, ["shear", "shear", "strength"], "shear", "strength"),
-                    "rake_of_blade": parse_float_with_default(data, ["shear", "shear", "blade", "rakeOfBladePerFoot"], "shear", "rake_of_blade_per_foot"),
-                    "overlap": parse_float_with_default(data, ["shear", "shear", "blade", "overlap"], "shear", "overlap"),
-                    "blade_opening": parse_float_with_default(data, ["shear", "shear", "blade", "bladeOpening"], "shear", "blade_opening"),
-                    "percent_of_penetration": parse_float_with_default(data, ["shear", "shear", "blade", "percentOfPenetration"], "shear", "percent_of_penetration"),
-                    "bore_size": parse_float_with_default(data, ["shear", "shear", "cylinder", "boreSize"], "shear", "bore_size"),
-                    "rod_dia": parse_float_with_default(data, ["shear", "shear", "cylinder", "rodDiameter"], "shear", "rod_diameter"),
-                    "stroke": parse_float_with_default(data, ["shear", "shear", "cylinder", "stroke"], "shear", "stroke"),
-                    "pressure": parse_float_with_default(data, ["shear", "shear", "hydraulic", "pressure"], "shear", "hydraulic_pressure"),
-                    "time_for_down_stroke": parse_float_with_default(data, ["shear", "shear", "time", "forDownwardStroke"], "shear", "time_for_down_stroke"),
-                    "dwell_time": parse_float_with_default(data, ["shear", "shear", "time", "dwellTime"], "shear", "dwell_time"),
-                }
-                shear_obj = hyd_shear_input(**shear_data)
-                shear_result = calculate_bow_tie_hyd_shear(shear_obj)
-        except Exception as e:
-            print(f"Error in Shear calculation: {e}", file=sys.stderr)
-            shear_result = {"error": str(e)}
-
-        # --- Output ---
-        output = {
-            "rfq": rfq_result,
-            "material_specs": mat_result,
-            "tddbhd": tddbhd_result,
-            "reel_drive": reel_drive_result,
-            "str_utility": str_util_result,
-            "roll_str_backbend": roll_str_backbend_result,
-            "feed": feed_result,
-        }
-        if shear_result is not None:
-            output["shear"] = shear_result
-            
+                results[name] = prev_output[name]
+
+        return build_output(results, tables.version)
+
+# --- Worker mode ---
+def handle_request(request):
+    """
+    Handle one --serve request: {"id": ..., "data": {...}, "sections": [...]}
+
+    A request carrying "previous": {"data": {...}, "output": {...}} is recalculated
+    incrementally against that earlier sheet and result. One whose "entry" names a
+    feed query (see feed_queries.FEED_QUERIES) answers that query instead.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+
+    entry = request.get("entry", "calculate")
+    if entry != "calculate":
+        # Imported on first use so a plain calculation never loads the feed query services
+        from feed_queries import run_feed_query
+        return run_feed_query(entry, request)
+
+    previous = request.get("previous")
+    if isinstance(previous, dict) and isinstance(previous.get("data"), dict):
+        return calculate_incremental(previous["data"], previous.get("output"), unwrap_payload(request))
+
+    return calculate(unwrap_payload(request), get_requested_sections(request), get_parallel_flag(request))
+
+def serve():
+    """
+    Long-lived worker mode.
+
+    Reads newline-delimited JSON requests from stdin and writes one newline-delimited
+    JSON response per request, tagged with the request id. Modules and lookup tables
+    are loaded once for the lifetime of the process instead of once per calculation;
+    edited table files are picked up by the table watcher without a restart.
+    """
+    # A long-lived worker pays for every calculator up front rather than on the first request
+    preload_calculators()
+    start_table_watcher()
+    serve_ndjson(handle_request)
+
+# --- Batch mode ---
+def run_batch(path):
+    """
+    Streaming batch mode.
+
+    Reads one sheet payload per line (NDJSON) from a file, or stdin when path is "-",
+    and writes one compact JSON result line per sheet as soon as it is computed.
+    Only one sheet is held in memory at a time, so memory stays flat however long
+    the input is. A line that fails produces {"error": ..., "status": "failed"}
+    so output lines always match input lines.
+    """
+    stream = sys.stdin if path == "-" else open(path, "r")
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                # Anything the calculators print must not end up in the result stream
+                with contextlib.redirect_stdout(sys.stderr):
+                    payload = json.loads(line)
+                    output = calculate(unwrap_payload(payload), get_requested_sections(payload), get_parallel_flag(payload))
+            except Exception as e:
+                print(f"Error in batch calculation: {e}", file=sys.stderr)
+                output = {"error": str(e), "status": "failed"}
+            write_line(sys.stdout, output)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+# --- Entry point ---
+def main():
+    parser = argparse.ArgumentParser(description="COE Performance Sheet JSON Calculator")
+    parser.add_argument("--json", type=str, help="JSON data as string")
+    parser.add_argument("--serve", action="store_true", help="Run as a persistent worker reading NDJSON requests on stdin")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="PATH", help="Stream NDJSON sheets from PATH (or stdin) and write one result line per sheet")
+    parser.add_argument("--parallel", action="store_true", help="Run independent sections concurrently on a process pool")
+    parser.add_argument("--sections", type=str, help=f"Comma-separated sections to compute (default: all). One of: {', '.join(SECTIONS)}")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve()
+        return
+
+    if args.batch:
+        run_batch(args.batch)
+        return
+
+    try:
+        # Try to read from stdin first, then fall back to command line arguments
+        if not sys.stdin.isatty():
+            # Data is being piped in via stdin
+            try:
+                stdin_data = sys.stdin.read()
+                payload = json.loads(stdin_data)
+            except json.JSONDecodeError as e:
+                print(f"Error: Invalid JSON data from stdin: {e}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            # Fall back to command line arguments
+            if args.json is None:
+                parser.error("the following arguments are required: --json")
+
+            try:
+                payload = json.loads(args.json)
+            except json.JSONDecodeError as e:
+                parser.error(f"Invalid JSON data: {e}")
+
+        # --sections on the command line wins over a "sections" list in the envelope
+        if args.sections:
+            sections = [name.strip() for name in args.sections.split(",") if name.strip()]
+        else:
+            sections = get_requested_sections(payload)
+
+        output = calculate(unwrap_payload(payload), sections, args.parallel or get_parallel_flag(payload))
         print(json.dumps(output, indent=2, default=str))
-        
+
     except Exception as e:
         print(f"Fatal error in main execution: {e}", file=sys.stderr)
         error_output = {"error": str(e), "status": "failed"}
@@ -191,6 +191,12 @@ class base_feed_params(BaseModel):
     feed_angle_1: float
     feed_angle_2: float
 
+    # Feed chart resolution: rows including the initial row (0 for the default 24), an
+    # optional last length that replaces length_increment, and "rows" or "columns" output
+    chart_rows: int = 0
+    chart_max_length: float = 0.0
+    chart_format: str = "rows"
+
 # FeedWPullThruInput is used to define the input structure for feed with pull-thru calculations
 class feed_w_pull_thru_input(base_feed_params):
     straightening_rolls: int
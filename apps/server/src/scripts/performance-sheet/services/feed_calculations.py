@@ -1,22 +1,28 @@
 """
 Feed calculations service module
 
+Everything a feed calculation derives from a model's spec row alone (the motor
+ratings, velocity, RPM, the roll terms of the friction and loop torques) is
+compiled once per lookup table version into a FeedConstants table. A calculation
+then combines one FeedConstants with the sheet's FeedMaterial (density, material
+loop and the material share of the loop torque), so sweeps over models compute
+the material part once and sweeps over materials reuse each model's constants.
+
 """
 
 import sys
+from typing import NamedTuple
 from models import feed_w_pull_thru_input, base_feed_params, time_input, inertia_input, regen_input
 from math import pi, sqrt
-from utils.lookup_tables import get_material_density, get_sigma_five_specs, get_sigma_five_pt_specs, get_ab_feed_specs, get_selected_str_used
+from utils.lookup_tables import SCHEMA_FIELDS, compile_feed_specs, get_material_density, find_feed_spec, get_selected_str_used
 from utils.physics.inertia import calculate_total_refl_inertia
-from utils.physics.time import calculate_time
+from utils.physics.time import (
+    TIME_TABLE_ROWS, calculate_feasibility_map, calculate_time, check_feed_angles, solve_max_length, solve_max_spm,
+    solve_min_feed_angle,
+)
+from utils.physics.duty_cycle import DEFAULT_THERMAL_TIME_CONSTANT, DEFAULT_TIME_STEP, simulate_duty_cycle
 from utils.physics.regen import calculate_regen
-
-# Map for dynamic getter selection
-SPEC_GETTERS = {
-    "sigma_five": get_sigma_five_specs,
-    "sigma_five_pt": get_sigma_five_pt_specs,
-    "allen_bradley": get_ab_feed_specs
-}
+from utils.table_registry import get_table, register_table
 
 # Common spec keys
 SPEC_KEYS_SIGMA_FIVE = {
@@ -34,6 +40,19 @@ SPEC_KEYS_SIGMA_FIVE = {
     "ec": ("ec", "ec"),
 }
 
+# Pull-thru straightener spec keys
+SPEC_KEYS_PULL_THRU = {
+    "u_roll": ("u_roll", "upper_roll"),
+    "ratio": ("ratio", "ratio"),
+    "efficiency": ("efficiency", "efficiency"),
+    "cent_dist": ("cent_dist", "center_distance"),
+}
+
+CHART_FORMATS = ("rows", "columns")
+
+# Table of FeedConstants per spec type, built from the lookup tables of each version
+FEED_CONSTANTS_TABLE = "feed_model_constants"
+
 # Flexible spec loader
 def get_all_specs_for(spec_type, feed_model, spec_keys):
     """
@@ -50,71 +69,247 @@ def get_all_specs_for(spec_type, feed_model, spec_keys):
     Raises:
         ValueError: If the spec_type is not recognized or if a lookup fails.    
     """
-    try:
-        getter_func = SPEC_GETTERS[spec_type]
-        results = {}
-        
-        for var_name, (lookup1, lookup2) in spec_keys.items():
-            try:
-                result = getter_func(feed_model, lookup1, lookup2)
-                results[var_name] = result
-            except ValueError as ve:
-                if lookup1 == "fric_torque" or lookup2 == "friction_torque":
-                    results[var_name] = 0
-                else:
-                    raise ValueError(f"Failed to get spec for {var_name} using {lookup1} or {lookup2} in {spec_type}: {ve}")
-        return results
-    except Exception as e:
-        raise
-
-def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
+    # The table schema guarantees its fields (friction torque defaults to 0), so once the
+    # keys are checked against it every value is a plain attribute read
+    fields = SCHEMA_FIELDS[spec_type]
+    spec = find_feed_spec(spec_type, feed_model)
+
+    results = {}
+    for var_name, (lookup1, lookup2) in spec_keys.items():
+        if spec is None or lookup1 not in fields:
+            raise ValueError(
+                f"Failed to get spec for {var_name} using {lookup1} or {lookup2} in {spec_type}: "
+                f"Unknown model or missing field: {lookup2} for model '{feed_model}'"
+            )
+        results[var_name] = getattr(spec, lookup1)
+    return results
+
+# --- Model constants and material terms ---
+class FeedConstants(NamedTuple):
+    """The spec values a feed calculation reads (SPEC_KEYS_SIGMA_FIVE) and what follows from them alone."""
+    max_motor_rpm: float
+    motor_inertia: float
+    motor_peak_torque: float
+    motor_rms_torque: float
+    l_roll: float
+    u_roll: float
+    ratio: float
+    efficiency: float
+    settle_torque: float
+    friction_torque: float
+    watts_lost: float
+    ec: float
+    max_vel: float                  # ft/min
+    velocity: float
+    rpm: float
+    adds_friction_torque: bool      # the sigma five families add friction_torque to the frictional torque
+
+class FeedMaterial(NamedTuple):
+    """The terms of a feed calculation that depend on the sheet's material alone."""
+    density: float
+    material_loop: float
+    loop_mass: float                # material_width * thickness * density * material_loop * 0.5
+
+def derive_feed_constants(spec_type: str, specs: dict) -> FeedConstants:
     """
-    Sigma Five feed calculation service function.
-    
+    FeedConstants from a model's spec values.
+
     Args:
-        data (FeedInput): Input data containing feed parameters.
-        spec_type (str): Type of specification, defaults to "sigma_five".
-    
-    Returns:
-        dict: A dictionary containing calculated feed parameters.
-    
+        spec_type (str): Type of specification.
+        specs (dict): get_all_specs_for(spec_type, model, SPEC_KEYS_SIGMA_FIVE).
+
     Raises:
-        ValueError: If the spec_type is not recognized or if a lookup fails.
+        ArithmeticError: If the specs cannot be combined (a zero ratio or roll).
     """
-    density = get_material_density(data.material_type)
-    str_used = get_selected_str_used(data.type_of_line)
+    # Max Velocity ft/min
+    max_vel = specs["max_motor_rpm"] / specs["ratio"] * (specs["l_roll"] * pi / 720) * 60
 
-    # Dynamically pull specs
-    spec_values = get_all_specs_for(spec_type, data.feed_model, SPEC_KEYS_SIGMA_FIVE)
-
-    max_motor_rpm = spec_values["max_motor_rpm"]
-    motor_inertia = spec_values["motor_inertia"]
-    motor_peak_torque = spec_values["motor_peak_torque"]
-    motor_rms_torque = spec_values["motor_rms_torque"]
-    l_roll = spec_values["l_roll"]
-    u_roll = spec_values["u_roll"]
-    ratio = spec_values["ratio"]
-    efficiency = spec_values["efficiency"]
-    settle_torque = spec_values["settle_torque"]
-    friction_torque = spec_values["friction_torque"]
-    watts_lost = spec_values["watts_lost"]
-    ec = spec_values["ec"]
+    # Velocity and RPM
+    velocity = specs["max_motor_rpm"] / specs["ratio"] * (specs["l_roll"] * pi / 720)
+    rpm = ((velocity * 720) / (specs["u_roll"] * pi)) * specs["ratio"]
+    return FeedConstants(
+        **specs, max_vel=max_vel, velocity=velocity, rpm=rpm, adds_friction_torque="sigma_five" in spec_type,
+    )
 
-    # Max Velocity ft/min
-    max_vel = max_motor_rpm / ratio * (l_roll * pi / 720) * 60
+def compile_feed_constants(data: dict) -> dict:
+    """
+    FeedConstants for every model of every feed spec table.
 
-    # Frictional Torque
-    if "sigma_five" in spec_type:
-        frictional_torque = (u_roll * 0.5 * data.friction_in_die) / ratio + friction_torque
-    else:
-        frictional_torque = (u_roll * 0.5 * data.friction_in_die) / ratio
+    Returns:
+        dict: {spec_type: {model: FeedConstants}}, indexed like the spec records; None for a
+              model whose specs cannot be read or combined (get_feed_constants then raises the
+              same error a calculation did before).
+    """
+    compiled = {}
+    for spec_type, records in compile_feed_specs(data).items():
+        fields = SCHEMA_FIELDS[spec_type]
+        readable = all(lookup1 in fields for lookup1, _ in SPEC_KEYS_SIGMA_FIVE.values())
+        by_record = {}
+        index = {}
+        for key, record in records.items():
+            if id(record) not in by_record:
+                constants = None
+                if readable:
+                    specs = {name: getattr(record, lookup1) for name, (lookup1, _) in SPEC_KEYS_SIGMA_FIVE.items()}
+                    try:
+                        constants = derive_feed_constants(spec_type, specs)
+                    except (ArithmeticError, TypeError):
+                        constants = None
+                by_record[id(record)] = constants
+            index[key] = by_record[id(record)]
+        compiled[spec_type] = index
+    return compiled
+
+register_table(FEED_CONSTANTS_TABLE, "lookup_tables", compile_feed_constants)
+
+def get_feed_constants(spec_type: str, feed_model: str) -> FeedConstants:
+    """
+    FeedConstants of one model (case-insensitive) from the current table version.
+
+    Raises:
+        ValueError: If the spec_type is not recognized or a lookup fails.
+    """
+    index = get_table(FEED_CONSTANTS_TABLE).get(spec_type, {})
+    constants = index.get(feed_model) or index.get(feed_model.upper())
+    if constants is None:
+        # Not compiled: the spec lookup raises the reason, or the derivation does
+        return derive_feed_constants(spec_type, get_all_specs_for(spec_type, feed_model, SPEC_KEYS_SIGMA_FIVE))
+    return constants
+
+def feed_material(data: base_feed_params) -> FeedMaterial:
+    """
+    The material terms of a feed calculation.
 
-    # Loop Torque
+    Raises:
+        ValueError: If the material is unknown.
+    """
+    density = get_material_density(data.material_type)
     if data.loop_pit.lower() == "y" or data.loop_pit.lower() == "yes":
         material_loop = data.material_thickness * 360 * pi * 2
     else:
         material_loop = data.material_thickness * 360 * pi
-    loop_torque = ((data.material_width * data.material_thickness * density * material_loop * 0.5) * u_roll * 0.5) / ratio / efficiency
+    loop_mass = data.material_width * data.material_thickness * density * material_loop * 0.5
+    return FeedMaterial(density, material_loop, loop_mass)
+
+def frictional_torque_of(constants: FeedConstants, friction_in_die: float) -> float:
+    """Frictional torque of a model at the sheet's friction in die."""
+    frictional_torque = (constants.u_roll * 0.5 * friction_in_die) / constants.ratio
+    if constants.adds_friction_torque:
+        frictional_torque = frictional_torque + constants.friction_torque
+    return frictional_torque
+
+def loop_torque_of(constants: FeedConstants, material: FeedMaterial) -> float:
+    """Loop torque of a model for the sheet's material."""
+    return (material.loop_mass * constants.u_roll * 0.5) / constants.ratio / constants.efficiency
+
+def _chart_table(feed_angle_1_values: dict, feed_angle_2_values: dict) -> dict:
+    """Feed chart columns (length, RMS torque, SPM, FPM and index time per feed angle) from columnar time tables."""
+    return {
+        "length": feed_angle_1_values["length"],
+        "rms_torque_fa1": feed_angle_1_values["rms_torque"],
+        "rms_torque_fa2": feed_angle_2_values["rms_torque"],
+        "spm_at_fa1": feed_angle_1_values["strokes_per_minute"],
+        "fpm_fa1": [(length * spm) / 12 for length, spm in zip(feed_angle_1_values["length"], feed_angle_1_values["strokes_per_minute"])],
+        "index_time_fa1": feed_angle_1_values["index_time"],
+        "spm_at_fa2": feed_angle_2_values["strokes_per_minute"],
+        "fpm_fa2": [(length * spm) / 12 for length, spm in zip(feed_angle_2_values["length"], feed_angle_2_values["strokes_per_minute"])],
+        "index_time_fa2": feed_angle_2_values["index_time"],
+    }
+
+def _feed_angle_sweep(feed_angles: tuple, tables: list, rms_torques: list, motor_rms_torque: float) -> dict:
+    """Per-angle RMS torque and check, and each angle's RMS torque and SPM chart columns."""
+    return {
+        "feed_angle": list(feed_angles),
+        "rms_torque": rms_torques,
+        "rms_torque_check": ["OK" if motor_rms_torque > rms_torque else "EXCESS" for rms_torque in rms_torques],
+        "length": tables[0]["length"] if tables else [],
+        "rms_torque_chart": [table["rms_torque"] for table in tables],
+        "spm_chart": [table["strokes_per_minute"] for table in tables],
+    }
+
+def chart_settings(data: base_feed_params):
+    """
+    Resolve the feed chart settings.
+
+    Returns:
+        tuple: (rows including the initial row, "rows" or "columns", length increment).
+
+    Raises:
+        ValueError: If the chart format is unknown.
+    """
+    chart_rows = data.chart_rows if data.chart_rows > 0 else TIME_TABLE_ROWS
+    chart_format = data.chart_format.lower()
+    if chart_format not in CHART_FORMATS:
+        raise ValueError(f"Unknown chart format: {data.chart_format} (expected one of {', '.join(CHART_FORMATS)})")
+    if data.chart_max_length > 0 and chart_rows > 2:
+        length_increment = (data.chart_max_length - data.chart_min_length) / (chart_rows - 2)
+    else:
+        length_increment = data.length_increment
+    return chart_rows, chart_format, length_increment
+
+class FeedSetup(NamedTuple):
+    """Everything a feed calculation derives from its inputs before the time table."""
+    time: time_input
+    max_motor_rpm: float
+    motor_inertia: float
+    max_vel: float
+    settle_time: float
+    ratio: float
+    motor_peak_torque: float
+    motor_rms_torque: float
+    frictional_torque: float
+    loop_torque: float
+    settle_torque: float
+    refl_inertia: float
+    match: float
+    match_check: str
+    rpm: float
+    efficiency: float
+    watts_lost: float
+    ec: float
+    chart_rows: int
+    chart_format: str
+
+def prepare_feed(data: base_feed_params, spec_type="sigma_five", material: FeedMaterial = None) -> FeedSetup:
+    """
+    Look up the feed model's constants and derive the motion inputs for the time table.
+
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+        material (FeedMaterial, optional): feed_material(data), when the caller already has it.
+
+    Returns:
+        FeedSetup: The time table input and the values reported beside it.
+
+    Raises:
+        ValueError: If the spec_type is not recognized, a lookup fails or the chart settings are invalid.
+    """
+    if material is None:
+        material = feed_material(data)
+    density = material.density
+    material_loop = material.material_loop
+    str_used = get_selected_str_used(data.type_of_line)
+
+    # Model constants, compiled with the lookup tables
+    constants = get_feed_constants(spec_type, data.feed_model)
+
+    max_motor_rpm = constants.max_motor_rpm
+    motor_inertia = constants.motor_inertia
+    motor_peak_torque = constants.motor_peak_torque
+    motor_rms_torque = constants.motor_rms_torque
+    ratio = constants.ratio
+    efficiency = constants.efficiency
+    settle_torque = constants.settle_torque
+    watts_lost = constants.watts_lost
+    ec = constants.ec
+    max_vel = constants.max_vel
+    velocity = constants.velocity
+    rpm = constants.rpm
+
+    # Frictional and loop torque: the model's roll terms with the sheet's friction and material
+    frictional_torque = frictional_torque_of(constants, data.friction_in_die)
+    loop_torque = loop_torque_of(constants, material)
 
     # Calculate refl inertia
     inertia = inertia_input(
@@ -148,10 +343,6 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
     else:
         settle_time = 0.06
 
-    # Velocity and RPM 
-    velocity = max_motor_rpm / ratio * (l_roll * pi / 720)
-    rpm = ((velocity * 720) / (u_roll * pi)) * ratio
-
     if spec_type == "sigma_five":
         # Str Max SP
         if str_used.lower() == "y" or str_used.lower() == "yes":
@@ -165,6 +356,9 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
         str_max_sp = 0.0
         str_max_sp_inch = 0.0
 
+    # Chart resolution
+    chart_rows, chart_format, length_increment = chart_settings(data)
+
     # Time calculations
     try:
         time = time_input(
@@ -173,7 +367,7 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
             feed_angle_1 = data.feed_angle_1,
             feed_angle_2 = data.feed_angle_2,
             frictional_torque = frictional_torque,
-            increment = data.length_increment,
+            increment = length_increment,
             loop_torque = loop_torque,
             match = match,
 
@@ -202,16 +396,48 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
     except Exception as time_error:
         raise
 
+    return FeedSetup(
+        time, max_motor_rpm, motor_inertia, max_vel, settle_time, ratio, motor_peak_torque, motor_rms_torque,
+        frictional_torque, loop_torque, settle_torque, refl_inertia, match, match_check, rpm, efficiency,
+        watts_lost, ec, chart_rows, chart_format,
+    )
+
+def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five", feed_angles=None):
+    """
+    Sigma Five feed calculation service function.
+    
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+        feed_angles (sequence, optional): More feed angles to evaluate alongside the sheet's two.
+    
+    Returns:
+        dict: A dictionary containing calculated feed parameters. "table_values" is the feed
+              chart: chart_rows rows from chart_min_length, one dict per row, or with
+              chart_format "columns" one list per field. With feed_angles, "feed_angles" holds
+              per angle the RMS torque and its check (as rms_torque_fa1 is worked out), and the
+              RMS torque and SPM at each chart length.
+    
+    Raises:
+        ValueError: If the spec_type is not recognized, a lookup fails, or the chart settings or a
+            feed angle are invalid.
+    """
+    if feed_angles is not None:
+        feed_angles = check_feed_angles(feed_angles)
+    (time, max_motor_rpm, motor_inertia, max_vel, settle_time, ratio, motor_peak_torque, motor_rms_torque,
+     frictional_torque, loop_torque, settle_torque, refl_inertia, match, match_check, rpm, efficiency,
+     watts_lost, ec, chart_rows, chart_format) = prepare_feed(data, spec_type)
+
     # Calculate time values
     try:
-        time_values = calculate_time(time)
+        time_values = calculate_time(time, rows=chart_rows, columnar=True, feed_angles=feed_angles)
     except Exception as calc_error:
         raise
     
     # Check if time_values contains an error
     if isinstance(time_values, dict) and "error" in time_values:
         # Return minimal valid structure to prevent crash
-        return {
+        result = {
             "max_motor_rpm": max_motor_rpm,
             "motor_inertia": motor_inertia,
             "max_vel": max_vel,
@@ -235,8 +461,14 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
             "acceleration_torque": 0,
             "acceleration_torque_check": "ERROR",
             "feed_check": "ERROR",
-            "table_values": []
+            "table_values": _chart_table(time_values["feed_angle_1"], time_values["feed_angle_2"]) if chart_format == "columns" else []
         }
+        if feed_angles is not None:
+            result["feed_angles"] = dict(
+                _feed_angle_sweep(feed_angles, time_values["feed_angles"], [0] * len(feed_angles), motor_rms_torque),
+                rms_torque_check=["ERROR"] * len(feed_angles),
+            )
+        return result
     
     try:
         feed_angle_1_values = time_values["feed_angle_1"]
@@ -245,29 +477,16 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
         raise
 
     # Table values
-    table_values = []
-    try:
-        if len(feed_angle_1_values) == len(feed_angle_2_values):
-            for i in range(len(feed_angle_1_values)):
-                try:
-                    table_values.append({
-                        "length": feed_angle_1_values[i]["length"],
-                        "rms_torque_fa1": feed_angle_1_values[i]["rms_torque"],
-                        "rms_torque_fa2": feed_angle_2_values[i]["rms_torque"],
-                        "spm_at_fa1": feed_angle_1_values[i]["strokes_per_minute"],
-                        "fpm_fa1":  ((feed_angle_1_values[i]["length"] * feed_angle_1_values[i]["strokes_per_minute"]) / 12),
-                        "index_time_fa1": feed_angle_1_values[i]["index_time"],
-                        "spm_at_fa2": feed_angle_2_values[i]["strokes_per_minute"],
-                        "fpm_fa2":  ((feed_angle_2_values[i]["length"] * feed_angle_2_values[i]["strokes_per_minute"]) / 12),
-                        "index_time_fa2": feed_angle_2_values[i]["index_time"],
-                    })
-                except (IndexError, KeyError, TypeError) as table_error:
-                    raise
-    except Exception as table_gen_error:
-        raise
+    table_values = _chart_table(feed_angle_1_values, feed_angle_2_values)
+    if chart_format == "rows":
+        table_values = [dict(zip(table_values, row)) for row in zip(*table_values.values())]
+
+    # The initial row of each table
+    fa1_acceleration_time = feed_angle_1_values["acceleration_time"][0]
+    fa2_acceleration_time = feed_angle_2_values["acceleration_time"][0]
 
     # Acceleration Torque
-    acceleration_torque = (((refl_inertia * rpm) / (9.55 * feed_angle_1_values[0]["acceleration_time"])) / efficiency) + ((motor_inertia * rpm) / (9.55 * feed_angle_1_values[0]["acceleration_time"]))
+    acceleration_torque = (((refl_inertia * rpm) / (9.55 * fa1_acceleration_time)) / efficiency) + ((motor_inertia * rpm) / (9.55 * fa1_acceleration_time))
 
     if acceleration_torque < motor_peak_torque:
         acceleration_torque_check = "OK"
@@ -284,20 +503,20 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
 
     # RMS Torques
     if spec_type == "sigma_five_pt":
-        rms_torque_fa1_list = [row["rms_torque"] for row in feed_angle_1_values]
-        rms_torque_fa2_list = [row["rms_torque"] for row in feed_angle_2_values]
+        rms_torque_fa1_list = feed_angle_1_values["rms_torque"]
+        rms_torque_fa2_list = feed_angle_2_values["rms_torque"]
 
         rms_torque_fa1 = max(rms_torque_fa1_list) if rms_torque_fa1_list else 0
         rms_torque_fa2 = max(rms_torque_fa2_list) if rms_torque_fa2_list else 0
     else:    
-        rms_torque_fa1 = sqrt((((peak_torque ** 2) * feed_angle_1_values[0]["acceleration_time"]) + 
-                                ((acceleration_torque ** 2) * feed_angle_1_values[0]["acceleration_time"]) + 
-                                ((settle_torque ** 2) * settle_time) + ((loop_torque ** 2) * feed_angle_1_values[0]["dwell_time"])) / 
-                                (feed_angle_1_values[0]["cycle_time"]))
-        rms_torque_fa2 = sqrt((((peak_torque ** 2) * feed_angle_2_values[0]["acceleration_time"]) +
-                                ((acceleration_torque ** 2) * feed_angle_2_values[0]["acceleration_time"]) + 
-                                ((settle_torque ** 2) * settle_time) + ((loop_torque ** 2) * feed_angle_2_values[0]["dwell_time"])) / 
-                                (feed_angle_2_values[0]["cycle_time"]))
+        rms_torque_fa1 = sqrt((((peak_torque ** 2) * fa1_acceleration_time) + 
+                                ((acceleration_torque ** 2) * fa1_acceleration_time) + 
+                                ((settle_torque ** 2) * settle_time) + ((loop_torque ** 2) * feed_angle_1_values["dwell_time"][0])) / 
+                                (feed_angle_1_values["cycle_time"][0]))
+        rms_torque_fa2 = sqrt((((peak_torque ** 2) * fa2_acceleration_time) +
+                                ((acceleration_torque ** 2) * fa2_acceleration_time) + 
+                                ((settle_torque ** 2) * settle_time) + ((loop_torque ** 2) * feed_angle_2_values["dwell_time"][0])) / 
+                                (feed_angle_2_values["cycle_time"][0]))
 
     if motor_rms_torque > rms_torque_fa1:
         rms_torque_fa1_check = "OK"
@@ -314,8 +533,8 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
         match = match,
         motor_inertia = motor_inertia,
         rpm = rpm,
-        acceleration_time = feed_angle_1_values[0]["acceleration_time"],
-        cycle_time = feed_angle_1_values[0]["cycle_time"],
+        acceleration_time = fa1_acceleration_time,
+        cycle_time = feed_angle_1_values["cycle_time"][0],
         watts_lost = watts_lost,
         ec = ec
     )
@@ -330,7 +549,7 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
     else:
         feed_check = ""
 
-    return {
+    result = {
         "max_motor_rpm": max_motor_rpm,
         "motor_inertia": motor_inertia,
         "max_vel": max_vel,
@@ -361,6 +580,20 @@ def run_sigma_five_calculation(data: base_feed_params, spec_type="sigma_five"):
         "table_values": table_values,
     }
 
+    # More feed angles: the same RMS torque as rms_torque_fa1, with the angle-free terms summed once
+    if feed_angles is not None:
+        angle_tables = time_values["feed_angles"]
+        if spec_type == "sigma_five_pt":
+            rms_torques = [max(table["rms_torque"]) if table["rms_torque"] else 0 for table in angle_tables]
+        else:
+            moving = (((peak_torque ** 2) * fa1_acceleration_time) +
+                      ((acceleration_torque ** 2) * fa1_acceleration_time) +
+                      ((settle_torque ** 2) * settle_time))
+            rms_torques = [sqrt((moving + ((loop_torque ** 2) * table["dwell_time"][0])) / (table["cycle_time"][0]))
+                           for table in angle_tables]
+        result["feed_angles"] = _feed_angle_sweep(feed_angles, angle_tables, rms_torques, motor_rms_torque)
+    return result
+
 def run_sigma_five_pt_calculation(data: feed_w_pull_thru_input, spec_type="sigma_five_pt"):
     """
     Sigma Five feed calculation service function with pull-thru specs.
@@ -386,10 +619,11 @@ def run_sigma_five_pt_calculation(data: feed_w_pull_thru_input, spec_type="sigma
     """
     
     # Lookups
-    u_roll = get_sigma_five_pt_specs(data.feed_model, "u_roll", "upper_roll")
-    ratio = get_sigma_five_pt_specs(data.feed_model, "ratio", "ratio")
-    efficiency = get_sigma_five_pt_specs(data.feed_model, "efficiency", "efficiency")
-    cent_dist = get_sigma_five_pt_specs(data.feed_model, "cent_dist", "center_distance")
+    specs = get_all_specs_for("sigma_five_pt", data.feed_model, SPEC_KEYS_PULL_THRU)
+    u_roll = specs["u_roll"]
+    ratio = specs["ratio"]
+    efficiency = specs["efficiency"]
+    cent_dist = specs["cent_dist"]
 
     # Constants
     fpm_buffer = 1.2
@@ -420,7 +654,7 @@ def run_sigma_five_pt_calculation(data: feed_w_pull_thru_input, spec_type="sigma
         "payoff_max_speed": payoff_max_speed,
     }
 
-    final_results = results + calc_results
+    final_results = results | calc_results
 
     return final_results
 
@@ -436,4 +670,153 @@ def run_allen_bradley_calculation(data: base_feed_params, spec_type="allen_bradl
         dict: A dictionary containing calculated feed parameters.
 
     """
-    return run_sigma_five_calculation(data, spec_type)
\ No newline at end of file
+    return run_sigma_five_calculation(data, spec_type)
+
+# --- Inverse queries ---
+def solve_feed_limits(data: base_feed_params, length: float = None, spm: float = None, feed_angle: float = None, spec_type="sigma_five"):
+    """
+    Answer one inverse feed query without building the feed chart.
+
+    Given a length, returns the highest SPM the feed can hold there. Given an SPM, returns
+    the longest length it can index at that speed. See solve_max_spm and solve_max_length
+    in utils.physics.time.
+
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        length (float, optional): Feed length in inches.
+        spm (float, optional): Required strokes per minute.
+        feed_angle (float, optional): Feed angle, defaults to feed_angle_1.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+
+    Returns:
+        dict: max_spm (and max_length for an SPM query), the torques at that point, the
+              motor's ratings and the check that binds.
+
+    Raises:
+        ValueError: Unless exactly one of length and spm is given, or if a lookup fails.
+    """
+    if (length is None) == (spm is None):
+        raise ValueError("A feed limit query needs exactly one of length and spm")
+    setup = prepare_feed(data, spec_type)
+    if length is not None:
+        result = solve_max_spm(setup.time, length, feed_angle)
+    else:
+        result = solve_max_length(setup.time, spm, feed_angle)
+    result.update(motor_peak_torque=setup.motor_peak_torque, motor_rms_torque=setup.motor_rms_torque)
+    return result
+
+def solve_feed_angle(data: base_feed_params, length: float, spm: float, spec_type="sigma_five"):
+    """
+    Smallest feed angle the feed needs to index one length at a press SPM.
+
+    See solve_min_feed_angle in utils.physics.time.
+
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        length (float): Feed length in inches.
+        spm (float): Press strokes per minute.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+
+    Returns:
+        dict: min_feed_angle, the torques at that SPM, the motor's ratings and the check that binds.
+
+    Raises:
+        ValueError: If length or spm is invalid, the feed is not a press feed or a lookup fails.
+    """
+    setup = prepare_feed(data, spec_type)
+    result = solve_min_feed_angle(setup.time, length, spm)
+    result.update(motor_peak_torque=setup.motor_peak_torque, motor_rms_torque=setup.motor_rms_torque)
+    return result
+
+def evaluate_feed_angles(data: base_feed_params, feed_angles: list = None, length: float = None, spm: float = None,
+                         spec_type="sigma_five"):
+    """
+    Evaluate one feed model at many feed angles, and/or find its smallest feed angle.
+
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        feed_angles (list, optional): Feed angles to evaluate, see run_sigma_five_calculation.
+        length (float, optional): Feed length in inches for the minimum feed angle.
+        spm (float, optional): Press strokes per minute for the minimum feed angle.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+
+    Returns:
+        dict: The feed model; with feed_angles, the motor's ratings and "feed_angles" from
+              run_sigma_five_calculation(); with length and spm, "min_feed_angle" from
+              solve_feed_angle().
+
+    Raises:
+        ValueError: Unless feed_angles or both length and spm are given, or if a lookup fails.
+    """
+    if (length is None) != (spm is None):
+        raise ValueError('A minimum feed angle needs both "length" and "spm"')
+    if feed_angles is None and length is None:
+        raise ValueError('Feed angle request needs "feed_angles", or "length" and "spm"')
+    result = {"feed_model": data.feed_model}
+    if feed_angles is not None:
+        calculated = run_sigma_five_calculation(data, spec_type, feed_angles=feed_angles)
+        result.update(
+            motor_peak_torque=calculated["motor_peak_torque"],
+            motor_rms_torque=calculated["motor_rms_torque"],
+            feed_angles=calculated["feed_angles"],
+        )
+    if length is not None:
+        result["min_feed_angle"] = solve_feed_angle(data, length, spm, spec_type=spec_type)
+    return result
+
+def map_feed_limits(data: base_feed_params, lengths: tuple, spm: tuple, feed_angle: float = None, spec_type="sigma_five"):
+    """
+    Feasibility map of one feed model over a grid of feed lengths and SPM.
+
+    See calculate_feasibility_map in utils.physics.time.
+
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        lengths (tuple): (first, last, steps) feed lengths in inches.
+        spm (tuple): (first, last, steps) strokes per minute.
+        feed_angle (float, optional): Feed angle, defaults to feed_angle_1.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+
+    Returns:
+        dict: The map, with the feed model and the motor's ratings.
+
+    Raises:
+        ValueError: If an axis is invalid or a lookup fails.
+    """
+    setup = prepare_feed(data, spec_type)
+    result = calculate_feasibility_map(setup.time, lengths, spm, feed_angle)
+    result.update(
+        feed_model=data.feed_model,
+        motor_peak_torque=setup.motor_peak_torque,
+        motor_rms_torque=setup.motor_rms_torque,
+        str_max_sp_inch=setup.time.str_max_sp_inch,
+    )
+    return result
+
+def simulate_feed_shift(data: base_feed_params, jobs, feed_angle: float = None, step: float = DEFAULT_TIME_STEP,
+                        thermal_time_constant: float = DEFAULT_THERMAL_TIME_CONSTANT, spec_type="sigma_five"):
+    """
+    Duty cycle of one feed model over a production schedule.
+
+    See simulate_duty_cycle in utils.physics.duty_cycle.
+
+    Args:
+        data (FeedInput): Input data containing feed parameters.
+        jobs (sequence): (length in inches, SPM, strokes) per job, run in order.
+        feed_angle (float, optional): Feed angle, defaults to feed_angle_1.
+        step (float): Longest time step in seconds.
+        thermal_time_constant (float): Winding thermal time constant in seconds.
+        spec_type (str): Type of specification, defaults to "sigma_five".
+
+    Returns:
+        dict: The simulated shift, with the feed model.
+
+    Raises:
+        ValueError: If a job or setting is invalid or a lookup fails.
+    """
+    setup = prepare_feed(data, spec_type)
+    specs = get_feed_constants(spec_type, data.feed_model)._asdict()
+    result = simulate_duty_cycle(setup.time, specs, jobs, feed_angle=feed_angle, step=step,
+                                 thermal_time_constant=thermal_time_constant)
+    result["feed_model"] = data.feed_model
+    return result
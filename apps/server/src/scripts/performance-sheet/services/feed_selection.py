@@ -0,0 +1,267 @@
+"""
+Feed model selection service module
+
+rank_feed_models evaluates every model of the sigma five, sigma five pull-thru
+and Allen-Bradley spec tables for one sheet in a single batched pass and ranks
+them by the headroom they leave on peak, RMS and acceleration torque, or by
+match ratio. It reproduces the checks of run_sigma_five_calculation for each
+model. The sheet's material terms and chart settings are computed once, each
+model's constants come from the compiled FeedConstants table, and reflected
+inertia (from the compiled coefficients) and each check are one NumPy
+expression over all models. Pull-thru models are rated
+on the highest RMS torque in their time table, as in the calculation, and those
+tables are computed together as a (models x lengths) array.
+
+"""
+
+import numpy as np
+from models import base_feed_params, inertia_input
+from utils.lookup_tables import FEED_SPEC_TYPES, list_feed_models
+from utils.physics.inertia import (
+    INERTIA_ERROR, calculate_total_refl_inertia, get_inertia_coefficients, material_roll_diameter
+)
+from services.feed_calculations import chart_settings, feed_material, get_feed_constants
+
+# Sort orders: the tightest of the three torque margins, one margin, or the lowest match ratio
+RANK_KEYS = ("margin", "peak_torque", "rms_torque", "acceleration_torque", "match")
+
+def _reflected_inertia(data: base_feed_params, density: float, models: list) -> list:
+    # calculate_total_refl_inertia for every model: compiled coefficients are evaluated together,
+    # models without them (and non-finite results) go through the element walk
+    sheet = inertia_input(
+        feed_model = "",
+        width = data.width,
+        thickness = data.material_thickness,
+        density = density,
+        press_bed_length = data.press_bed_length,
+        material_loop = data.material_width,
+        ratio = 1.0,
+        efficiency = 1.0,
+        roll_width = data.roll_width,
+        material_width = data.material_width
+    )
+
+    def walk(feed_model, constants):
+        return calculate_total_refl_inertia(sheet.copy(update={
+            "feed_model": feed_model, "ratio": float(constants.ratio), "efficiency": float(constants.efficiency),
+        }))
+
+    results = [None] * len(models)
+    batched = []
+    for i, (_, feed_model, constants) in enumerate(models):
+        try:
+            coefficients = get_inertia_coefficients(feed_model, sheet.roll_width)
+        except AttributeError:
+            coefficients = None
+        if coefficients is None:
+            results[i] = walk(feed_model, constants)
+            continue
+        material_dia = material_roll_diameter(coefficients, feed_model)
+        if sheet.width < 0 or constants.ratio == 0 or material_dia is None:
+            results[i] = INERTIA_ERROR
+            continue
+        batched.append((i, coefficients, material_dia))
+    if not batched:
+        return results
+
+    fixed, fixed_per_width, driven, driven_per_width = (
+        np.array([float(c[field]) for _, c, _ in batched]) for field in range(4)
+    )
+    material_dia = np.array([float(dia) for _, _, dia in batched])
+    ratio = np.array([float(models[i][2].ratio) for i, _, _ in batched])
+    with np.errstate(all="ignore"):
+        ratio_squared = np.float_power(ratio, 2)
+        material_inertia = ((sheet.material_width * sheet.thickness * sheet.press_bed_length * sheet.density) / 32.3) * (np.float_power(material_dia * 0.5, 2) / 144) * 12
+        inertia = ((fixed + (fixed_per_width * sheet.width))
+                   + ((driven + (driven_per_width * sheet.width)) / ratio_squared)
+                   + (material_inertia / ratio_squared))
+    for (i, _, _), value, finite in zip(batched, inertia.tolist(), np.isfinite(inertia).tolist()):
+        _, feed_model, constants = models[i]
+        results[i] = value if finite else walk(feed_model, constants)
+    return results
+
+def _model_inputs(data: base_feed_params, feed_types, density: float):
+    # Specs and reflected inertia per model; a model that fails here is reported, not ranked
+    models, errors = [], []
+    for spec_type in feed_types:
+        for feed_model in list_feed_models(spec_type):
+            try:
+                constants = get_feed_constants(spec_type, feed_model)
+            except (ValueError, ArithmeticError) as e:
+                errors.append({"feed_type": spec_type, "feed_model": feed_model, "error": str(e)})
+                continue
+            models.append((spec_type, feed_model, constants))
+
+    rows = []
+    for (spec_type, feed_model, constants), refl_inertia in zip(models, _reflected_inertia(data, density, models)):
+        if isinstance(refl_inertia, str):
+            errors.append({"feed_type": spec_type, "feed_model": feed_model, "error": refl_inertia})
+            continue
+        rows.append((spec_type, feed_model, constants, refl_inertia))
+    return rows, errors
+
+def _table_rms_max(data: base_feed_params, c: dict, init_rms):
+    # Highest RMS torque over each model's time table (models x lengths), same expressions as calculate_values
+    rows, _, increment = chart_settings(data)
+    steps = np.arange(rows - 1, dtype=float)
+    lengths = data.chart_min_length + (increment * steps)
+    lengths[0] = data.chart_min_length
+    lengths = lengths[None, :]
+
+    init_length = c["init_length"][:, None]
+    running = lengths > init_length
+    short_lengths = np.where(running, 0.0, lengths)
+    long_lengths = np.where(running, lengths, init_length)
+    acceleration_time = np.where(running, c["acceleration_time"][:, None], np.sqrt((short_lengths / 12) / data.acceleration_rate))
+    runtime = np.where(running, ((long_lengths - init_length) / 12) / c["velocity"][:, None], 0.0)
+
+    rpm = c["rpm"][:, None]
+    efficiency = c["efficiency"][:, None]
+    acceleration_torque = (((c["refl_inertia"][:, None] * rpm) / (9.55 * acceleration_time)) / efficiency) + ((c["motor_inertia"][:, None] * rpm) / (9.55 * acceleration_time))
+    frictional_torque = c["frictional_torque"][:, None]
+    loop_torque = c["loop_torque"][:, None]
+    settle_time = c["settle_time"][:, None]
+    settle_torque = c["settle_torque"][:, None]
+    peak_torque = acceleration_torque + frictional_torque + loop_torque
+    index_time = (acceleration_time * 2) + runtime + settle_time
+
+    maxima = []
+    for feed_angle, init in zip((data.feed_angle_1, data.feed_angle_2), init_rms):
+        cycle_time = _cycle_time(data, index_time, feed_angle)
+        dwell_time = cycle_time - index_time
+        rms_torque = np.sqrt((
+            (np.float_power(peak_torque, 2) * acceleration_time)
+            + (np.float_power(acceleration_torque, 2) * acceleration_time)
+            + (np.float_power(frictional_torque + loop_torque, 2) * runtime)
+            + (np.float_power(settle_torque, 2) * settle_time)
+            + (np.float_power(loop_torque, 2) * dwell_time)
+        ) / cycle_time)
+        maxima.append(np.maximum(init, rms_torque.max(axis=1)))
+    return maxima
+
+def _cycle_time(data: base_feed_params, index_time, feed_angle):
+    application = data.application.lower() if isinstance(data.application, str) else "press feed"
+    if application == "press feed":
+        return index_time * (360 / (feed_angle if feed_angle > 0 else 180.0))
+    return index_time + feed_angle
+
+def rank_feed_models(data: base_feed_params, feed_types=FEED_SPEC_TYPES, sort_by: str = "margin") -> dict:
+    """
+    Evaluate every feed model for one sheet and rank them.
+
+    Args:
+        data (FeedInput): The sheet's feed parameters; feed_type and feed_model are ignored.
+        feed_types (sequence): Spec tables to draw models from, default all three.
+        sort_by (str): One of RANK_KEYS. Torque margins rank from most to least headroom,
+            match from the lowest ratio up. Models passing every check come first.
+
+    Returns:
+        dict: "models": one entry per model in rank order, with its checks, torques, motor
+              ratings and margins ((rating - torque) / rating; "margin" is the smallest of
+              the three); "errors": models that could not be evaluated and why.
+
+    Raises:
+        ValueError: If sort_by or a feed type is not recognized.
+    """
+    if sort_by not in RANK_KEYS:
+        raise ValueError(f"Unknown ranking: {sort_by} (expected one of {', '.join(RANK_KEYS)})")
+    unknown = [spec_type for spec_type in feed_types if spec_type not in FEED_SPEC_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown feed type: {', '.join(unknown)}")
+
+    # Shared by every model
+    material = feed_material(data)
+    rows, errors = _model_inputs(data, feed_types, material.density)
+    if not rows:
+        return {"sort_by": sort_by, "models": [], "errors": errors}
+
+    def column(field):
+        return np.array([float(getattr(constants, field)) for _, _, constants, _ in rows])
+
+    motor_inertia, motor_peak_torque, motor_rms_torque = column("motor_inertia"), column("motor_peak_torque"), column("motor_rms_torque")
+    u_roll, ratio, efficiency = column("u_roll"), column("ratio"), column("efficiency")
+    settle_torque, velocity, rpm = column("settle_torque"), column("velocity"), column("rpm")
+    friction_torque = np.array([
+        float(constants.friction_torque) if constants.adds_friction_torque else 0.0 for _, _, constants, _ in rows
+    ])
+    is_pull_thru = np.array([spec_type == "sigma_five_pt" for spec_type, _, _, _ in rows])
+    refl_inertia = np.array([float(refl) for _, _, _, refl in rows])
+
+    with np.errstate(all="ignore"):
+        frictional_torque = ((u_roll * 0.5 * data.friction_in_die) / ratio) + friction_torque
+        loop_torque = (material.loop_mass * u_roll * 0.5) / ratio / efficiency
+        match = refl_inertia / motor_inertia
+        settle_time = np.where(match < 10, 0.035, 0.06)
+
+        # The initial row of the time table, which the checks use
+        acceleration_time = velocity / data.acceleration_rate
+        init_length = ((velocity / data.acceleration_rate) * velocity) * 12
+        acceleration_torque = (((refl_inertia * rpm) / (9.55 * acceleration_time)) / efficiency) + ((motor_inertia * rpm) / (9.55 * acceleration_time))
+        peak_torque = acceleration_torque + frictional_torque + loop_torque
+        runtime = np.where(
+            ((init_length - ((motor_peak_torque * acceleration_time) * 12) / 12) / motor_peak_torque) > 0,
+            ((init_length - ((motor_peak_torque * acceleration_time) * 12)) / 12) / motor_peak_torque,
+            0.0,
+        )
+        index_time = (acceleration_time * 2) + runtime + settle_time
+
+        rms_by_angle = []
+        init_rms_by_angle = []
+        for feed_angle in (data.feed_angle_1, data.feed_angle_2):
+            cycle_time = _cycle_time(data, index_time, feed_angle)
+            dwell_time = cycle_time - index_time
+            moving = (np.float_power(peak_torque, 2) * acceleration_time) + (np.float_power(acceleration_torque, 2) * acceleration_time)
+            rms_by_angle.append(np.sqrt((moving + (np.float_power(settle_torque, 2) * settle_time) + (np.float_power(loop_torque, 2) * dwell_time)) / cycle_time))
+            init_rms_by_angle.append(np.sqrt((
+                moving + (np.float_power(frictional_torque + loop_torque, 2) * runtime)
+                + (np.float_power(settle_torque, 2) * settle_time) + (np.float_power(loop_torque, 2) * dwell_time)
+            ) / cycle_time))
+
+        if is_pull_thru.any():
+            table_rms = _table_rms_max(data, {
+                "init_length": init_length, "acceleration_time": acceleration_time, "velocity": velocity, "rpm": rpm,
+                "efficiency": efficiency, "refl_inertia": refl_inertia, "motor_inertia": motor_inertia,
+                "frictional_torque": frictional_torque, "loop_torque": loop_torque, "settle_time": settle_time,
+                "settle_torque": settle_torque,
+            }, init_rms_by_angle)
+            rms_by_angle = [np.where(is_pull_thru, table, rms) for table, rms in zip(table_rms, rms_by_angle)]
+        rms_torque_fa1, rms_torque_fa2 = rms_by_angle
+
+        peak_margin = (motor_peak_torque - peak_torque) / motor_peak_torque
+        acceleration_margin = (motor_peak_torque - acceleration_torque) / motor_peak_torque
+        rms_margin = (motor_rms_torque - np.maximum(rms_torque_fa1, rms_torque_fa2)) / motor_rms_torque
+        margin = np.minimum(np.minimum(peak_margin, rms_margin), acceleration_margin)
+
+    feed_ok = (
+        (acceleration_torque < motor_peak_torque) & (motor_peak_torque > peak_torque)
+        & (motor_rms_torque > rms_torque_fa1) & (motor_rms_torque > rms_torque_fa2)
+        & (data.width >= data.material_width)
+    )
+    finite = np.isfinite(margin) & np.isfinite(match)
+
+    columns = {
+        "match": match, "peak_torque": peak_torque, "acceleration_torque": acceleration_torque,
+        "rms_torque_fa1": rms_torque_fa1, "rms_torque_fa2": rms_torque_fa2,
+        "motor_peak_torque": motor_peak_torque, "motor_rms_torque": motor_rms_torque,
+        "peak_torque_margin": peak_margin, "rms_torque_margin": rms_margin,
+        "acceleration_torque_margin": acceleration_margin, "margin": margin,
+    }
+    values = {key: array.tolist() for key, array in columns.items()}
+    models = []
+    for i, ((spec_type, feed_model, _, _), is_finite, is_ok) in enumerate(zip(rows, finite.tolist(), feed_ok.tolist())):
+        if not is_finite:
+            errors.append({"feed_type": spec_type, "feed_model": feed_model, "error": "Time calculations failed"})
+            continue
+        entry = {"feed_type": spec_type, "feed_model": feed_model, "feed_check": "OK" if is_ok else ""}
+        entry.update((key, column_values[i]) for key, column_values in values.items())
+        entry["match_check"] = "OK" if entry["match"] < 10 else "CAUTION" if entry["match"] < 12 else "EXCESS"
+        models.append(entry)
+
+    if sort_by == "match":
+        models.sort(key=lambda entry: (entry["feed_check"] != "OK", entry["match"]))
+    else:
+        key = sort_by if sort_by == "margin" else f"{sort_by}_margin"
+        models.sort(key=lambda entry: (entry["feed_check"] != "OK", -entry[key]))
+    for rank, entry in enumerate(models, 1):
+        entry["rank"] = rank
+    return {"sort_by": sort_by, "models": models, "errors": errors}
@@ -0,0 +1,47 @@
+"""
+Deferred imports for the feed and shear calculators.
+
+A sheet uses at most one feed variant and one shear model, so those modules
+(and the feed services and physics helpers behind them) are only imported the
+first time a sheet selects them.
+
+"""
+
+import functools
+import importlib
+
+# Calculator name -> (module, function)
+CALCULATORS = {
+    "sigma_five": ("calculations.feeds.sigma_five_feed", "calculate_sigma_five"),
+    "sigma_five_pt": ("calculations.feeds.sigma_five_feed_with_pt", "calculate_sigma_five_pt"),
+    "allen_bradley": ("calculations.feeds.allen_bradley_mpl_feed", "calculate_allen_bradley"),
+    "single_rake_hyd_shear": ("calculations.shears.single_rake_hyd_shear", "calculate_single_rake_hyd_shear"),
+    "bow_tie_hyd_shear": ("calculations.shears.bow_tie_hyd_shear", "calculate_bow_tie_hyd_shear"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load_calculator(name: str):
+    """
+    Import a calculator on first use.
+
+    Args:
+        name (str): One of CALCULATORS, e.g. "sigma_five".
+
+    Returns:
+        callable: The calculator function.
+    """
+    module_name, function_name = CALCULATORS[name]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def preload_calculators() -> None:
+    """Import every calculator, load the feed model configs and NumPy now (long-lived workers)."""
+    for name in CALCULATORS:
+        load_calculator(name)
+
+    from utils.physics.inertia import preload_model_configs
+    preload_model_configs()
+
+    from utils.physics.time import preload_time_engine
+    preload_time_engine()
@@ -0,0 +1,447 @@
+"""
+Declarative mapping from performance sheet paths to calculator inputs.
+
+INPUT_SPEC lists, for every calculator input group, which sheet path each field
+comes from, how the raw value is converted and which DEFAULTS entry it falls
+back to. compile_spec() turns the spec into an extractor that walks the sheet
+once, converts every distinct (path, type, default) once, and hands each
+section its typed inputs.
+
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+from utils.shared import DEFAULTS
+
+
+# --- Conversion helpers ---
+def str2bool(val):
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, (int, float)):
+        return bool(val)
+    if val is None:
+        return None
+    return str(val).strip().lower() in ("yes", "true", "1", "y")
+
+def parse_float(val, default=None):
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return default
+
+def parse_int(val, default=None):
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return default
+
+def parse_str(val, default=None):
+    if val is None:
+        return default
+    return str(val)
+
+
+# Marks a path that is absent from the sheet (as opposed to present with a null value)
+MISSING = object()
+
+def _default(category, key):
+    # Looked up on use, like the per-field helpers did, so a missing entry only fails its section
+    return DEFAULTS[category][key]
+
+def _convert_float(value, category, key):
+    parsed = parse_float(None if value is MISSING else value)
+    return _default(category, key) if parsed is None else parsed
+
+def _convert_int(value, category, key):
+    parsed = parse_int(None if value is MISSING else value)
+    return _default(category, key) if parsed is None else parsed
+
+def _convert_str(value, category, key):
+    if value is MISSING or value is None:
+        return _default(category, key)
+    return str(value)
+
+def _convert_bool(value, category, key):
+    if value is MISSING or value is None:
+        return _default(category, key)
+    return bool(value)
+
+def _convert_upper_str(value, category, key):
+    # Empty values fall back to the default as well, then everything is upper-cased
+    return ((None if value is MISSING else value) or _default(category, key)).upper()
+
+def _convert_bool_flag(value, category, key):
+    # "Yes"/"No"-style flag; a false flag falls back to the default
+    return str2bool(None if value is MISSING else value) or _default(category, key)
+
+def _convert_lower_str(value, category, key):
+    # Only an absent path becomes ""; an explicit null is an error, as before
+    return ("" if value is MISSING else value).lower()
+
+def _convert_raw(value, category, key):
+    return None if value is MISSING else value
+
+CONVERTERS = {
+    "float": _convert_float,
+    "int": _convert_int,
+    "str": _convert_str,
+    "bool": _convert_bool,
+    "upper_str": _convert_upper_str,
+    "bool_flag": _convert_bool_flag,
+    "lower_str": _convert_lower_str,
+    "raw": _convert_raw,
+}
+
+
+# --- Specification ---
+class Field(NamedTuple):
+    path: Tuple[str, ...]
+    kind: str
+    default_category: Optional[str] = None
+    default_key: Optional[str] = None
+
+def field(path: str, kind: str, default: str = None) -> Field:
+    """
+    Describe one calculator input.
+
+    Args:
+        path (str): Dotted path in the sheet, e.g. "common.material.coilWidth".
+        kind (str): Conversion, one of CONVERTERS.
+        default (str, optional): "category.key" entry in DEFAULTS used when the value is missing.
+    """
+    if kind not in CONVERTERS:
+        raise ValueError(f"Unknown field type: {kind}")
+    category, key = default.split(".", 1) if default else (None, None)
+    return Field(tuple(path.split(".")), kind, category, key)
+
+def _rfq_point(point):
+    return {
+        "feed_length": field(f"common.feedRates.{point}.length", "float", "feed.rate"),
+        "spm": field(f"common.feedRates.{point}.spm", "float", "feed.rate"),
+    }
+
+def _feed_base(feed_rate_path):
+    # Fields shared by every feed variant; only the feed rate source differs
+    return {
+        "width": field("feed.feed.machineWidth", "int", "feed.machine_width"),
+        "loop_pit": field("common.equipment.feed.loopPit", "str", "feed.loop_pit"),
+        "material_type": field("common.material.materialType", "upper_str", "material.material_type"),
+        "application": field("feed.feed.application", "str", "feed.application"),
+        "type_of_line": field("common.equipment.feed.typeOfLine", "str", "feed.type_of_line"),
+        "roll_width": field("feed.feed.fullWidthRolls", "str", "feed.roll_width"),
+        "feed_rate": field(feed_rate_path, "float", "feed.rate"),
+        "material_width": field("common.material.coilWidth", "int", "material.coil_width"),
+        "material_thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "press_bed_length": field("common.press.bedLength", "int", "press.bed_length"),
+        "friction_in_die": field("feed.feed.frictionInDie", "float", "feed.friction_in_die"),
+        "acceleration_rate": field("feed.feed.accelerationRate", "float", "feed.acceleration_rate"),
+        "chart_min_length": field("feed.feed.chartMinLength", "float", "feed.chart_min_length"),
+        "length_increment": field("feed.feed.lengthIncrement", "float", "feed.length_increment"),
+        "chart_rows": field("feed.feed.chartRows", "int", "feed.chart_rows"),
+        "chart_max_length": field("feed.feed.chartMaxLength", "float", "feed.chart_max_length"),
+        "chart_format": field("feed.feed.chartFormat", "str", "feed.chart_format"),
+        "feed_angle_1": field("feed.feed.feedAngle1", "float", "feed.feed_angle_1"),
+        "feed_angle_2": field("feed.feed.feedAngle2", "float", "feed.feed_angle_2"),
+    }
+
+INPUT_SPEC = {
+    # RFQ
+    "rfq_average": _rfq_point("average"),
+    "rfq_min": _rfq_point("min"),
+    "rfq_max": _rfq_point("max"),
+
+    # Material specs
+    "material_specs": {
+        "material_type": field("common.material.materialType", "str", "material.material_type"),
+        "material_thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "yield_strength": field("common.material.maxYieldStrength", "float", "material.yield_strength"),
+        "coil_width": field("common.material.coilWidth", "float", "material.coil_width"),
+        "coil_weight": field("common.material.coilWeight", "float", "material.coil_weight"),
+        "coil_id": field("common.coil.coilID", "float", "material.coil_id"),
+        "feed_direction": field("common.equipment.feed.direction", "str", "feed.direction"),
+        "controls_level": field("common.equipment.feed.controlsLevel", "str", "feed.controls_level"),
+        "type_of_line": field("common.equipment.feed.typeOfLine", "str", "feed.type_of_line"),
+        "feed_controls": field("common.equipment.feed.controls", "str", "feed.controls"),
+        "passline": field("common.equipment.feed.passline", "float", "feed.passline"),
+        "reel_backplate": field("common.equipment.reel.backplate.diameter", "float", "reel.backplate_diameter"),
+        "reel_style": field("materialSpecs.reel.style", "str", "reel.style"),
+        "light_gauge_non_marking": field("common.equipment.feed.lightGuageNonMarking", "bool_flag", "feed.light_gauge_non_marking"),
+        "non_marking": field("common.equipment.feed.nonMarking", "bool_flag", "feed.non_marking"),
+    },
+
+    # Reel drive
+    "reel_drive": {
+        "model": field("common.equipment.reel.model", "str", "reel.model"),
+        "material_type": field("common.material.materialType", "upper_str", "material.material_type"),
+        "coil_id": field("common.coil.coilID", "float", "material.coil_id"),
+        "coil_od": field("common.coil.maxCoilOD", "float", "material.max_coil_od"),
+        "reel_width": field("common.equipment.reel.width", "float", "reel.width"),
+        "backplate_diameter": field("common.equipment.reel.backplate.diameter", "float", "reel.backplate_diameter"),
+        "motor_hp": field("common.equipment.reel.horsepower", "float", "reel.horsepower"),
+        "type_of_line": field("common.equipment.feed.typeOfLine", "str", "feed.type_of_line"),
+        "required_max_fpm": field("common.material.reqMaxFPM", "float", "feed.rate"),
+    },
+
+    # TDDBHD
+    "tddbhd_reel": {
+        "reel_model": field("common.equipment.reel.model", "str", "reel.model"),
+    },
+    # Only read for reels that support a threading drive choice (not CPR-040)
+    "tddbhd_threading": {
+        "air_clutch": field("tddbhd.reel.threadingDrive.airClutch", "bool_flag", "reel.threading_drive_air_clutch"),
+        "hyd_threading_drive": field("tddbhd.reel.threadingDrive.hydThreadingDrive", "str", "reel.threading_drive_hyd"),
+    },
+    "tddbhd": {
+        "type_of_line": field("common.equipment.feed.typeOfLine", "str", "feed.type_of_line"),
+        "motor_hp": field("common.equipment.reel.horsepower", "float", "reel.horsepower"),
+        "yield_strength": field("common.material.maxYieldStrength", "float", "material.yield_strength"),
+        "thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "width": field("common.material.coilWidth", "float", "material.coil_width"),
+        "coil_id": field("common.coil.coilID", "float", "material.coil_id"),
+        "coil_od": field("common.coil.maxCoilOD", "float", "material.max_coil_od"),
+        "coil_weight": field("common.material.coilWeight", "float", "material.coil_weight"),
+        "confirmed_min_width": field("tddbhd.reel.confirmedMinWidth", "bool", "reel.confirmed_min_width"),
+        "decel": field("tddbhd.reel.requiredDecelRate", "float", "reel.required_decel_rate"),
+        "friction": field("tddbhd.reel.coefficientOfFriction", "float", "reel.coefficient_of_friction"),
+        "air_pressure": field("tddbhd.reel.airPressureAvailable", "float", "reel.air_pressure_available"),
+        "brake_qty": field("tddbhd.reel.dragBrake.quantity", "int", "reel.drag_brake_quantity"),
+        "brake_model": field("tddbhd.reel.dragBrake.model", "str", "reel.drag_brake_model"),
+        "cylinder": field("tddbhd.reel.holddown.cylinder", "str", "reel.holddown_cylinder"),
+        "hold_down_assy": field("tddbhd.reel.holddown.assy", "str", "reel.holddown_assy"),
+        "material_type": field("common.material.materialType", "upper_str", "material.material_type"),
+        "reel_width": field("common.equipment.reel.width", "float", "reel.width"),
+        "backplate_diameter": field("common.equipment.reel.backplate.diameter", "float", "reel.backplate_diameter"),
+    },
+
+    # Str utility
+    "str_utility_coil": {
+        # Fallback when material specs did not calculate a coil OD
+        "max_coil_od": field("coil.maxCoilOD", "float", "material.max_coil_od"),
+    },
+    "str_utility": {
+        "max_coil_weight": field("common.coil.maxCoilWeight", "float", "material.max_coil_weight"),
+        "coil_id": field("common.coil.coilID", "float", "material.coil_id"),
+        "coil_width": field("common.material.coilWidth", "float", "material.coil_width"),
+        "material_thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "yield_strength": field("common.material.maxYieldStrength", "float", "material.yield_strength"),
+        "material_type": field("common.material.materialType", "upper_str", "material.material_type"),
+        "str_model": field("common.equipment.straightener.model", "str", "straightener.model"),
+        "str_width": field("common.equipment.straightener.width", "float", "straightener.width"),
+        "horsepower": field("strUtility.straightener.horsepower", "float", "straightener.horsepower"),
+        "feed_rate": field("strUtility.straightener.feedRate", "float", "feed.rate"),
+        "max_feed_rate": field("strUtility.straightener.feedRate", "float", "feed.rate"),
+        "auto_brake_compensation": field("strUtility.straightener.autoBrakeCompensation", "str", "straightener.auto_brake_compensation"),
+        "acceleration": field("strUtility.straightener.acceleration", "float", "straightener.acceleration"),
+        "num_str_rolls": field("common.equipment.straightener.numberOfRolls", "int", "straightener.number_of_rolls"),
+    },
+
+    # Roll str backbend
+    "roll_str_backbend": {
+        "yield_strength": field("common.material.maxYieldStrength", "float", "material.yield_strength"),
+        "thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "width": field("common.material.coilWidth", "float", "material.coil_width"),
+        "material_type": field("common.material.materialType", "upper_str", "material.material_type"),
+        "material_thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "str_model": field("common.equipment.straightener.model", "str", "straightener.model"),
+        "num_str_rolls": field("common.equipment.straightener.numberOfRolls", "int", "straightener.number_of_rolls"),
+    },
+
+    # Feed: selection first, then one group per feed variant
+    "feed_select": {
+        "is_pull_thru": field("feed.feed.pullThru.isPullThru", "str", "feed.pull_thru"),
+        "feed_type": field("common.equipment.feed.type", "str", "feed.type"),
+        "controls_level": field("common.equipment.feed.controlsLevel", "raw"),
+        "feed_model": field("common.equipment.feed.model", "raw"),
+    },
+    "feed_sigma_five_pt": {
+        **_feed_base("common.feedRates.average.fpm"),
+        "straightening_rolls": field("feed.feed.pullThru.straightenerRolls", "int", "feed.straightening_rolls"),
+        "yield_strength": field("common.material.maxYieldStrength", "float", "material.yield_strength"),
+        "str_pinch_rolls": field("feed.feed.pullThru.pinchRolls", "str", "feed.pinch_rolls"),
+        "req_max_fpm": field("feed.feed.strMaxSpeed", "float", "feed.rate"),
+    },
+    "feed_sigma_five": _feed_base("feed.feed.strMaxSpeed"),
+    "feed_allen_bradley": _feed_base("common.feedRates.average.fpm"),
+
+    # Shear: both shear models take the same inputs
+    "shear_select": {
+        "shear_model": field("shear.shear.model", "lower_str"),
+    },
+    "shear": {
+        "max_material_thickness": field("common.material.materialThickness", "float", "material.material_thickness"),
+        "coil_width": field("common.material.coilWidth", "float", "material.coil_width"),
+        "material_tensile": field("shear.shear.strength", "float", "shear.strength"),
+        "rake_of_blade": field("shear.shear.blade.rakeOfBladePerFoot", "float", "shear.rake_of_blade_per_foot"),
+        "overlap": field("shear.shear.blade.overlap", "float", "shear.overlap"),
+        "blade_opening": field("shear.shear.blade.bladeOpening", "float", "shear.blade_opening"),
+        "percent_of_penetration": field("shear.shear.blade.percentOfPenetration", "float", "shear.percent_of_penetration"),
+        "bore_size": field("shear.shear.cylinder.boreSize", "float", "shear.bore_size"),
+        "rod_dia": field("shear.shear.cylinder.rodDiameter", "float", "shear.rod_diameter"),
+        "stroke": field("shear.shear.cylinder.stroke", "float", "shear.stroke"),
+        "pressure": field("shear.shear.hydraulic.pressure", "float", "shear.hydraulic_pressure"),
+        "time_for_down_stroke": field("shear.shear.time.forDownwardStroke", "float", "shear.time_for_down_stroke"),
+        "dwell_time": field("shear.shear.time.dwellTime", "float", "shear.dwell_time"),
+    },
+}
+
+# Input groups read by each section of main.calculate()
+SECTION_GROUPS = {
+    "rfq": ("rfq_average", "rfq_min", "rfq_max"),
+    "material_specs": ("material_specs",),
+    "reel_drive": ("reel_drive",),
+    "tddbhd": ("tddbhd_reel", "tddbhd_threading", "tddbhd"),
+    "str_utility": ("str_utility_coil", "str_utility"),
+    "roll_str_backbend": ("roll_str_backbend",),
+    "feed": ("feed_select", "feed_sigma_five_pt", "feed_sigma_five", "feed_allen_bradley"),
+    "shear": ("shear_select", "shear"),
+}
+
+def section_input_paths(spec=None, section_groups=None):
+    """Dotted sheet paths read by each section, in first-use order"""
+    spec = spec or INPUT_SPEC
+    section_groups = section_groups or SECTION_GROUPS
+    paths = {}
+    for section, groups in section_groups.items():
+        seen = []
+        for group in groups:
+            for f in spec[group].values():
+                dotted = ".".join(f.path)
+                if dotted not in seen:
+                    seen.append(dotted)
+        paths[section] = tuple(seen)
+    return paths
+
+
+# --- Compiled extractor ---
+class _Failed:
+    """A conversion that raised; re-raised when its group is read"""
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+class ExtractedInputs:
+    """Typed input groups for one sheet, as produced by CompiledSpec.extract()"""
+    __slots__ = ("_groups", "_errors")
+
+    def __init__(self, groups, errors):
+        self._groups = groups
+        self._errors = errors
+
+    def group(self, name):
+        """
+        Typed inputs of one group.
+
+        Raises:
+            Exception: Whatever the first failing conversion in the group raised, so the
+                section reading it reports the same error as before.
+        """
+        if name in self._errors:
+            raise self._errors[name]
+        return dict(self._groups[name])
+
+    def __getstate__(self):
+        return self._groups, self._errors
+
+    def __setstate__(self, state):
+        self._groups, self._errors = state
+
+class CompiledSpec:
+    """
+    Extractor built once from a spec.
+
+    Every distinct path is stored once in a trie, so a sheet is walked a single time
+    however many fields read the same value, and every distinct (path, type, default)
+    conversion runs once per sheet.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        slots = {}
+        conversions = {}
+        self._trie = {}
+        self._conversions = []
+        self._groups = {}
+
+        for group, fields in spec.items():
+            plan = []
+            for name, f in fields.items():
+                if f.path not in slots:
+                    slots[f.path] = len(slots)
+                    self._add_path(f.path, slots[f.path])
+                conversion = (slots[f.path], f.kind, f.default_category, f.default_key)
+                if conversion not in conversions:
+                    conversions[conversion] = len(self._conversions)
+                    slot, kind, category, key = conversion
+                    self._conversions.append((slot, CONVERTERS[kind], category, key))
+                plan.append((name, conversions[conversion]))
+            self._groups[group] = plan
+
+        self._slot_count = len(slots)
+
+    def _add_path(self, path, slot):
+        node = self._trie
+        for depth, key in enumerate(path):
+            child, leaf = node.get(key, (None, None))
+            if depth == len(path) - 1:
+                node[key] = (child, slot)
+            else:
+                if child is None:
+                    child = {}
+                node[key] = (child, leaf)
+                node = child
+
+    def _walk(self, data, raw):
+        """Store the value at every trie path present in the sheet in its raw slot"""
+        pending = [(self._trie, data)]
+        while pending:
+            node, value = pending.pop()
+            if not isinstance(value, dict):
+                continue
+            for key, (child, slot) in node.items():
+                found = value.get(key, MISSING)
+                if found is MISSING:
+                    continue
+                if slot is not None:
+                    raw[slot] = found
+                if child:
+                    pending.append((child, found))
+
+    def extract(self, data) -> ExtractedInputs:
+        """Walk one sheet and build every input group"""
+        raw = [MISSING] * self._slot_count
+        self._walk(data, raw)
+
+        values = []
+        for slot, convert, category, key in self._conversions:
+            try:
+                values.append(convert(raw[slot], category, key))
+            except Exception as e:
+                values.append(_Failed(e))
+
+        groups = {}
+        errors = {}
+        for group, plan in self._groups.items():
+            built = {}
+            for name, index in plan:
+                value = values[index]
+                if isinstance(value, _Failed):
+                    errors[group] = value.error
+                    break
+                built[name] = value
+            else:
+                groups[group] = built
+        return ExtractedInputs(groups, errors)
+
+def compile_spec(spec=None) -> CompiledSpec:
+    return CompiledSpec(spec or INPUT_SPEC)
+
+_compiled = None
+
+def extract_inputs(data) -> ExtractedInputs:
+    """Typed inputs for every section of one sheet, using the compiled INPUT_SPEC"""
+    global _compiled
+    if _compiled is None:
+        _compiled = compile_spec()
+    return _compiled.extract(data)
@@ -0,0 +1,222 @@
+"""
+Precompiled lookup bundle.
+
+The engine's lookup data lives in JSON files that every new process used to
+parse at startup. A build step compiles them into one binary bundle: a header
+with the mtime, size and sha256 of each source, plus one marshal blob per
+source so each table is still only decoded when something asks for it.
+
+A source is served from the bundle only while its file still has the recorded
+mtime and size; otherwise (or when the bundle is missing, unreadable or built by
+another Python) that source is parsed from its JSON as before.
+
+The bundle is optional. Nothing requires it to be built; without one every
+source is read from its JSON, which only costs startup time.
+
+Build or check the bundle (from the performance-sheet directory):
+    python utils/lookup_bundle.py           rebuild it
+    python utils/lookup_bundle.py --check   report which sources are fresh
+
+Configuration (environment):
+    PERFORMANCE_SHEET_LOOKUP_BUNDLE   bundle path, or "off" to always read the JSON
+
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+from typing import Callable, NamedTuple, Tuple
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Every JSON the engine reads at runtime, by the name callers load it under
+BUNDLE_SOURCES = {
+    "lookup_tables": os.path.join(_BASE_DIR, "lookup_tables.json"),
+    "zig_zag_lookups": os.path.join(_BASE_DIR, "zig_zag_lookups.json"),
+    "feed_model_lookup": os.path.join(_BASE_DIR, "physics", "sigma_five_feed_model_config.json"),
+    "feed_model_pt_lookup": os.path.join(_BASE_DIR, "physics", "sigma_five_feed_w_pullthru_model_config.json"),
+    "allen_bradley_lookup": os.path.join(_BASE_DIR, "physics", "allen_bradley_model_config.json"),
+}
+
+DEFAULT_BUNDLE_PATH = os.path.join(_BASE_DIR, "lookup_tables.bundle")
+BUNDLE_FORMAT = 1
+
+# name -> {"source": "bundle" | "json", "seconds": float}; "<bundle>" records reading the bundle file
+LOAD_STATS = {}
+
+
+def get_bundle_path():
+    """Bundle path from PERFORMANCE_SHEET_LOOKUP_BUNDLE, or None when bundles are turned off."""
+    path = os.environ.get("PERFORMANCE_SHEET_LOOKUP_BUNDLE", DEFAULT_BUNDLE_PATH)
+    if not path or path.lower() == "off":
+        return None
+    return path
+
+
+def source_stamp(name: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of one BUNDLE_SOURCES file."""
+    stat = os.stat(BUNDLE_SOURCES[name])
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _runtime_tag():
+    # marshal output is only guaranteed readable by the same Python version
+    return (sys.version_info[0], sys.version_info[1], marshal.version)
+
+
+# --- Build ---
+def build_bundle(path: str = None) -> dict:
+    """
+    Compile every BUNDLE_SOURCES file into the bundle.
+
+    The file is written next to its final path and renamed into place, so a
+    process starting mid-build sees either the old bundle or the new one.
+
+    Args:
+        path (str, optional): Output path. Defaults to get_bundle_path().
+
+    Returns:
+        dict: The bundle header (per-source stamps and hashes, combined hash).
+    """
+    path = path or get_bundle_path() or DEFAULT_BUNDLE_PATH
+    sources = {}
+    blobs = {}
+    combined = hashlib.sha256()
+    for name, source_path in BUNDLE_SOURCES.items():
+        mtime_ns, size = source_stamp(name)
+        with open(source_path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        combined.update(name.encode("utf-8") + b"\0" + digest.encode("ascii"))
+        sources[name] = {"mtime_ns": mtime_ns, "size": size, "sha256": digest}
+        blobs[name] = marshal.dumps(json.loads(raw))
+
+    header = {
+        "format": BUNDLE_FORMAT,
+        "runtime": _runtime_tag(),
+        "hash": combined.hexdigest(),
+        "sources": sources,
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(marshal.dumps({"header": header, "blobs": blobs}))
+    os.replace(tmp_path, path)
+    return header
+
+
+# --- Load ---
+_bundle = None
+_bundle_read = False
+
+def _read_bundle():
+    """The bundle as {"header", "blobs"}, or None if it is missing, corrupt or from another runtime."""
+    global _bundle, _bundle_read
+    if _bundle_read:
+        return _bundle
+    _bundle_read = True
+
+    path = get_bundle_path()
+    if path is None:
+        return None
+    start = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            bundle = marshal.loads(f.read())
+        header = bundle["header"]
+        if header["format"] != BUNDLE_FORMAT or tuple(header["runtime"]) != _runtime_tag():
+            bundle = None
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        bundle = None
+    LOAD_STATS["<bundle>"] = {"source": "bundle" if bundle else "missing", "seconds": time.perf_counter() - start}
+    _bundle = bundle
+    return bundle
+
+
+def _is_fresh(bundle, name) -> bool:
+    entry = bundle["header"]["sources"].get(name)
+    if entry is None or name not in bundle["blobs"]:
+        return False
+    try:
+        return source_stamp(name) == (entry["mtime_ns"], entry["size"])
+    except OSError:
+        return False
+
+
+class SourceData(NamedTuple):
+    """One source as read at a point in time: its stamp, content hash and a decoder for the content."""
+    name: str
+    stamp: Tuple[int, int]
+    sha256: str
+    decode: Callable[[], object]
+
+
+def _timed_decode(name, source, decode, payload):
+    def run():
+        start = time.perf_counter()
+        data = decode(payload)
+        LOAD_STATS[name] = {"source": source, "seconds": time.perf_counter() - start}
+        return data
+    return run
+
+
+def read_source(name: str) -> SourceData:
+    """
+    Read one BUNDLE_SOURCES file without decoding it yet.
+
+    The bundle blob is used when it is fresh for this source, otherwise the JSON
+    bytes are read and hashed. decode() always parses exactly the content the
+    hash describes, however much later it is called.
+    """
+    stamp = source_stamp(name)
+    bundle = _read_bundle()
+    if bundle is not None and _is_fresh(bundle, name):
+        sha256 = bundle["header"]["sources"][name]["sha256"]
+        return SourceData(name, stamp, sha256, _timed_decode(name, "bundle", marshal.loads, bundle["blobs"][name]))
+
+    with open(BUNDLE_SOURCES[name], "rb") as f:
+        raw = f.read()
+    return SourceData(name, stamp, hashlib.sha256(raw).hexdigest(), _timed_decode(name, "json", json.loads, raw))
+
+
+def load_source(name: str):
+    """
+    Return the parsed contents of one BUNDLE_SOURCES file.
+
+    Served from the bundle when it is fresh for this source, otherwise parsed from
+    the JSON. Each call decodes a new object; callers keep their own copy.
+    """
+    return read_source(name).decode()
+
+
+def bundle_status() -> dict:
+    """Freshness of every source against the current bundle: {name: "fresh" | "stale" | "no bundle"}."""
+    bundle = _read_bundle()
+    if bundle is None:
+        return {name: "no bundle" for name in BUNDLE_SOURCES}
+    return {name: "fresh" if _is_fresh(bundle, name) else "stale" for name in BUNDLE_SOURCES}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the precompiled lookup bundle")
+    parser.add_argument("--check", action="store_true", help="Report freshness instead of rebuilding")
+    parser.add_argument("--output", help="Bundle path (defaults to PERFORMANCE_SHEET_LOOKUP_BUNDLE or utils/lookup_tables.bundle)")
+    args = parser.parse_args()
+
+    if args.check:
+        if args.output:
+            os.environ["PERFORMANCE_SHEET_LOOKUP_BUNDLE"] = args.output
+        for name, status in bundle_status().items():
+            print(f"{name:24s} {status}")
+        return
+
+    path = args.output or get_bundle_path() or DEFAULT_BUNDLE_PATH
+    header = build_bundle(path)
+    print(f"Wrote {path} ({os.path.getsize(path)} bytes, hash {header['hash'][:16]})")
+
+if __name__ == "__main__":
+    main()
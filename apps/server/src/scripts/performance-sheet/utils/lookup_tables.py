@@ -3,45 +3,309 @@ Lookup tables for various calculations.
 
 """
 
-import json
 import os
+import typing
+from typing import NamedTuple, Optional
+
+from utils.table_registry import get_table, register_table
 
 # Build a path to the JSON file relative to this file's location.
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 _JSON_FILE = os.path.join(_BASE_DIR, "lookup_tables.json")
 
-# Load the JSON file only once at module load time.
-with open(_JSON_FILE, "r") as f:
-    LOOKUP_DATA = json.load(f)
+######
+# Typed records
+######
+# The tables are compiled once per table version into immutable records (NamedTuples
+# carry no per-instance __dict__) with a case-normalized index per table, so a calculator
+# can fetch a whole row with one dict lookup instead of one getter call per column.
+class Material(NamedTuple):
+    density: float
+    modulus: float
+    yield_strength: float
+
+class ReelDimensions(NamedTuple):
+    coil_weight: int
+    bearing_dist: float
+    fbearing_dia: float
+    rbearing_dia: float
+    mandrel_dia: float
+    backplate: float
+    full_od_backplate: float
+    backplate_thickness: float
+
+class StrModel(NamedTuple):
+    roll_diameter: Optional[float]
+    center_distance: Optional[float]
+    pinch_roll_dia: Optional[float]
+    jack_force_avail: Optional[float]
+    min_roll_depth: Optional[float]
+    str_gear_torq: Optional[float]
+    pr_teeth: Optional[int]
+    proll_dp: Optional[int]
+    sroll_teeth: Optional[int]
+    sroll_dp: Optional[int]
+    face_width: Optional[float]
+    top: Optional[float]
+    bottom: Optional[float]
+    gear_options: Optional[tuple]
+
+class FeedSpec(NamedTuple):
+    """One row of a feed spec table. Columns a table does not have are None."""
+    motor: Optional[str] = None
+    amp: Optional[str] = None
+    gb_ratio: Optional[float] = None
+    ratio: Optional[float] = None
+    efficiency: Optional[float] = None
+    l_roll: Optional[float] = None
+    u_roll: Optional[float] = None
+    cent_dist: Optional[float] = None
+    max_mtr_torque: Optional[float] = None
+    max_mtr_rpm: Optional[float] = None
+    mot_inertia: Optional[float] = None
+    mot_peak_torque: Optional[float] = None
+    mot_rms_tq: Optional[float] = None
+    ref_inert: Optional[float] = None
+    settle_time: Optional[float] = None
+    settle_tor: Optional[float] = None
+    fric_torque: Optional[float] = None
+    watts_lost: Optional[float] = None
+    ec: Optional[float] = None
+
+class HolddownEntry(NamedTuple):
+    key: str
+    holddown_family: str
+    sort: str
+    name: str
+    cylinder_type: str
+    pressure_label: str
+    psi: float
+    force_factor: float
+    min_width: float
+    max_psi: float
+
+    def pressure_psi(self, air_pressure: float) -> float:
+        """Working pressure: the air pressure capped at MaxPSI for air cylinders, else the rated PSI."""
+        if "psi Air" in self.pressure_label:
+            return min(air_pressure, self.max_psi)
+        return self.psi
+
+    def force_available(self, holddown_pressure: float) -> float:
+        return self.force_factor * holddown_pressure
+
+# JSON column -> record field, where they differ
+_MATERIAL_COLUMNS = {"yield": "yield_strength"}
+_HOLDDOWN_COLUMNS = {
+    "HolddownFamily": "holddown_family", "Sort": "sort", "Name": "name", "CylinderType": "cylinder_type",
+    "PressureLabel": "pressure_label", "PSI": "psi", "ForceFactor": "force_factor",
+    "MinWidth": "min_width", "MaxPSI": "max_psi",
+}
+
+def _make_record(record_type, row: dict, columns: dict = None):
+    columns = columns or {}
+    values = {}
+    for column, value in row.items():
+        field = columns.get(column, column)
+        if field in record_type._fields:
+            values[field] = tuple(value) if isinstance(value, list) else value
+    return record_type(**values)
 
-# Now extract the individual lookup dictionaries
-#####
-# TDDBHD
-#####
-lookup_material = LOOKUP_DATA.get("lookup_material", {})
-lookup_reel_dimensions = LOOKUP_DATA.get("lookup_reel_dimensions", {})
-lookup_friction = LOOKUP_DATA.get("lookup_friction", {})
-lookup_fpm_buffer = LOOKUP_DATA.get("lookup_fpm_buffer", {})
-lookup_model_families = LOOKUP_DATA.get("lookup_model_families", {})
-lookup_holddown_sort = LOOKUP_DATA.get("lookup_holddown_sort", {})
-lookup_brake_type = LOOKUP_DATA.get("lookup_brake_type", {})
-lookup_holddown_matrix = LOOKUP_DATA.get("lookup_holddown_matrix", {})
-lookup_drive_torque = LOOKUP_DATA.get("lookup_drive_key", {})
-lookup_press_required = LOOKUP_DATA.get("lookup_press_required", {})
-lookup_motor_inertia = LOOKUP_DATA.get("lookup_motor_inertia", {})
-lookup_type_of_line = LOOKUP_DATA.get("lookup_type_of_line", {})
+######
+# Schemas
+######
+# Every {model: row} table is validated and compiled once per table version. Required
+# fields must be present and non-null, declared defaults fill missing or null columns,
+# and every value must match its record field's type, so callers can read record
+# attributes without guarding each one. Any problem fails the whole build.
+class LookupSchemaError(ValueError):
+    """lookup_tables.json does not match its schema; `problems` lists every offending row and field."""
+
+    def __init__(self, problems: list):
+        self.problems = list(problems)
+        shown = "; ".join(self.problems[:10])
+        more = f" (and {len(self.problems) - 10} more)" if len(self.problems) > 10 else ""
+        super().__init__(f"Invalid lookup tables: {shown}{more}")
+
+class TableSchema(NamedTuple):
+    """How one {model: row} table compiles into records."""
+    table: str
+    record_type: type
+    required: tuple
+    defaults: dict = {}
+    columns: dict = {}
+
+_FEED_SPEC_REQUIRED = (
+    "motor", "amp", "ratio", "gb_ratio", "efficiency", "l_roll", "u_roll",
+    "mot_inertia", "mot_peak_torque", "mot_rms_tq", "settle_tor", "settle_time",
+)
+
+# Tables without a friction torque column run with none
+TABLE_SCHEMAS = {
+    "material": TableSchema("lookup_material", Material, Material._fields, columns=_MATERIAL_COLUMNS),
+    "reel_dimensions": TableSchema("lookup_reel_dimensions", ReelDimensions, ReelDimensions._fields),
+    "str_model": TableSchema(
+        "lookup_str_model", StrModel,
+        ("roll_diameter", "center_distance", "jack_force_avail", "min_roll_depth", "pr_teeth", "gear_options"),
+    ),
+    "sigma_five": TableSchema(
+        "lookup_sigma5_feed", FeedSpec, _FEED_SPEC_REQUIRED + ("max_mtr_torque", "watts_lost", "ec"),
+        defaults={"fric_torque": 0},
+    ),
+    "sigma_five_pt": TableSchema(
+        "lookup_sigma5_feed_pt", FeedSpec, _FEED_SPEC_REQUIRED + ("max_mtr_torque", "watts_lost", "ec", "cent_dist"),
+        defaults={"fric_torque": 0},
+    ),
+    "allen_bradley": TableSchema(
+        "lookup_ab_feed", FeedSpec, _FEED_SPEC_REQUIRED + ("max_mtr_rpm",),
+        defaults={"fric_torque": 0},
+    ),
+}
+
+FEED_SPEC_TYPES = ("sigma_five", "sigma_five_pt", "allen_bradley")
+
+# Fields that are never None on a compiled record of each table
+SCHEMA_FIELDS = {name: frozenset(schema.required) | frozenset(schema.defaults) for name, schema in TABLE_SCHEMAS.items()}
+
+def _field_types(record_type) -> dict:
+    """{field: expected type} from the record's annotations, with Optional[...] unwrapped."""
+    types = {}
+    for field, annotation in typing.get_type_hints(record_type).items():
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        types[field] = args[0] if args else annotation
+    return types
+
+def _type_matches(value, expected) -> bool:
+    if isinstance(value, bool):
+        return False
+    if expected is float:
+        return isinstance(value, (int, float))
+    if expected is tuple:
+        return isinstance(value, (list, tuple))
+    return isinstance(value, expected)
+
+def _compile_table(schema: TableSchema, table) -> tuple:
+    """
+    Validate a {model: row} table against its schema and compile it into records.
 
-#####
-# STR Utility
-#####
-lookup_str_model = LOOKUP_DATA.get("lookup_str_model", {})
+    Every record is stored under its key as written and under the upper-cased key,
+    so exact and case-insensitive lookups both cost one dict probe. Exact keys win
+    if two rows only differ by case.
 
-#####
-# Sigma Five Reel
-#####
-lookup_sigma5_feed = LOOKUP_DATA.get("lookup_sigma5_feed", {})
-lookup_sigma5_feed_pt = LOOKUP_DATA.get("lookup_sigma5_feed_pt", {})
-lookup_ab_feed = LOOKUP_DATA.get("lookup_ab_feed", {})
+    Returns:
+        tuple: ({model: record}, [problem, ...]); the index is only usable when there are no problems.
+    """
+    problems = []
+    types = _field_types(schema.record_type)
+    index = {}
+    for key, row in table.items():
+        where = f"{schema.table}[{key!r}]"
+        if not isinstance(row, dict):
+            problems.append(f"{where}: expected an object, got {type(row).__name__}")
+            continue
+
+        values = dict(schema.defaults)
+        for column, value in row.items():
+            field = schema.columns.get(column, column)
+            if field not in types:
+                problems.append(f"{where}: unknown column {column!r}")
+            elif value is not None and not _type_matches(value, types[field]):
+                problems.append(f"{where}.{column}: expected {types[field].__name__}, got {type(value).__name__}")
+            elif value is None:
+                values.setdefault(field, None)
+            else:
+                values[field] = tuple(value) if isinstance(value, list) else value
+
+        missing = [field for field in schema.required if values.get(field) is None]
+        if missing:
+            problems.append(f"{where}: missing required {', '.join(missing)}")
+            continue
+        index[key] = schema.record_type(**values)
+
+    for key, record in list(index.items()):
+        index.setdefault(key.upper(), record)
+    return index, problems
+
+def _find(index: dict, key: str):
+    """Record for key (case-insensitive), or None."""
+    return index.get(key) or index.get(key.upper())
+
+######
+# Table versions
+######
+class LookupTables:
+    """
+    lookup_tables.json as loaded for one table version: the raw tables and the record
+    indexes built from them. Shared by every calculation on that version; never mutated.
+    """
+
+    def __init__(self, data: dict):
+        self.LOOKUP_DATA = data
+
+        #####
+        # TDDBHD
+        #####
+        self.lookup_material = data.get("lookup_material", {})
+        self.lookup_reel_dimensions = data.get("lookup_reel_dimensions", {})
+        self.lookup_friction = data.get("lookup_friction", {})
+        self.lookup_fpm_buffer = data.get("lookup_fpm_buffer", {})
+        self.lookup_model_families = data.get("lookup_model_families", {})
+        self.lookup_holddown_sort = data.get("lookup_holddown_sort", {})
+        self.lookup_brake_type = data.get("lookup_brake_type", {})
+        self.lookup_holddown_matrix = data.get("lookup_holddown_matrix", {})
+        self.lookup_drive_torque = data.get("lookup_drive_key", {})
+        self.lookup_press_required = data.get("lookup_press_required", {})
+        self.lookup_motor_inertia = data.get("lookup_motor_inertia", {})
+        self.lookup_type_of_line = data.get("lookup_type_of_line", {})
+
+        #####
+        # STR Utility
+        #####
+        self.lookup_str_model = data.get("lookup_str_model", {})
+
+        #####
+        # Sigma Five Reel
+        #####
+        self.lookup_sigma5_feed = data.get("lookup_sigma5_feed", {})
+        self.lookup_sigma5_feed_pt = data.get("lookup_sigma5_feed_pt", {})
+        self.lookup_ab_feed = data.get("lookup_ab_feed", {})
+
+        #####
+        # Records
+        #####
+        compiled = {}
+        problems = []
+        for name, schema in TABLE_SCHEMAS.items():
+            compiled[name], table_problems = _compile_table(schema, data.get(schema.table, {}))
+            problems.extend(table_problems)
+        if problems:
+            raise LookupSchemaError(problems)
+
+        self.material_records = compiled["material"]
+        self.reel_dimension_records = compiled["reel_dimensions"]
+        self.str_model_records = compiled["str_model"]
+        self.feed_spec_records = {spec_type: compiled[spec_type] for spec_type in FEED_SPEC_TYPES}
+
+        # The matrix is a list and repeats a few keys; the first row wins, as it did when
+        # the list was scanned front to back.
+        self.holddown_matrix_records = {}
+        for row in self.lookup_holddown_matrix:
+            self.holddown_matrix_records.setdefault(row["key"], _make_record(HolddownEntry, row, _HOLDDOWN_COLUMNS))
+
+register_table("lookup_tables", "lookup_tables", LookupTables)
+
+def _tables() -> LookupTables:
+    """Lookup tables of the running calculation's table version (see utils.table_registry)."""
+    return get_table("lookup_tables")
+
+def __getattr__(name):
+    # LOOKUP_DATA, lookup_material, material_records, ... stay importable, from the current version
+    tables = _tables()
+    if name in vars(tables):
+        return getattr(tables, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Build the current version at import, as the module-level tables used to be
+_tables()
 
 ######
 # TDDBHD methods
@@ -49,19 +313,19 @@ lookup_ab_feed = LOOKUP_DATA.get("lookup_ab_feed", {})
 ## Reel Models
 def get_reel_models():
     """Return a list of available reel models."""
-    return list(lookup_reel_dimensions.keys())
+    return list(_tables().lookup_reel_dimensions.keys())
 
 ## Hold Down Assemblies
 def get_hold_down_assys():
     """Return a list of available hold down assemblies."""
-    return list(lookup_holddown_sort.keys())
+    return list(_tables().lookup_holddown_sort.keys())
 
 ## Cylinders
 def get_cylinders():
     """Return a list of available cylinders."""
     # If you have a lookup for cylinders, use it; otherwise, extract from holddown_matrix or another source
     cylinders = set()
-    for entry in lookup_holddown_matrix:
+    for entry in _tables().lookup_holddown_matrix:
         # Assuming cylinder is the last part of the key
         key_parts = entry["key"].split("+")
         if len(key_parts) >= 4:
@@ -71,41 +335,29 @@ def get_cylinders():
 ## Brake Models
 def get_brake_models():
     """Return a list of available brake models."""
-    return list(lookup_brake_type.keys())
+    return list(_tables().lookup_brake_type.keys())
 
 ## Material Density
 def get_material_density(material: str) -> float:
     """Return the density for a given material from the JSON lookup."""
-    material_key = material.upper()
-    try:
-        return lookup_material[material_key]["density"]
-    except KeyError:
-        raise ValueError(f"Unknown material: {material}")
+    return get_material_record(material).density
 
 ## Material Modulus
 def get_material_modulus(material: str) -> float:
     """Return the modulus for a given material from the JSON lookup."""
-    material_key = material.upper()
-    try:
-        return lookup_material[material_key]["modulus"]
-    except KeyError:
-        raise ValueError(f"Unknown material: {material}")
+    return get_material_record(material).modulus
 
 ## Reel Max Weight
 def get_reel_max_weight(reel_model: str) -> int:
     """Return the maximum weight for a given reel model from the JSON lookup."""
-    reel_model_key = reel_model.upper()
-    try:
-        return lookup_reel_dimensions[reel_model_key]["coil_weight"]
-    except KeyError:
-        raise ValueError(f"Unknown reel model: {reel_model}")
+    return get_reel_dimensions_record(reel_model).coil_weight
 
 ## FPM Buffer
 def get_fpm_buffer(key: str = "DEFAULT") -> float:
     """Return a FPM buffer value from the JSON lookup."""
     key = key.upper()
     try:
-        return lookup_fpm_buffer[key]
+        return _tables().lookup_fpm_buffer[key]
     except KeyError:
         raise ValueError(f"Unknown FPM buffer key: {key}")
 
@@ -113,67 +365,45 @@ def get_fpm_buffer(key: str = "DEFAULT") -> float:
 def get_hold_down_matrix_label(model: str, hold_down_assy: str, cylinder: str) -> str:
     """Form and return hold down matrix label."""
     try:
-        hold_down_family = lookup_model_families[model]["holddown_family"]
+        hold_down_family = _tables().lookup_model_families[model]["holddown_family"]
     except KeyError:
         raise ValueError(f"Unknown family: {model}")
 
     try:
-        holddown_sort = lookup_holddown_sort[hold_down_assy]["sort"]
+        holddown_sort = _tables().lookup_holddown_sort[hold_down_assy]["sort"]
     except KeyError:
         raise ValueError(f"Unknown holddown assembly: {hold_down_assy}")
 
     return f"{hold_down_family}+{holddown_sort}+{hold_down_assy}+{cylinder}"
 
+## Holddown Matrix Entry
+def get_holddown_matrix_entry(holddown_matrix_key: str) -> HolddownEntry:
+    """Return the full Holddown Matrix row for a key."""
+    try:
+        return _tables().holddown_matrix_records[holddown_matrix_key]
+    except KeyError:
+        raise ValueError(f"Holddown matrix key {holddown_matrix_key} not found")
+
 ## Pressure PSI
 def get_pressure_psi(holddown_matrix_key: str, air_pressure: float) -> float:
     """Return pressure psi based off Holddown Matrix Key"""
-    holddown_matrix = next(
-    (entry for entry in lookup_holddown_matrix if entry["key"] == holddown_matrix_key),
-    None  # default if not found
-    )
-    if holddown_matrix is None:
-        raise ValueError(f"Holddown matrix key {holddown_matrix_key} not found")
-
-    pressure_label = holddown_matrix["PressureLabel"]
-    max_psi = holddown_matrix["MaxPSI"]
-    psi = holddown_matrix["PSI"]
-
-    if "psi Air" in pressure_label:
-        return min(air_pressure, max_psi)
-    else:
-        return psi
+    return get_holddown_matrix_entry(holddown_matrix_key).pressure_psi(air_pressure)
 
 ## Holddown Force Available
 def get_holddown_force_available(holddown_matrix_key: str, holddown_pressure: str) -> float:
     """Return Force Factor based off Holddown Matrix Key"""
-    holddown_matrix = next(
-        (entry for entry in lookup_holddown_matrix if entry["key"] == holddown_matrix_key),
-        None  # default if not found
-    )
-    if holddown_matrix is None:
-        raise ValueError(f"Holddown matrix key {holddown_matrix_key} not found")
-
-    force_factor = holddown_matrix["ForceFactor"]
-    return force_factor * holddown_pressure
+    return get_holddown_matrix_entry(holddown_matrix_key).force_available(holddown_pressure)
 
 ## Min Material Width
 def get_min_material_width(holddown_matrix_key: str) -> float:
     """Return Min Material Width based off Holddown Matrix Key"""
-    holddown_matrix = next(
-        (entry for entry in lookup_holddown_matrix if entry["key"] == holddown_matrix_key),
-        None  # default if not found
-    )
-    if holddown_matrix is None:
-        raise ValueError(f"Holddown matrix key {holddown_matrix_key} not found")
-
-    min_material_width = holddown_matrix["MinWidth"]
-    return min_material_width
+    return get_holddown_matrix_entry(holddown_matrix_key).min_width
 
 ## Cylinder bore
 def get_cylinder_bore(brake_model: str) -> float:
     """Return Cylinder Bore Type based off Brake Model"""
     try:
-        return lookup_brake_type[brake_model]["cylinder_bore"]
+        return _tables().lookup_brake_type[brake_model]["cylinder_bore"]
     except KeyError:
         raise ValueError(f"Unknown brake model: {brake_model}")
 
@@ -181,7 +411,7 @@ def get_cylinder_bore(brake_model: str) -> float:
 def get_drive_key(model: str, air_clutch: str, hydThreadingDrive: str) -> str:
     """Return Torque at mandrel based off drive key"""
     try:
-        drive_family = lookup_model_families[model]["drive_family"]
+        drive_family = _tables().lookup_model_families[model]["drive_family"]
         return drive_family + "+" + air_clutch + "+" + hydThreadingDrive
     except KeyError:
         raise ValueError(f"Unknown family: {model}")
@@ -190,7 +420,7 @@ def get_drive_key(model: str, air_clutch: str, hydThreadingDrive: str) -> str:
 def get_drive_torque(drive_key: str) -> float:
     """Return Torque at mandrel based off drive key"""
     try:
-        return lookup_drive_torque[drive_key]["torque"]
+        return _tables().lookup_drive_torque[drive_key]["torque"]
     except KeyError:
         raise ValueError(f"Unknown drive key: {drive_key}")
 
@@ -198,7 +428,7 @@ def get_drive_torque(drive_key: str) -> float:
 def get_motor_inertia(motor_hp: str) -> float:
     """Return Motor Inertia based off Motor HP"""
     try:
-        return lookup_motor_inertia[motor_hp]["motor_inertia"]
+        return _tables().lookup_motor_inertia[motor_hp]["motor_inertia"]
     except KeyError:
         raise ValueError(f"Unknown motor HP: {motor_hp}")
 
@@ -206,7 +436,7 @@ def get_motor_inertia(motor_hp: str) -> float:
 def get_type_of_line(type_of_line: str) -> str:
     """Return Type of Line based off Type of Line"""
     try:
-        return lookup_type_of_line[type_of_line]["reel_type"]
+        return _tables().lookup_type_of_line[type_of_line]["reel_type"]
     except KeyError:
         raise ValueError(f"Unknown type of line: {type_of_line}")
 
@@ -230,7 +460,7 @@ def get_reel_dimensions(model: str) -> dict:
     """
     reel_key = model.upper()
     try:
-        return lookup_reel_dimensions[reel_key]
+        return _tables().lookup_reel_dimensions[reel_key]
     except KeyError:
         raise ValueError(f"Unknown reel model: {model}")
 
@@ -248,10 +478,91 @@ def get_material(material: str) -> dict:
     """
     material_key = material.upper()
     try:
-        return lookup_material[material_key]
+        return _tables().lookup_material[material_key]
     except KeyError:
         raise ValueError(f"Unknown material: {material}")
 
+## Records
+def get_material_record(material: str) -> Material:
+    """Return the Material record for a material (case-insensitive)."""
+    record = _find(_tables().material_records, material)
+    if record is None:
+        raise ValueError(f"Unknown material: {material}")
+    return record
+
+def get_reel_dimensions_record(model: str) -> ReelDimensions:
+    """Return the ReelDimensions record for a reel model (case-insensitive)."""
+    record = _find(_tables().reel_dimension_records, model)
+    if record is None:
+        raise ValueError(f"Unknown reel model: {model}")
+    return record
+
+def get_str_model(model: str, label: str = None) -> StrModel:
+    """
+    Return the StrModel record for a straightener model (case-insensitive).
+
+    Args:
+        model (str): Model identifier.
+        label (str, optional): Friendly label for the error message. Defaults to `model`.
+    """
+    record = _find(_tables().str_model_records, model)
+    if record is None:
+        raise ValueError(f"Unknown model or missing field: {label or model} for model '{model}'")
+    return record
+
+def find_feed_spec(spec_type: str, feed_model: str) -> Optional[FeedSpec]:
+    """
+    Return the FeedSpec record for a feed model (case-insensitive), or None if the model is unknown.
+
+    The fields in SCHEMA_FIELDS[spec_type] are always set on the record.
+
+    Raises:
+        KeyError: If the spec_type is not recognized.
+    """
+    return _find(_tables().feed_spec_records[spec_type], feed_model)
+
+def compile_feed_specs(data: dict) -> dict:
+    """
+    FeedSpec indexes of every feed spec table in a parsed lookup_tables.json.
+
+    For tables derived from the feed specs (utils.table_registry builders receive the
+    parsed source, not the LookupTables built from it). Rows with schema problems are
+    left out; LookupTables rejects the whole version for them anyway.
+
+    Returns:
+        dict: {spec_type: {model: FeedSpec}}, indexed like feed_spec_records.
+    """
+    return {
+        spec_type: _compile_table(TABLE_SCHEMAS[spec_type], data.get(TABLE_SCHEMAS[spec_type].table, {}))[0]
+        for spec_type in FEED_SPEC_TYPES
+    }
+
+def list_feed_models(spec_type: str) -> list:
+    """
+    Feed models of one spec table, named as in lookup_tables.json and in table order.
+
+    Raises:
+        KeyError: If the spec_type is not recognized.
+    """
+    return list(getattr(_tables(), TABLE_SCHEMAS[spec_type].table))
+
+def get_feed_spec(spec_type: str, feed_model: str) -> FeedSpec:
+    """
+    Return the FeedSpec record for a feed model (case-insensitive).
+
+    Args:
+        spec_type (str): "sigma_five", "sigma_five_pt" or "allen_bradley".
+        feed_model (str): Model identifier.
+
+    Raises:
+        KeyError: If the spec_type is not recognized.
+        ValueError: If the model is not in that table.
+    """
+    record = find_feed_spec(spec_type, feed_model)
+    if record is None:
+        raise ValueError(f"Unknown feed model: {feed_model}")
+    return record
+
 #####
 # STR Utility methods
 #####
@@ -270,16 +581,23 @@ def get_str_model_value(model: str, field: str, label: str = None):
     Raises:
         ValueError: If the model or field is not found.
     """
-    model_key = model.upper()
     label = label or field
-    try:
-        return lookup_str_model[model_key][field]
-    except KeyError:
+    record = _find(_tables().str_model_records, model)
+    if record is None or field not in record._fields:
         raise ValueError(f"Unknown model or missing field: {label} for model '{model}'")
+    return getattr(record, field)
 
 #####
 # Sigma Five Reel
 #####
+def _feed_spec_value(spec_type: str, feed_model: str, field: str, label: str = None):
+    label = label or feed_model
+    record = _find(_tables().feed_spec_records[spec_type], feed_model)
+    value = getattr(record, field, None) if record is not None else None
+    if value is None:
+        raise ValueError(f"Unknown model or missing field: {label} for model '{feed_model}'")
+    return value
+
 def get_sigma_five_specs(feed_model: str, field: str, label: str = None):
     """
     Args:
@@ -289,12 +607,7 @@ def get_sigma_five_specs(feed_model: str, field: str, label: str = None):
     Returns:
         Dictionary of specifications for the given feed model.
     """
-    feed_model_key = feed_model.upper()
-    label = label or feed_model
-    try:
-        return lookup_sigma5_feed[feed_model_key][field]
-    except KeyError:
-        raise ValueError(f"Unknown model or missing field: {label} for model '{feed_model}'")
+    return _feed_spec_value("sigma_five", feed_model, field, label)
 
 def get_sigma_five_pt_specs(feed_model: str, field: str, label: str = None):
     """
@@ -305,12 +618,7 @@ def get_sigma_five_pt_specs(feed_model: str, field: str, label: str = None):
     Returns:
         Dictionary of specifications for the given feed model.
     """
-    feed_model_key = feed_model.upper()
-    label = label or feed_model
-    try:
-        return lookup_sigma5_feed_pt[feed_model_key][field]
-    except KeyError:
-        raise ValueError(f"Unknown model or missing field: {label} for model '{feed_model}'")
+    return _feed_spec_value("sigma_five_pt", feed_model, field, label)
     
 def get_ab_feed_specs(feed_model: str, field: str, label: str = None):
     """
@@ -321,12 +629,7 @@ def get_ab_feed_specs(feed_model: str, field: str, label: str = None):
     Returns:
         Dictionary of specifications for the given feed model.
     """
-    feed_model_key = feed_model.upper()
-    label = label or feed_model
-    try:
-        return lookup_ab_feed[feed_model_key][field]
-    except KeyError:
-        raise ValueError(f"Unknown model or missing field: {label} for model '{feed_model}'")
+    return _feed_spec_value("allen_bradley", feed_model, field, label)
     
 # Selected Str used
 def get_selected_str_used(type_of_line: str) -> str:
@@ -340,6 +643,6 @@ def get_selected_str_used(type_of_line: str) -> str:
         str: Selected STR used.
     """
     try:
-        return lookup_type_of_line[type_of_line]["str_used"]
+        return _tables().lookup_type_of_line[type_of_line]["str_used"]
     except KeyError:
         raise ValueError(f"Unknown type of line: {type_of_line}")
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Newline-delimited JSON helpers for long-lived calculation workers.
+
+"""
+
+import contextlib
+import json
+import sys
+
+
+def dumps_line(obj) -> str:
+    """Serialize an object as one compact JSON line (no trailing newline)."""
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+def write_line(stream, obj) -> None:
+    """Write one JSON line to a stream and flush it so the reader sees it immediately."""
+    stream.write(dumps_line(obj) + "\n")
+    stream.flush()
+
+
+def serve_ndjson(handler, instream=None, outstream=None) -> None:
+    """
+    Answer newline-delimited JSON requests until the input stream closes.
+
+    Each request line is a JSON object carrying an optional "id". The handler is
+    called with the parsed request and its return value is written back as
+    {"id": ..., "ok": true, "result": ...}. Any exception raised by the handler
+    (or a malformed request line) is reported as {"id": ..., "ok": false, "error": ...}
+    and the worker keeps serving.
+
+    Args:
+        handler (callable): Function taking the request dict and returning a JSON-serializable result.
+        instream: Stream to read requests from, defaults to sys.stdin.
+        outstream: Stream to write responses to, defaults to sys.stdout.
+    """
+    instream = instream or sys.stdin
+    outstream = outstream or sys.stdout
+
+    for line in iter(instream.readline, ""):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            write_line(outstream, {"id": None, "ok": False, "error": f"Invalid JSON request: {e}"})
+            continue
+
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            # Anything the calculators print must not end up in the response stream
+            with contextlib.redirect_stdout(sys.stderr):
+                result = handler(request)
+            response = {"id": request_id, "ok": True, "result": result}
+        except Exception as e:
+            print(f"Error handling request {request_id}: {e}", file=sys.stderr)
+            response = {"id": request_id, "ok": False, "error": str(e)}
+
+        write_line(outstream, response)
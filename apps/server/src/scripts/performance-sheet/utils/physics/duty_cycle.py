@@ -0,0 +1,322 @@
+"""
+Duty-cycle simulation for feeds.
+
+simulate_duty_cycle plays a whole production schedule (jobs of strokes at a
+feed length and SPM) through the servo in time steps of at most 1 ms by default.
+Each stroke indexes along a trapezoidal velocity profile, or a triangular one
+when the length is too short to reach full speed. The torque in each phase
+follows the time table (utils.physics.time):
+
+    acceleration    acceleration + frictional + loop torque (the peak torque)
+    run             frictional + loop torque
+    deceleration    -acceleration torque (braking)
+    settle          settle torque
+    dwell           loop torque
+
+The index (acceleration through settle) is sampled phase by phase, each phase
+cut into equal steps so no step crosses a phase change; within a phase the
+torque is constant and the speed linear, so the midpoint sums are exact. The
+dwell holds the loop torque at standstill and is added in closed form.
+
+From the sampled profile it integrates:
+- the RMS torque over each stroke and over the shift;
+- the braking energy, which becomes regen once the winding losses
+  (watts_lost over the deceleration) and the capacitor (ec) per stroke
+  are taken off, as in utils.physics.regen;
+- the motor's thermal load.
+
+The regen here is not the figure the feed sheet reports. calculate_regen takes
+the kinetic energy at the rated RPM, so it assumes every stroke reaches full
+speed. The simulator brakes from the speed the stroke actually reaches. The two
+agree on strokes long enough to reach full speed. On a short, triangular stroke
+the simulated regen is lower (591.8 J against 661.4 J for the sample sheet at
+12 in and 30 SPM). Size regen resistors and capacitors from calculate_regen,
+which bounds every stroke; use regen_energy and regen_power here for the energy
+a given schedule actually returns.
+
+Thermal load is a first-order I^2t model. Each stroke heats the motor toward
+(stroke RMS torque / rated RMS torque)^2 with the winding's thermal time
+constant, so a load of 1.0 is the steady state of running at the rated RMS
+torque.
+
+Strokes of the same length and SPM follow the same profile, so each distinct
+profile is sampled once and weighted by its strokes; thermal load is still
+stepped stroke by stroke. Profiles are sampled in chunks of at most
+DUTY_CYCLE_CHUNK_SAMPLES, so memory stays flat however varied the schedule.
+
+"""
+from math import pi
+from models import time_input
+
+# Bounds on the schedule and the time step
+MAX_SHIFT_STROKES = 10_000_000
+MIN_TIME_STEP = 0.0001
+MAX_TIME_STEP = 0.01
+DEFAULT_TIME_STEP = 0.001
+# Samples held in memory at once
+DUTY_CYCLE_CHUNK_SAMPLES = 1 << 20
+# Winding thermal time constant in seconds when the caller has none for the motor
+DEFAULT_THERMAL_TIME_CONSTANT = 600.0
+# lb-in to N-m, as in utils.physics.regen
+_LB_IN_TO_NM = 0.112943
+# Decay exponent per block of the thermal recurrence; keeps exp() well inside float range
+_THERMAL_BLOCK_EXPONENT = 500.0
+# Strokes per cumulative sum of the thermal recurrence; keeps the rebased exponents exact to ~1e-11
+_THERMAL_CHUNK_STROKES = 1 << 16
+
+def _jobs(jobs) -> tuple:
+    """Validate (length, spm, strokes) jobs; returns the three columns as lists."""
+    lengths, spm, strokes = [], [], []
+    if not isinstance(jobs, (list, tuple)) or not jobs:
+        raise ValueError("A duty cycle needs at least one (length, spm, strokes) job")
+    for number, job in enumerate(jobs, 1):
+        try:
+            length, rate, count = job
+        except (TypeError, ValueError):
+            raise ValueError(f"Job {number} must be (length, spm, strokes)")
+        length, rate = float(length), float(rate)
+        if not (0 < length < float("inf")) or not (0 < rate < float("inf")):
+            raise ValueError(f"Job {number} needs a positive finite length and SPM, got {length} and {rate}")
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError(f"Job {number} needs a whole number of strokes, got {count}")
+        lengths.append(length)
+        spm.append(rate)
+        strokes.append(count)
+    if sum(strokes) > MAX_SHIFT_STROKES:
+        raise ValueError(f"A duty cycle is limited to {MAX_SHIFT_STROKES} strokes, got {sum(strokes)}")
+    return lengths, spm, strokes
+
+def _stroke_profile(np, data: time_input, lengths, spm, feed_angle):
+    """Per stroke: phase ends, torque per phase, peak velocity and cycle time, as in calculate_values."""
+    init_length = ((data.velocity / data.acceleration) * data.velocity) * 12
+    running = lengths > init_length
+    acceleration_time = np.where(running, data.velocity / data.acceleration, np.sqrt((lengths / 12) / data.acceleration))
+    runtime = np.where(running, ((lengths - init_length) / 12) / data.velocity, 0.0)
+    acceleration_torque = (((data.refl_inertia * data.rpm) / (9.55 * acceleration_time)) / data.efficiency) + ((data.motor_inertia * data.rpm) / (9.55 * acceleration_time))
+    peak_torque = acceleration_torque + data.frictional_torque + data.loop_torque
+    index_time = (acceleration_time * 2) + runtime + data.settle_time
+
+    application = getattr(data, "application", "Press Feed")
+    if isinstance(application, str) and application.lower() != "press feed":
+        angle_cycle_time = index_time + feed_angle
+    else:
+        angle_cycle_time = index_time * (360 / (feed_angle if feed_angle > 0 else 180.0))
+
+    # The press sets the cycle; an index longer than the cycle holds the press up
+    cycle_time = np.maximum(60 / spm, index_time)
+    ends = np.stack([
+        acceleration_time,
+        acceleration_time + runtime,
+        (acceleration_time * 2) + runtime,
+        index_time,
+    ], axis=1)
+    torques = np.stack([
+        peak_torque,
+        np.full_like(peak_torque, data.frictional_torque + data.loop_torque),
+        -acceleration_torque,
+        np.full_like(peak_torque, data.settle_torque),
+        np.full_like(peak_torque, data.loop_torque),
+    ], axis=1)
+    peak_velocity = data.acceleration * acceleration_time
+    return {
+        "acceleration_time": acceleration_time,
+        "index_time": index_time,
+        "cycle_time": cycle_time,
+        "ends": ends,
+        "torques": torques,
+        "peak_velocity": peak_velocity,
+        "overrun": (60 / spm) < index_time,
+        "feed_angle_exceeded": angle_cycle_time > cycle_time,
+    }
+
+def _sample_chunk(np, data: time_input, profile: dict, first: int, last: int, step: float) -> dict:
+    """
+    Sample strokes [first, last) and integrate each stroke.
+
+    Only the index (acceleration through settle) is sampled. Each of its phases is cut
+    into equal steps of at most `step`, so no step straddles a phase change. The dwell
+    that fills the rest of the cycle holds the loop torque at standstill, so it adds
+    loop torque^2 per second and no braking, and is integrated exactly.
+    """
+    ends = profile["ends"][first:last]
+    count = last - first
+    # Phase segments, stroke-major: segment s is phase s % 4 of stroke s // 4
+    durations = np.diff(ends, axis=1, prepend=0.0).ravel()
+    samples = np.ceil(durations / step).astype(np.int64)
+    widths = np.divide(durations, samples, out=np.zeros_like(durations), where=samples > 0)
+    starts = np.zeros(samples.size, dtype=np.int64)
+    np.cumsum(samples[:-1], out=starts[1:])
+    segment = np.repeat(np.arange(samples.size), samples)
+    stroke = segment // 4
+
+    # Midpoint of each step
+    width = widths[segment]
+    t = (ends.ravel() - durations)[segment] + ((np.arange(segment.size, dtype=np.int64) - starts[segment]) + 0.5) * width
+    torques = profile["torques"][first:last]
+    torque = torques.ravel()[segment + stroke]
+
+    # Trapezoid (or triangle): ramp up, hold, ramp down to zero at the end of deceleration
+    acceleration = data.acceleration
+    velocity = np.minimum(acceleration * t, profile["peak_velocity"][first:last][stroke])
+    np.minimum(velocity, acceleration * (ends[:, 2][stroke] - t), out=velocity)
+    np.maximum(velocity, 0.0, out=velocity)
+    # Motor speed in rad/s: data.rpm at data.velocity
+    speed = velocity * ((data.rpm / data.velocity) * (2 * pi / 60))
+    power = torque * speed * _LB_IN_TO_NM
+
+    braking = np.maximum(0.0, -power)
+    dwell = profile["cycle_time"][first:last] - ends[:, 3]
+    dwell_torque = np.abs(torques[:, 4][dwell > 0])
+    peak_torque = max(float(np.abs(torque).max()) if torque.size else 0.0,
+                      float(dwell_torque.max()) if dwell_torque.size else 0.0)
+    return {
+        "torque_squared": np.bincount(stroke, weights=np.square(torque) * width, minlength=count)
+                          + (np.square(torques[:, 4]) * dwell),
+        "braking_energy": np.bincount(stroke, weights=braking * width, minlength=count),
+        "peak_torque": peak_torque,
+        "peak_regen_power": float(braking.max()) if braking.size else 0.0,
+        "samples": int(segment.size),
+    }
+
+def _thermal_load(np, heating, cycle_time, time_constant: float, start: float = 0.0):
+    """
+    Thermal load after each stroke: load = load * decay + heating * (1 - decay), decay = exp(-cycle / tau).
+
+    Solved in closed form per block of strokes (a scaled cumulative sum), with blocks
+    short enough that the scaling stays finite. The decay exponents are summed once per
+    chunk of _THERMAL_CHUNK_STROKES and each block rebases that sum to its own start,
+    so the work stays linear in the strokes however short the blocks are.
+    """
+    exponent = cycle_time / time_constant
+    load = np.empty_like(heating)
+    for chunk in range(0, heating.size, _THERMAL_CHUNK_STROKES):
+        cumulative = np.cumsum(exponent[chunk:chunk + _THERMAL_CHUNK_STROKES])
+        offset = 0.0
+        first = 0
+        while first < cumulative.size:
+            # Strokes whose total decay exponent stays under the block limit (at least one)
+            last = max(first + 1, int(np.searchsorted(cumulative, offset + _THERMAL_BLOCK_EXPONENT)))
+            block = cumulative[first:last] - offset
+            # load_k = exp(-E_k) * (start + sum_{j<=k} heating_j * (exp(E_j) - exp(E_{j-1})))
+            grown = np.exp(block)
+            previous = np.concatenate(([1.0], grown[:-1]))
+            strokes = slice(chunk + first, chunk + last)
+            load[strokes] = (start + np.cumsum(heating[strokes] * (grown - previous))) / grown
+            start = float(load[chunk + last - 1])
+            offset = float(cumulative[last - 1])
+            first = last
+    return load
+
+def simulate_duty_cycle(data: time_input, specs: dict, jobs, feed_angle=None, step: float = DEFAULT_TIME_STEP,
+                        thermal_time_constant: float = DEFAULT_THERMAL_TIME_CONSTANT) -> dict:
+    """
+    Simulate a production schedule through the feed servo.
+
+    Args:
+        data (TimeInput): The feed's time table input.
+        specs (dict): The model's specs as services.feed_calculations.get_all_specs_for returns
+            them (motor_peak_torque, motor_rms_torque, watts_lost, ec).
+        jobs (sequence): (length in inches, SPM, strokes) per job, run in order.
+        feed_angle (float, optional): Feed angle; defaults to data.feed_angle_1.
+        step (float): Longest time step in seconds, MIN_TIME_STEP to MAX_TIME_STEP.
+        thermal_time_constant (float): Winding thermal time constant in seconds, at least
+            the longest stroke cycle.
+
+    Returns:
+        dict: strokes, duration, profiles (distinct length and SPM pairs) and samples; rms_torque and peak_torque over the shift,
+              max_stroke_rms_torque, and the motor's ratings with rms_torque_check and
+              peak_torque_check; regen_energy (J), regen_power (W, averaged over the shift)
+              and peak_regen_power (W); thermal_load_peak and thermal_load_end; overruns
+              (strokes whose index is longer than the press cycle, which then waits for the
+              feed) and feed_angle_exceeded (strokes whose index does not fit the feed angle);
+              and per job its strokes, rms_torque and regen_energy.
+
+    Raises:
+        ValueError: If a job or the step is invalid, or the time constant is shorter than the longest stroke cycle.
+    """
+    # The simulation is array work from end to end, so NumPy is imported here whatever the time engine
+    import numpy as np
+
+    lengths, spm, strokes = _jobs(jobs)
+    if not MIN_TIME_STEP <= step <= MAX_TIME_STEP:
+        raise ValueError(f"Time step must be from {MIN_TIME_STEP} to {MAX_TIME_STEP} seconds, got {step}")
+    if not 0 < thermal_time_constant < float("inf"):
+        raise ValueError(f"Thermal time constant must be positive, got {thermal_time_constant}")
+    if feed_angle is None:
+        feed_angle = data.feed_angle_1
+
+    # One profile per distinct (length, SPM); profile_of[j] is job j's
+    pairs, profile_of = np.unique(np.column_stack([lengths, spm]), axis=0, return_inverse=True)
+    profile_of = profile_of.reshape(-1)
+    with np.errstate(all="ignore"):
+        profile = _stroke_profile(np, data, pairs[:, 0], pairs[:, 1], feed_angle)
+    cycle_time = profile["cycle_time"]
+    if not (np.isfinite(profile["ends"]).all() and np.isfinite(profile["torques"]).all() and np.isfinite(cycle_time).all()):
+        raise ValueError("The feed cannot index these lengths (non-finite profile)")
+    # A winding that cools within one stroke has no thermal history worth stepping
+    longest_cycle = float(cycle_time.max())
+    if thermal_time_constant < longest_cycle:
+        raise ValueError(f"Thermal time constant must be at least the longest stroke cycle ({longest_cycle:.4g} s), "
+                         f"got {thermal_time_constant}")
+
+    # Chunks of whole profiles, each at most DUTY_CYCLE_CHUNK_SAMPLES samples (or one profile)
+    count = len(pairs)
+    cumulative_samples = np.cumsum(np.ceil(np.diff(profile["ends"], axis=1, prepend=0.0) / step).sum(axis=1))
+    torque_squared = np.empty(count)
+    braking_energy = np.empty(count)
+    peak_torque = peak_regen_power = 0.0
+    total_samples = 0
+    first = 0
+    while first < count:
+        before = cumulative_samples[first - 1] if first else 0.0
+        last = max(first + 1, int(np.searchsorted(cumulative_samples, before + DUTY_CYCLE_CHUNK_SAMPLES, side="right")))
+        integrals = _sample_chunk(np, data, profile, first, last, step)
+        torque_squared[first:last] = integrals["torque_squared"]
+        braking_energy[first:last] = integrals["braking_energy"]
+        peak_torque = max(peak_torque, integrals["peak_torque"])
+        peak_regen_power = max(peak_regen_power, integrals["peak_regen_power"])
+        total_samples += integrals["samples"]
+        first = last
+
+    stroke_rms = np.sqrt(torque_squared / cycle_time)
+    regen_energy = np.maximum(0.0, braking_energy - ((profile["acceleration_time"] * specs["watts_lost"]) + specs["ec"]))
+    heating = np.square(stroke_rms / specs["motor_rms_torque"])
+
+    # Per job, then per stroke for the thermal state
+    job_strokes = np.asarray(strokes, dtype=float)
+    job_cycle_time = cycle_time[profile_of] * job_strokes
+    job_torque_squared = torque_squared[profile_of] * job_strokes
+    job_regen = regen_energy[profile_of] * job_strokes
+    stroke_profile = np.repeat(profile_of, strokes)
+    thermal_load = _thermal_load(np, heating[stroke_profile], cycle_time[stroke_profile], thermal_time_constant)
+
+    duration = float(job_cycle_time.sum())
+    rms_torque = float(np.sqrt(job_torque_squared.sum() / duration))
+    job_rms = np.sqrt(job_torque_squared / job_cycle_time)
+    return {
+        "strokes": int(stroke_profile.size),
+        "duration": duration,
+        "profiles": count,
+        "samples": total_samples,
+        "step": step,
+        "feed_angle": feed_angle,
+        "rms_torque": rms_torque,
+        "max_stroke_rms_torque": float(stroke_rms[profile_of].max()),
+        "peak_torque": peak_torque,
+        "motor_rms_torque": specs["motor_rms_torque"],
+        "motor_peak_torque": specs["motor_peak_torque"],
+        "rms_torque_check": "OK" if specs["motor_rms_torque"] > rms_torque else "EXCESS",
+        "peak_torque_check": "OK" if specs["motor_peak_torque"] > peak_torque else "EXCESS",
+        "regen_energy": float(job_regen.sum()),
+        "regen_power": float(job_regen.sum()) / duration,
+        "peak_regen_power": peak_regen_power,
+        "thermal_time_constant": thermal_time_constant,
+        "thermal_load_peak": float(thermal_load.max()),
+        "thermal_load_end": float(thermal_load[-1]),
+        "overruns": int(job_strokes[profile["overrun"][profile_of]].sum()),
+        "feed_angle_exceeded": int(job_strokes[profile["feed_angle_exceeded"][profile_of]].sum()),
+        "jobs": [
+            {"length": length, "spm": rate, "strokes": int(count), "rms_torque": float(rms), "regen_energy": float(energy)}
+            for length, rate, count, rms, energy in zip(lengths, spm, strokes, job_rms.tolist(), job_regen.tolist())
+        ],
+    }
@@ -1,13 +1,28 @@
 """
 Inertia utilities for physics-based calculations.
 
+The element lengths from calculate_length are affine in the width for a given
+feed model and roll width, and each element's reflected inertia is proportional
+to its length. Elements driven through the feed ratio scale with 1 / ratio^2.
+So the total reflected inertia is
+
+    fixed + fixed_per_width * width + (driven + driven_per_width * width + material) / ratio^2
+
+compile_inertia_coefficients derives those coefficients for every model of a
+config when the config is loaded (and again when it is reloaded), and
+calculate_total_refl_inertia evaluates them. walk_total_refl_inertia is the
+element-by-element reference. The coefficients add the elements up in a
+different order, so the two agree to about 1e-15 relative, not bit for bit.
+
 """
 from models import inertia_input
-from math import pi
+from math import isfinite, pi
+from typing import NamedTuple, Optional
 
-import json
 import os
 
+from utils.table_registry import get_table, register_table
+
 # Build absolute paths to each JSON file
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -15,15 +30,61 @@ SIGMA_FIVE_FILE = os.path.join(_BASE_DIR, "sigma_five_feed_model_config.json")
 SIGMA_FIVE_PT_FILE = os.path.join(_BASE_DIR, "sigma_five_feed_w_pullthru_model_config.json")
 AB_FEED_FILE = os.path.join(_BASE_DIR, "allen_bradley_model_config.json")
 
-# Load each JSON separately
-with open(SIGMA_FIVE_FILE, "r") as f:
-    feed_model_lookup = json.load(f)
+# Model configs, searched in this order. Each JSON is loaded the first time a feed needs it,
+# so sheets without a feed (or with only one feed family) never parse the others.
+# They are versioned with the lookup tables (utils.table_registry) and reload with them.
+MODEL_CONFIG_FILES = {
+    "feed_model_lookup": SIGMA_FIVE_FILE,
+    "feed_model_pt_lookup": SIGMA_FIVE_PT_FILE,
+    "allen_bradley_lookup": AB_FEED_FILE,
+}
+
+# Coefficient table per config, built from the same source version
+COEFFICIENT_TABLES = {name: f"{name}_inertia" for name in MODEL_CONFIG_FILES}
+
+INERTIA_ERROR = "ERROR: Inertia calculations failed to save."
+
+def get_model_config(name: str) -> dict:
+    """
+    Return one feed model config of the current table version, loading it on first use.
+
+    Args:
+        name (str): One of MODEL_CONFIG_FILES, e.g. "feed_model_lookup".
+
+    Returns:
+        dict: Elements per feed model.
+    """
+    if name not in MODEL_CONFIG_FILES:
+        raise KeyError(name)
+    return get_table(name)
+
+def preload_model_configs() -> None:
+    """Load every model config and compile its inertia coefficients now (worker warm-up before forking)."""
+    for name in MODEL_CONFIG_FILES:
+        get_model_config(name)
+        get_table(COEFFICIENT_TABLES[name])
+
+def find_model_config(feed_model: str):
+    """
+    Find a feed model in the configs, searched in MODEL_CONFIG_FILES order.
 
-with open(SIGMA_FIVE_PT_FILE, "r") as f:
-    feed_model_pt_lookup = json.load(f)
+    Returns:
+        tuple: (config name, model key, elements), or None for an unknown model.
+    """
+    # Configs key models in upper case ("CPRF-S1 PLUS"); sheets may not
+    model_keys = (feed_model, feed_model.upper())
+    for config_name in MODEL_CONFIG_FILES:
+        config = get_model_config(config_name)
+        model_key = next((key for key in model_keys if key in config), None)
+        if model_key is not None:
+            return config_name, model_key, config[model_key]
+    return None
 
-with open(AB_FEED_FILE, "r") as f:
-    allen_bradley_lookup = json.load(f)
+def __getattr__(name):
+    # feed_model_lookup, feed_model_pt_lookup and allen_bradley_lookup stay importable
+    if name in MODEL_CONFIG_FILES:
+        return get_model_config(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def calculate_length(width: float, feed_model: str, roll_width: str, element: str, e_data: dict) -> float:
     """
@@ -175,16 +236,53 @@ def compute_refl_inertia(data: inertia_input, qty: int = 1, length: float = 0, o
     except ValueError:
         raise ValueError("Invalid feed model")
 
-def calculate_total_refl_inertia(data: inertia_input):
-    try:
-        if data.feed_model in feed_model_lookup:
-            feed_data = feed_model_lookup[data.feed_model]
-        elif data.feed_model in feed_model_pt_lookup:
-            feed_data = feed_model_pt_lookup[data.feed_model]
-        elif data.feed_model in allen_bradley_lookup:
-            feed_data = allen_bradley_lookup[data.feed_model]
+def element_ratio(feed_data: dict, element_name: str, element_data: dict, feed: str, ratio: float) -> float:
+    """
+    Ratio an element's inertia is reflected through.
+
+    Elements with a ratio of 0 in the config are driven through the feed ratio, scaled
+    by the diameter of the gear or roll that drives them.
+
+    Args:
+        feed_data (dict): Elements of the feed model.
+        element_name (str): The element.
+        element_data (dict): The element's config.
+        feed (str): The feed model in upper case.
+        ratio (float): The feed's gear ratio.
+    """
+    if element_data["ratio"] != 0:
+        return element_data["ratio"]
+    if element_name == "gears_idler":
+        return (feed_data[element_name]["o_dia"] / feed_data["gears_drive"]["o_dia"]) * ratio
+    elif element_name == "gears_idler_YSS630":
+        return (feed_data[element_name]["o_dia"] / feed_data["gears_drive_YSS627"]["o_dia"]) * ratio
+    elif element_name == "i_gears_YSS630":
+        return (feed_data[element_name]["o_dia"] / feed_data["d_gears_YSS6633"]["o_dia"]) * ratio
+    elif element_name == "hub_YSS630" or element_name == "HUB_YSS630":
+        if "S5" in feed:
+            return (feed_data["gears_idler_YSS630"]["o_dia"] / feed_data["gears_drive_YSS627"]["o_dia"]) * ratio
         else:
+            return (feed_data["i_gears_YSS630"]["o_dia"] / feed_data["d_gears_YSS6633"]["o_dia"]) * ratio
+    elif element_name == "i_gears" or element_name == "i_hub" or element_name == "i_HUB":
+        return (feed_data[element_name]["o_dia"] / feed_data["d_gears_YSS630"]["o_dia"]) * ratio
+    elif element_name == "i_gears_YSS636" or element_name == "i_hub_YSS636" or element_name == "i_HUB_YSS636":
+        return (feed_data[element_name]["o_dia"] / feed_data["d_gears_YSS636"]["o_dia"]) * ratio
+    elif element_name == "s_roll" or element_name == "sp_roll":
+        return (feed_data[element_name]["o_dia"] / feed_data["u_roll_1"]["o_dia"]) * ratio
+    return ratio
+
+def walk_total_refl_inertia(data: inertia_input):
+    """
+    Total reflected inertia of the feed's elements and the material, one element at a time.
+
+    The reference for the compiled coefficients; calculate_total_refl_inertia falls back
+    to it for models the compiler could not reduce.
+    """
+    try:
+        found = find_model_config(data.feed_model)
+        if found is None:
             raise ValueError(f"Unknown feed model: {data.feed_model}")
+        feed_data = found[2]
         results = 0.0
 
         if not isinstance(feed_data, dict):
@@ -210,29 +308,7 @@ def calculate_total_refl_inertia(data: inertia_input):
                     refl = (element_data["qty"] * element_data["inertia"])
                     results += refl
             else:
-                if element_data["ratio"] == 0:
-                    if element_name == "gears_idler":
-                        ratio = (feed_data[element_name]["o_dia"] / feed_data["gears_drive"]["o_dia"]) * data.ratio
-                    elif element_name == "gears_idler_YSS630":
-                        ratio = (feed_data[element_name]["o_dia"] / feed_data["gears_drive_YSS627"]["o_dia"]) * data.ratio
-                    elif element_name == "i_gears_YSS630":
-                        ratio = (feed_data[element_name]["o_dia"] / feed_data["d_gears_YSS6633"]["o_dia"]) * data.ratio
-                    elif element_name == "hub_YSS630" or element_name == "HUB_YSS630":
-                        if "S5" in feed:
-                            ratio = (feed_data["gears_idler_YSS630"]["o_dia"] / feed_data["gears_drive_YSS627"]["o_dia"]) * data.ratio
-                        else:
-                            ratio = (feed_data["i_gears_YSS630"]["o_dia"] / feed_data["d_gears_YSS6633"]["o_dia"]) * data.ratio
-                    elif element_name == "i_gears" or element_name == "i_hub" or element_name == "i_HUB":
-                        ratio = (feed_data[element_name]["o_dia"] / feed_data["d_gears_YSS630"]["o_dia"]) * data.ratio
-                    elif element_name == "i_gears_YSS636" or element_name == "i_hub_YSS636" or element_name == "i_HUB_YSS636":
-                        ratio = (feed_data[element_name]["o_dia"] / feed_data["d_gears_YSS636"]["o_dia"]) * data.ratio
-                    elif element_name == "s_roll" or element_name == "sp_roll":
-                        ratio = (feed_data[element_name]["o_dia"] / feed_data["u_roll_1"]["o_dia"]) * data.ratio
-                    else:
-                        ratio = data.ratio
-                else:
-                    ratio = element_data["ratio"]
-
+                ratio = element_ratio(feed_data, element_name, element_data, feed, data.ratio)
                 refl = compute_refl_inertia(data, qty, len, element_data["o_dia"], element_data["i_dia"], element_data["density"],ratio)
 
                 results += refl
@@ -244,5 +320,129 @@ def calculate_total_refl_inertia(data: inertia_input):
 
         return results
     except:
-        return "ERROR: Inertia calculations failed to save."
+        return INERTIA_ERROR
+
+# --- Compiled coefficients ---
+ROLL_WIDTH_CLASSES = ("yes", "no", "other")
+# Models whose material term uses the first upper roll; the element walk checks the model name as given
+_S678 = ("S6", "S7", "S8")
+
+class InertiaCoefficients(NamedTuple):
+    """Reflected inertia of one feed model and roll width class as an affine function of the width."""
+    fixed: float                # elements with their own ratio, and gearboxes
+    fixed_per_width: float
+    driven: float               # elements driven through the feed ratio, times ratio^2
+    driven_per_width: float
+    u_roll_1_dia: Optional[float]   # material roll diameter when the model name says S6-S8
+    u_roll_dia: Optional[float]     # otherwise
+
+def roll_width_class(roll_width: str) -> str:
+    """calculate_length only distinguishes "yes", "no" and anything else."""
+    value = roll_width.lower()
+    return value if value in ("yes", "no") else "other"
+
+def _compile_model(model_key: str, feed_data: dict, roll_width: str) -> InertiaCoefficients:
+    feed = model_key.upper()
+    fixed = fixed_per_width = driven = driven_per_width = 0.0
+    u_roll_1_dia = u_roll_dia = None
+    for element_name, element_data in feed_data.items():
+        # The walk keeps the last matching element's diameter
+        if "u_roll_1" in element_name:
+            u_roll_1_dia = element_data["o_dia"]
+        if "u_roll" in element_name:
+            u_roll_dia = element_data["o_dia"]
+
+        if "g_box" in element_name:
+            if element_data["qty"] > 0:
+                fixed += element_data["qty"] * element_data["inertia"]
+            continue
+
+        at_zero = calculate_length(0, model_key, roll_width, element_name, element_data)
+        per_width = calculate_length(1, model_key, roll_width, element_name, element_data) - at_zero
+        # Reflected inertia per inch of element before dividing by the ratio squared
+        per_length = calculate_inertia(
+            calculate_lbs(element_data["o_dia"], element_data["i_dia"], 1, element_data["density"], element_data.get("qty", 1)),
+            element_data["o_dia"], element_data["i_dia"],
+        )
+        if element_data["ratio"] != 0:
+            scale = per_length / (element_data["ratio"] ** 2)
+            fixed += scale * at_zero
+            fixed_per_width += scale * per_width
+        else:
+            # Driven elements reflect through (factor * ratio); a factor of 0 falls back to the ratio itself
+            factor = element_ratio(feed_data, element_name, element_data, feed, 1.0) or 1.0
+            scale = per_length / (factor ** 2)
+            driven += scale * at_zero
+            driven_per_width += scale * per_width
+    return InertiaCoefficients(fixed, fixed_per_width, driven, driven_per_width, u_roll_1_dia, u_roll_dia)
+
+def compile_inertia_coefficients(config) -> dict:
+    """
+    Inertia coefficients for every model of a config.
+
+    Returns:
+        dict: {model key: {roll width class: InertiaCoefficients}}; None for a model whose
+              elements cannot be reduced (the element walk then handles it).
+    """
+    compiled = {}
+    for model_key, feed_data in config.items():
+        try:
+            compiled[model_key] = {
+                roll_width: _compile_model(model_key, feed_data, roll_width) for roll_width in ROLL_WIDTH_CLASSES
+            }
+        except (KeyError, TypeError, ValueError, ArithmeticError):
+            compiled[model_key] = None
+    return compiled
+
+for _name in MODEL_CONFIG_FILES:
+    register_table(_name, _name)
+    register_table(COEFFICIENT_TABLES[_name], _name, compile_inertia_coefficients)
+del _name
+
+def get_inertia_coefficients(feed_model: str, roll_width: str) -> Optional[InertiaCoefficients]:
+    """Compiled coefficients for a feed model and roll width, or None when the model must be walked."""
+    found = find_model_config(feed_model)
+    if found is None:
+        return None
+    config_name, model_key, _ = found
+    by_roll_width = get_table(COEFFICIENT_TABLES[config_name])[model_key]
+    return by_roll_width[roll_width_class(roll_width)] if by_roll_width is not None else None
+
+def material_roll_diameter(coefficients: InertiaCoefficients, feed_model: str) -> Optional[float]:
+    """Diameter of the roll carrying the material, or None when the model has none."""
+    return coefficients.u_roll_1_dia if any(s in feed_model for s in _S678) else coefficients.u_roll_dia
+
+def calculate_total_refl_inertia(data: inertia_input):
+    """
+    Total reflected inertia of the feed's elements and the material.
+
+    Args:
+        data (InertiaInput): Feed model, roll width, width, gear ratio and material.
+
+    Returns:
+        float: Reflected inertia, or INERTIA_ERROR when the calculation fails.
+    """
+    try:
+        coefficients = get_inertia_coefficients(data.feed_model, data.roll_width)
+    except AttributeError:
+        coefficients = None
+    if coefficients is None:
+        return walk_total_refl_inertia(data)
+
+    material_dia = material_roll_diameter(coefficients, data.feed_model)
+    # The element walk fails on these before adding anything up
+    if data.width < 0 or data.ratio == 0 or material_dia is None:
+        return INERTIA_ERROR
+    try:
+        ratio_squared = data.ratio ** 2
+        material_inertia = ((data.material_width * data.thickness * data.press_bed_length * data.density) / 32.3) * (((material_dia * 0.5) ** 2) / 144) * 12
+        results = ((coefficients.fixed + (coefficients.fixed_per_width * data.width))
+                   + ((coefficients.driven + (coefficients.driven_per_width * data.width)) / ratio_squared)
+                   + (material_inertia / ratio_squared))
+    except ArithmeticError:
+        results = None
+    # Overflow and NaN: let the walk decide between an error and the same non-finite value
+    if results is None or not isfinite(results):
+        return walk_total_refl_inertia(data)
+    return results
     
\ No newline at end of file
@@ -1,11 +1,38 @@
 """
 Time utilities for physics-based calculations.
 
+calculate_time builds the feed time table for each feed angle (the sheet's two,
+plus any list of others in the same pass): an initial row, then lengths from
+min_length in steps of increment (23 by default, any number via `rows`).
+Tables are lists of row dicts, or with columnar=True one dict of columns, which
+stays compact at plotting resolutions. calculate_feed_time is the reference
+implementation, one scalar calculate_values call per length.
+calculate_feed_time_table computes every length and every feed angle as NumPy
+array operations and returns the same values.
+
+Importing NumPy costs more than a one-shot process saves on the table, so the
+vectorized table is used once preload_time_engine() has run. Long-lived workers
+call it from preload_calculators().
+
+Configuration (environment):
+    PERFORMANCE_SHEET_TIME_ENGINE   "auto" (default, vectorized once preloaded), "numpy" or "python"
+
 """
+import os
 import sys
 from models import time_input
 from math import sqrt, floor
 
+TIME_TABLE_FIELDS = (
+    "index", "length", "acceleration_time", "acceleration_torque", "peak_torque", "runtime",
+    "index_time", "cycle_time", "strokes_per_minute", "dwell_time", "rms_torque",
+)
+# Rows per table including the initial row, by default and at most
+TIME_TABLE_ROWS = 24
+MAX_TIME_TABLE_ROWS = 10000
+# Extra feed angles calculate_time evaluates in one call, at most
+MAX_FEED_ANGLES = 1000
+
 def calculate_init_values(data: time_input, feed_angle: int = 0):
     """
     Calculate initial values based on the input data.
@@ -137,9 +164,11 @@ def calculate_values(data: time_input, init_values: dict, feed_angle: int = 0, i
         "rms_torque": rms_torque
     }
 
-def calculate_feed_time(data: time_input, feed_angle: int = 0):
+def calculate_feed_time(data: time_input, feed_angle: int = 0, rows: int = TIME_TABLE_ROWS):
     """
     Calculate the feed time based on the input data.
+
+    Returns `rows` rows: the initial values, then min_length and each increment after it.
     """
     init_values = calculate_init_values(data, feed_angle)
     min_values = calculate_values(data, init_values, feed_angle, 1)
@@ -171,7 +200,7 @@ def calculate_feed_time(data: time_input, feed_angle: int = 0):
         "rms_torque": min_values["rms_torque"]
     }]
 
-    for i in range(2, 24):
+    for i in range(2, rows):
         values = calculate_values(data, init_values, feed_angle, i)
         lengths.append({
             "index": i,
@@ -189,19 +218,643 @@ def calculate_feed_time(data: time_input, feed_angle: int = 0):
 
     return lengths
 
-def calculate_time(data: time_input):
+def check_time_table_rows(rows: int) -> int:
+    """Validate a requested row count (the initial row plus at least min_length)."""
+    if not isinstance(rows, int) or not 2 <= rows <= MAX_TIME_TABLE_ROWS:
+        raise ValueError(f"Feed time table rows must be between 2 and {MAX_TIME_TABLE_ROWS}, got {rows}")
+    return rows
+
+def check_feed_angles(feed_angles) -> tuple:
+    """Validate a list of feed angles (positive, finite, at most MAX_FEED_ANGLES); returns them as floats."""
+    if not isinstance(feed_angles, (list, tuple)) or not 1 <= len(feed_angles) <= MAX_FEED_ANGLES:
+        raise ValueError(f"Feed angles must be a list of 1 to {MAX_FEED_ANGLES} angles")
+    angles = []
+    for angle in feed_angles:
+        if isinstance(angle, bool) or not isinstance(angle, (int, float)) or not 0 < angle < float("inf"):
+            raise ValueError(f"Feed angles must be positive numbers, got {angle!r}")
+        angles.append(float(angle))
+    return tuple(angles)
+
+def to_columns(table: list) -> dict:
+    """Turn a list of time table rows into {field: [value per row]}."""
+    return {field: [row[field] for row in table] for field in TIME_TABLE_FIELDS}
+
+# --- Vectorized table ---
+_np = None
+
+def get_time_engine() -> str:
+    """Time table engine from PERFORMANCE_SHEET_TIME_ENGINE: "auto", "numpy" or "python"."""
+    return os.environ.get("PERFORMANCE_SHEET_TIME_ENGINE", "auto").strip().lower() or "auto"
+
+def preload_time_engine() -> None:
+    """Import NumPy now so calculate_time uses the vectorized table (long-lived workers)."""
+    global _np
+    if get_time_engine() != "python" and _np is None:
+        import numpy
+        _np = numpy
+
+def _numpy_engine():
+    engine = get_time_engine()
+    if engine == "python":
+        return None
+    if engine == "numpy":
+        preload_time_engine()
+    return _np
+
+def _require_nonzero(*divisors):
+    # Python raises on every division by zero; NumPy stays quiet when the numerator is NaN
+    for divisor in divisors:
+        if not (divisor.all() if hasattr(divisor, "all") else divisor):
+            raise ZeroDivisionError("float division by zero")
+
+def _vectorized_feed_time(np, data: time_input, feed_angles, rows: int, columnar: bool) -> list:
+    # Column 0 is the initial row, the rest are the lengths; the same operations in the
+    # same order as the scalar functions, so every value is bit-identical
+    velocity = data.velocity
+    acceleration = data.acceleration
+    motor_peak_torque = data.motor_peak_torque
+
+    init_length = ((velocity / acceleration) * velocity) * 12
+    init_acceleration_time = velocity / acceleration
+    if ((init_length - ((motor_peak_torque * init_acceleration_time) * 12) / 12) / motor_peak_torque) > 0:
+        init_runtime = ((init_length - ((motor_peak_torque * init_acceleration_time) * 12)) / 12) / motor_peak_torque
+    else:
+        init_runtime = 0
+
+    steps = np.arange(rows - 1, dtype=float)
+    lengths = data.min_length + (data.increment * steps)
+    lengths[0] = data.min_length
+    running = lengths > init_length
+
+    length = np.concatenate(([init_length], lengths))
+    # Only the lengths on each side of init_length go through each branch
+    short_lengths = np.where(running, 0.0, lengths)
+    long_lengths = np.where(running, lengths, init_length)
+    acceleration_time = np.concatenate((
+        [init_acceleration_time],
+        np.where(running, init_acceleration_time, np.sqrt((short_lengths / 12) / acceleration)),
+    ))
+    _require_nonzero(velocity, data.efficiency, acceleration_time)
+    runtime = np.concatenate(([init_runtime], np.where(running, ((long_lengths - init_length) / 12) / velocity, 0.0)))
+
+    acceleration_torque = (
+        (((data.refl_inertia * data.rpm) / (9.55 * acceleration_time)) / data.efficiency)
+        + ((data.motor_inertia * data.rpm) / (9.55 * acceleration_time))
+    )
+    peak_torque = acceleration_torque + data.frictional_torque + data.loop_torque
+    index_time = (acceleration_time * 2) + runtime + data.settle_time
+
+    # One row per feed angle from here on
+    application = getattr(data, 'application', 'Press Feed')
+    application_str = application.lower() if isinstance(application, str) else "press feed"
+    if application_str == "press feed":
+        factors = np.array([360 / (angle if angle > 0 else 180.0) for angle in feed_angles])
+        cycle_time = index_time * factors[:, None]
+    else:
+        cycle_time = index_time + np.array(feed_angles, dtype=float)[:, None]
+
+    _require_nonzero(cycle_time)
+    dwell_time = cycle_time - index_time
+    # float_power calls the C library pow like Python's `**`; `**` on an array squares by
+    # multiplication, which can differ in the last bit
+    rms_torque = np.sqrt((
+        (np.float_power(peak_torque, 2) * acceleration_time)
+        + (np.float_power(acceleration_torque, 2) * acceleration_time)
+        + (((data.frictional_torque + data.loop_torque) ** 2) * runtime)
+        + ((data.settle_torque ** 2) * data.settle_time)
+        + ((data.loop_torque ** 2) * dwell_time)
+    ) / cycle_time)
+
+    natural_spm = 60 / cycle_time
+    spm_rows = natural_spm.tolist()
+    if not data.str_max_sp_inch <= 0:
+        # Where the straightener limits the speed the scalar code returns max(1, floor(...)), an int
+        _require_nonzero(lengths)
+        use_natural = (natural_spm[:, 1:] * lengths) < data.str_max_sp_inch
+        if not use_natural.all():
+            capped = np.maximum(1, np.floor(data.str_max_sp_inch / lengths))
+            used = capped[~use_natural.all(axis=0)]
+            if not (np.isfinite(used).all() and (used < 2.0 ** 63).all()):
+                raise OverflowError("strokes per minute out of range")
+            capped_ints = capped.astype(np.int64).tolist()
+            spm_rows = [
+                spm[:1] + [natural if keep else limited for natural, keep, limited in zip(spm[1:], keep_row, capped_ints)]
+                for spm, keep_row in zip(spm_rows, use_natural.tolist())
+            ]
+
+    # The scalar functions return an int 0 for runtime when there is none
+    runtime_column = [init_runtime] + [
+        value if is_running else 0 for value, is_running in zip(runtime[1:].tolist(), running.tolist())
+    ]
+
+    shared_columns = (
+        list(range(rows)), length.tolist(), acceleration_time.tolist(), acceleration_torque.tolist(),
+        peak_torque.tolist(), runtime_column, index_time.tolist(),
+    )
+    tables = []
+    for cycle_row, spm_row, dwell_row, rms_row in zip(cycle_time.tolist(), spm_rows, dwell_time.tolist(), rms_torque.tolist()):
+        if columnar:
+            columns = [list(column) for column in shared_columns] + [cycle_row, spm_row, dwell_row, rms_row]
+            tables.append(dict(zip(TIME_TABLE_FIELDS, columns)))
+            continue
+        tables.append([
+            {
+                "index": index, "length": length_value, "acceleration_time": accel, "acceleration_torque": accel_torque,
+                "peak_torque": peak, "runtime": run, "index_time": index_value, "cycle_time": cycle,
+                "strokes_per_minute": spm, "dwell_time": dwell, "rms_torque": rms,
+            }
+            for index, length_value, accel, accel_torque, peak, run, index_value, cycle, spm, dwell, rms
+            in zip(*shared_columns, cycle_row, spm_row, dwell_row, rms_row)
+        ])
+    return tables
+
+def _reference_tables(data: time_input, feed_angles, rows: int, columnar: bool) -> list:
+    tables = [calculate_feed_time(data, angle, rows) for angle in feed_angles]
+    return [to_columns(table) for table in tables] if columnar else tables
+
+def calculate_feed_time_table(data: time_input, feed_angles, rows: int = TIME_TABLE_ROWS, columnar: bool = False) -> list:
+    """
+    Calculate the feed time table for several feed angles at once.
+
+    Every length and feed angle is computed as NumPy array operations. Input that makes
+    the arithmetic fail (a zero or negative divisor, a non-finite value) is handed to
+    calculate_feed_time, so errors and edge cases behave exactly as in the scalar code.
+
+    Args:
+        data (TimeInput): Input data containing parameters for calculations.
+        feed_angles (sequence): Feed angles to tabulate.
+        rows (int): Rows per table including the initial row (see check_time_table_rows).
+        columnar (bool): Return each table as {field: [value per row]} instead of a list of rows.
+
+    Returns:
+        list: One table per feed angle, each equal to calculate_feed_time(data, angle, rows)
+              (or to_columns() of it).
+    """
+    np = _numpy_engine()
+    if np is None:
+        return _reference_tables(data, feed_angles, rows, columnar)
     try:
-        feed_angle_1_values = calculate_feed_time(data, data.feed_angle_1)
-        feed_angle_2_values = calculate_feed_time(data, data.feed_angle_2)
+        with np.errstate(all="raise", under="ignore"):
+            return _vectorized_feed_time(np, data, feed_angles, rows, columnar)
+    except (ArithmeticError, ValueError):
+        return _reference_tables(data, feed_angles, rows, columnar)
+
+def calculate_time(data: time_input, rows: int = TIME_TABLE_ROWS, columnar: bool = False, feed_angles=None):
+    """
+    Feed time tables for both feed angles, and optionally for a list of others.
 
-        return {
+    Every angle goes through one calculate_feed_time_table call, so the terms that do
+    not depend on the angle are computed once however many angles are asked for.
+
+    Args:
+        data (TimeInput): Input data containing parameters for calculations.
+        rows (int): Rows per table including the initial row, 24 by default.
+        columnar (bool): Return each table as {field: [value per row]} instead of a list of rows.
+        feed_angles (sequence, optional): More feed angles to tabulate (see check_feed_angles).
+
+    Returns:
+        dict: {"feed_angle_1": table, "feed_angle_2": table}, plus "feed_angles": one table per
+              requested angle when feed_angles is given, or empty tables and an "error"
+              message if the calculation fails.
+
+    Raises:
+        ValueError: If `rows` or a feed angle is out of range.
+    """
+    check_time_table_rows(rows)
+    angles = () if feed_angles is None else check_feed_angles(feed_angles)
+    try:
+        feed_angle_1_values, feed_angle_2_values, *angle_values = calculate_feed_time_table(
+            data, (data.feed_angle_1, data.feed_angle_2) + angles, rows, columnar
+        )
+
+        result = {
             "feed_angle_1": feed_angle_1_values,
             "feed_angle_2": feed_angle_2_values
         }
+        if feed_angles is not None:
+            result["feed_angles"] = angle_values
+        return result
     except Exception as e:
         # Return a proper dictionary structure with error information
-        return {
-            "feed_angle_1": [],
-            "feed_angle_2": [],
+        result = {
+            "feed_angle_1": to_columns([]) if columnar else [],
+            "feed_angle_2": to_columns([]) if columnar else [],
             "error": f"Time calculations failed: {str(e)}"
-        }
\ No newline at end of file
+        }
+        if feed_angles is not None:
+            result["feed_angles"] = [to_columns([]) if columnar else [] for _ in angles]
+        return result
+# --- Inverse queries ---
+# Checks that can set the highest SPM at a length, in the order they are applied
+FEED_LIMIT_CHECKS = ("acceleration_torque", "peak_torque", "feed_angle", "rms_torque", "straightener")
+
+def _length_terms(data: time_input, length: float):
+    # One row of calculate_values, closed form in the length
+    init_length = ((data.velocity / data.acceleration) * data.velocity) * 12
+    if length > init_length:
+        acceleration_time = data.velocity / data.acceleration
+        runtime = ((length - init_length) / 12) / data.velocity
+    else:
+        acceleration_time = sqrt((length / 12) / data.acceleration)
+        runtime = 0
+    acceleration_torque = (((data.refl_inertia * data.rpm) / (9.55 * acceleration_time)) / data.efficiency) + ((data.motor_inertia * data.rpm) / (9.55 * acceleration_time))
+    peak_torque = acceleration_torque + data.frictional_torque + data.loop_torque
+    index_time = (acceleration_time * 2) + runtime + data.settle_time
+    return acceleration_time, runtime, acceleration_torque, peak_torque, index_time
+
+def _feed_angle_factor(data: time_input, feed_angle):
+    # cycle_time = index_time * factor for a press feed, index_time + feed_angle otherwise (factor None)
+    application = getattr(data, 'application', 'Press Feed')
+    if isinstance(application, str) and application.lower() != "press feed":
+        return None
+    return 360 / (feed_angle if feed_angle > 0 else 180.0)
+
+def _cycle_limit(data: time_input, length: float, feed_angle):
+    """
+    Shortest cycle time at a length, before the torque gates and the straightener.
+
+    The index must fit the feed angle, and the RMS torque falls as the dwell grows:
+    rms^2 = (moving + loop^2 * (cycle - index)) / cycle, so it stays within the motor's
+    RMS rating once cycle >= (moving - loop^2 * index) / (rating^2 - loop^2).
+
+    Returns:
+        tuple: (cycle_time, binding check, _length_terms(), moving torque term); cycle_time is
+               inf when the loop torque alone reaches the RMS rating.
+    """
+    terms = _length_terms(data, length)
+    acceleration_time, runtime, acceleration_torque, peak_torque, index_time = terms
+    factor = _feed_angle_factor(data, feed_angle)
+    cycle_time = index_time * factor if factor is not None else index_time + feed_angle
+    binding = "feed_angle"
+
+    moving = (((peak_torque ** 2) * acceleration_time) + ((acceleration_torque ** 2) * acceleration_time)
+              + (((data.frictional_torque + data.loop_torque) ** 2) * runtime) + ((data.settle_torque ** 2) * data.settle_time))
+    loop_squared = data.loop_torque ** 2
+    headroom = (data.motor_rms_torque ** 2) - loop_squared
+    rms_cycle_time = (moving - (loop_squared * index_time)) / headroom if headroom > 0 else float("inf")
+    if rms_cycle_time > cycle_time:
+        cycle_time = rms_cycle_time
+        binding = "rms_torque"
+    return cycle_time, binding, terms, moving
+
+def solve_max_spm(data: time_input, length: float, feed_angle=None) -> dict:
+    """
+    Highest SPM the feed can hold at one length, in closed form.
+
+    The acceleration and peak torques do not depend on the SPM: when either reaches the
+    motor's peak rating no SPM works. Otherwise the cycle must fit the index within the
+    feed angle and keep the RMS torque within the motor's RMS rating, and the straightener
+    caps the speed exactly as in the time table. Where the feed angle binds, max_spm and
+    rms_torque equal the time table's strokes_per_minute and rms_torque at that length.
+
+    Args:
+        data (TimeInput): Input data containing parameters for calculations.
+        length (float): Feed length in inches.
+        feed_angle (float, optional): Feed angle; defaults to data.feed_angle_1.
+
+    Returns:
+        dict: length, feed_angle, max_spm (0 when no SPM works), cycle_time and rms_torque at
+              max_spm (None when no SPM works), peak_torque, acceleration_torque, and binding:
+              the check that sets max_spm, one of FEED_LIMIT_CHECKS.
+
+    Raises:
+        ValueError: If length is not positive.
+    """
+    if not length > 0:
+        raise ValueError(f"Feed length must be positive, got {length}")
+    if feed_angle is None:
+        feed_angle = data.feed_angle_1
+
+    cycle_time, binding, terms, moving = _cycle_limit(data, length, feed_angle)
+    acceleration_time, runtime, acceleration_torque, peak_torque, index_time = terms
+    result = {
+        "length": length, "feed_angle": feed_angle, "max_spm": 0, "cycle_time": None, "rms_torque": None,
+        "peak_torque": peak_torque, "acceleration_torque": acceleration_torque, "binding": binding,
+    }
+    if not acceleration_torque < data.motor_peak_torque:
+        result["binding"] = "acceleration_torque"
+        return result
+    if not data.motor_peak_torque > peak_torque:
+        result["binding"] = "peak_torque"
+        return result
+    if cycle_time == float("inf"):
+        return result
+
+    strokes_per_minute = 60 / cycle_time
+    if data.str_max_sp_inch > 0 and not (strokes_per_minute * length) < data.str_max_sp_inch:
+        strokes_per_minute = max(1, floor(data.str_max_sp_inch / length))
+        cycle_time = 60 / strokes_per_minute
+        binding = "straightener"
+
+    result.update(
+        max_spm=strokes_per_minute,
+        cycle_time=cycle_time,
+        rms_torque=sqrt((moving + ((data.loop_torque ** 2) * (cycle_time - index_time))) / cycle_time),
+        binding=binding,
+    )
+    return result
+
+def _bisect(predicate, good: float, bad: float, tolerance: float) -> float:
+    # Narrow [good, bad] (either order) around the point where predicate turns false; returns the good end
+    while abs(bad - good) > tolerance * max(1.0, abs(good)):
+        middle = (good + bad) / 2
+        if middle in (good, bad):
+            break
+        if predicate(middle):
+            good = middle
+        else:
+            bad = middle
+    return good
+
+def _argmax(f, lo: float, hi: float, tolerance: float) -> float:
+    # Golden-section search for the maximum of a unimodal f on [lo, hi]
+    ratio = (sqrt(5) - 1) / 2
+    a, b = hi - ratio * (hi - lo), lo + ratio * (hi - lo)
+    fa, fb = f(a), f(b)
+    while hi - lo > tolerance * max(1.0, hi):
+        if fa < fb:
+            lo, a, fa = a, b, fb
+            b = lo + ratio * (hi - lo)
+            fb = f(b)
+        else:
+            hi, b, fb = b, a, fa
+            a = hi - ratio * (hi - lo)
+            fa = f(a)
+    return a if fa >= fb else b
+
+def solve_max_length(data: time_input, spm: float, feed_angle=None, tolerance: float = 1e-7) -> dict:
+    """
+    Longest feed length the feed can index at a given SPM.
+
+    The feed angle bounds the length in closed form: the longest index that fits the
+    cycle time 60 / spm. When a torque or the straightener limits the feed below that
+    bound, the answer is found by bisection. The lengths that reach an SPM form one
+    interval: the torque gates fail below some length, and the cycle time needed
+    grows with the length beyond its best point.
+
+    Args:
+        data (TimeInput): Input data containing parameters for calculations.
+        spm (float): Required strokes per minute.
+        feed_angle (float, optional): Feed angle; defaults to data.feed_angle_1.
+        tolerance (float): Relative precision of the bisection.
+
+    Returns:
+        dict: solve_max_spm() at the longest length plus spm and max_length. When no length
+              reaches the SPM, max_length is None and the rest describes the best length.
+
+    Raises:
+        ValueError: If spm is not positive.
+    """
+    if not spm > 0:
+        raise ValueError(f"SPM must be positive, got {spm}")
+    if feed_angle is None:
+        feed_angle = data.feed_angle_1
+
+    def answer(length, found=True):
+        return dict(solve_max_spm(data, length, feed_angle), spm=spm, max_length=length if found else None)
+
+    # Closed form: the index (2 * acceleration_time + runtime) that fits the feed angle
+    factor = _feed_angle_factor(data, feed_angle)
+    moving_time = ((60 / spm) / factor if factor is not None else (60 / spm) - feed_angle) - data.settle_time
+    init_acceleration_time = data.velocity / data.acceleration
+    if not moving_time > 0:
+        return answer(tolerance, found=False)
+    if moving_time > 2 * init_acceleration_time:
+        upper = (((data.velocity / data.acceleration) * data.velocity) * 12) + ((moving_time - (2 * init_acceleration_time)) * 12 * data.velocity)
+    else:
+        upper = ((moving_time / 2) ** 2) * 12 * data.acceleration
+
+    def reaches(length):
+        return solve_max_spm(data, length, feed_angle)["max_spm"] >= spm
+
+    # Rounding can leave the closed form a hair short; bisection settles it from below
+    if reaches(upper):
+        return answer(upper)
+
+    def cycle_spm(length):
+        cycle_time = _cycle_limit(data, length, feed_angle)[0]
+        return 60 / cycle_time
+
+    best = _argmax(cycle_spm, upper * tolerance, upper, tolerance)
+    if cycle_spm(best) < spm:
+        return answer(best, found=False)
+    end = upper if cycle_spm(upper) >= spm else _bisect(lambda length: cycle_spm(length) >= spm, best, upper, tolerance)
+    if reaches(end):
+        return answer(end)
+
+    def torques_ok(length):
+        _, _, acceleration_torque, peak_torque, _ = _length_terms(data, length)
+        return acceleration_torque < data.motor_peak_torque and data.motor_peak_torque > peak_torque
+
+    if not torques_ok(end):
+        return answer(end, found=False)
+    start = max(
+        _bisect(lambda length: cycle_spm(length) >= spm, best, upper * tolerance, tolerance),
+        _bisect(torques_ok, end, upper * tolerance, tolerance),
+    )
+    if not reaches(start):
+        return answer(best, found=False)
+    return answer(_bisect(reaches, start, end, tolerance))
+
+def solve_min_feed_angle(data: time_input, length: float, spm: float) -> dict:
+    """
+    Smallest feed angle a press feed needs to index one length at a given SPM.
+
+    At a fixed SPM the press sets the cycle, so the RMS torque does not depend on the feed
+    angle; the angle only has to leave the index enough of the cycle:
+    angle >= 360 * index_time / cycle_time. Where the acceleration or peak torque reaches
+    the motor's peak rating, the RMS torque at that SPM reaches its RMS rating, or the
+    straightener cannot run that fast, no angle works. (At the time table's own SPM,
+    which rises with the angle, the RMS torque only grows with the angle, so it sets
+    the largest angle, not the smallest.)
+
+    Args:
+        data (TimeInput): Input data containing parameters for calculations.
+        length (float): Feed length in inches.
+        spm (float): Press strokes per minute.
+
+    Returns:
+        dict: length, spm, min_feed_angle (None when no angle up to 360 works), index_time,
+              cycle_time, rms_torque, peak_torque, acceleration_torque, and binding: one of
+              FEED_LIMIT_CHECKS, "feed_angle" when the angle sets the answer (including an index
+              longer than the whole cycle) or else the check that rules every angle out.
+
+    Raises:
+        ValueError: If length or spm is not positive, or the feed is not a press feed.
+    """
+    if not length > 0:
+        raise ValueError(f"Feed length must be positive, got {length}")
+    if not 0 < spm < float("inf"):
+        raise ValueError(f"Strokes per minute must be positive, got {spm}")
+    if _feed_angle_factor(data, 180.0) is None:
+        raise ValueError("The minimum feed angle applies to press feeds")
+
+    acceleration_time, runtime, acceleration_torque, peak_torque, index_time = _length_terms(data, length)
+    cycle_time = 60 / spm
+    moving = (((peak_torque ** 2) * acceleration_time) + ((acceleration_torque ** 2) * acceleration_time)
+              + (((data.frictional_torque + data.loop_torque) ** 2) * runtime) + ((data.settle_torque ** 2) * data.settle_time))
+    # An index longer than the cycle would need more than the whole stroke; the RMS is taken without dwell
+    rms_torque = sqrt((moving + ((data.loop_torque ** 2) * max(0.0, cycle_time - index_time))) / max(cycle_time, index_time))
+    min_feed_angle = 360 * index_time / cycle_time
+    result = {
+        "length": length, "spm": spm, "min_feed_angle": None, "index_time": index_time, "cycle_time": cycle_time,
+        "rms_torque": rms_torque, "peak_torque": peak_torque, "acceleration_torque": acceleration_torque,
+        "binding": "feed_angle",
+    }
+    if not acceleration_torque < data.motor_peak_torque:
+        result["binding"] = "acceleration_torque"
+    elif not data.motor_peak_torque > peak_torque:
+        result["binding"] = "peak_torque"
+    elif min_feed_angle > 360:
+        result["binding"] = "feed_angle"
+    elif not data.motor_rms_torque > rms_torque:
+        result["binding"] = "rms_torque"
+    elif data.str_max_sp_inch > 0 and not (spm * length) < data.str_max_sp_inch:
+        result["binding"] = "straightener"
+    else:
+        result["min_feed_angle"] = min_feed_angle
+    return result
+
+# --- Feasibility map ---
+# Points per axis of a feasibility map, at most
+MAX_MAP_STEPS = 1000
+# Margins reported per point, one per check in FEED_LIMIT_CHECKS plus the smallest of them
+MAP_MARGINS = FEED_LIMIT_CHECKS + ("margin",)
+
+def map_axis(name: str, axis) -> tuple:
+    """
+    Validate one axis of a feasibility map.
+
+    Args:
+        name (str): Axis name for error messages.
+        axis (tuple): (first, last, steps); steps evenly spaced values from first to last.
+
+    Returns:
+        tuple: (first, last, steps) as (float, float, int).
+
+    Raises:
+        ValueError: If the values are not finite and positive, last < first or steps is out of range.
+    """
+    try:
+        first, last, steps = axis
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be (first, last, steps)")
+    first, last = float(first), float(last)
+    if isinstance(steps, bool) or not isinstance(steps, int) or not 1 <= steps <= MAX_MAP_STEPS:
+        raise ValueError(f"{name} steps must be an integer from 1 to {MAX_MAP_STEPS}, got {steps}")
+    if not (0 < first <= last < float("inf")):
+        raise ValueError(f"{name} must run from a positive first value up to a finite last value, got {first} to {last}")
+    return first, last, steps
+
+def _nullable(np, values):
+    # JSON has no inf or NaN: non-finite values become None
+    return np.where(np.isfinite(values), values, None).tolist()
+
+def calculate_feasibility_map(data: time_input, lengths: tuple, spm: tuple, feed_angle=None) -> dict:
+    """
+    Which (feed length, SPM) points the feed can hold, over a whole grid at once.
+
+    Each length is solved as in solve_max_spm, then every SPM on the axis is compared
+    with it: feed_check is "OK" where spm <= max_spm. Margins are the fraction of each
+    rating left at that point: (rating - torque) / rating for the torques, the spare
+    fraction of the cycle for the feed angle and of the straightener speed
+    (str_max_sp_inch) for the straightener. "margin" is the smallest. binding is the
+    first check a failing point breaks, in FEED_LIMIT_CHECKS order, or the check with the
+    smallest margin where the point passes.
+
+    Args:
+        data (TimeInput): Input data containing parameters for calculations.
+        lengths (tuple): (first, last, steps) feed lengths in inches.
+        spm (tuple): (first, last, steps) strokes per minute.
+        feed_angle (float, optional): Feed angle; defaults to data.feed_angle_1.
+
+    Returns:
+        dict: "lengths" and "spm" axes, "max_spm" and "length_binding" per length (as
+              solve_max_spm), and per point [length][spm] grids "feed_check", "binding" and
+              "margins" {check: grid}. Margins that are undefined (no straightener, a
+              zero rating) are None.
+
+    Raises:
+        ValueError: If an axis is invalid (see map_axis).
+    """
+    # A map is always array work, so NumPy is imported here whatever the time engine
+    import numpy as np
+
+    lengths = np.linspace(*map_axis("lengths", lengths))
+    spm = np.linspace(*map_axis("spm", spm))
+    if feed_angle is None:
+        feed_angle = data.feed_angle_1
+
+    with np.errstate(all="ignore"):
+        # Per length: _length_terms and _cycle_limit
+        init_length = ((data.velocity / data.acceleration) * data.velocity) * 12
+        running = lengths > init_length
+        acceleration_time = np.where(running, data.velocity / data.acceleration, np.sqrt((lengths / 12) / data.acceleration))
+        runtime = np.where(running, ((lengths - init_length) / 12) / data.velocity, 0.0)
+        acceleration_torque = (((data.refl_inertia * data.rpm) / (9.55 * acceleration_time)) / data.efficiency) + ((data.motor_inertia * data.rpm) / (9.55 * acceleration_time))
+        peak_torque = acceleration_torque + data.frictional_torque + data.loop_torque
+        index_time = (acceleration_time * 2) + runtime + data.settle_time
+
+        factor = _feed_angle_factor(data, feed_angle)
+        angle_cycle_time = index_time * factor if factor is not None else index_time + feed_angle
+        moving = ((np.float_power(peak_torque, 2) * acceleration_time) + (np.float_power(acceleration_torque, 2) * acceleration_time)
+                  + (((data.frictional_torque + data.loop_torque) ** 2) * runtime) + ((data.settle_torque ** 2) * data.settle_time))
+        loop_squared = data.loop_torque ** 2
+        headroom = (data.motor_rms_torque ** 2) - loop_squared
+        if headroom > 0:
+            rms_cycle_time = (moving - (loop_squared * index_time)) / headroom
+        else:
+            rms_cycle_time = np.full_like(lengths, np.inf)
+        rms_binds = rms_cycle_time > angle_cycle_time
+        cycle_time = np.where(rms_binds, rms_cycle_time, angle_cycle_time)
+
+        acceleration_ok = acceleration_torque < data.motor_peak_torque
+        peak_ok = data.motor_peak_torque > peak_torque
+        max_spm = 60 / cycle_time
+        straightener_binds = np.zeros(lengths.shape, dtype=bool)
+        if data.str_max_sp_inch > 0:
+            straightener_binds = ~((max_spm * lengths) < data.str_max_sp_inch)
+            max_spm = np.where(straightener_binds, np.maximum(1.0, np.floor(data.str_max_sp_inch / lengths)), max_spm)
+        solvable = acceleration_ok & peak_ok & (cycle_time != np.inf)
+        max_spm = np.where(solvable, max_spm, 0.0)
+        length_binding = np.select(
+            [~acceleration_ok, ~peak_ok, ~np.isfinite(cycle_time) | ~straightener_binds],
+            ["acceleration_torque", "peak_torque", np.where(rms_binds, "rms_torque", "feed_angle")],
+            "straightener",
+        )
+
+        # Per point: lengths down, SPM across
+        column = (slice(None), None)
+        point_cycle_time = 60 / spm[None, :]
+        rms_torque = np.sqrt((moving[column] + (loop_squared * (point_cycle_time - index_time[column]))) / point_cycle_time)
+        shape = (lengths.size, spm.size)
+        margins = {
+            "acceleration_torque": np.broadcast_to(((data.motor_peak_torque - acceleration_torque) / data.motor_peak_torque)[column], shape),
+            "peak_torque": np.broadcast_to(((data.motor_peak_torque - peak_torque) / data.motor_peak_torque)[column], shape),
+            "feed_angle": (point_cycle_time - angle_cycle_time[column]) / point_cycle_time,
+            "rms_torque": (data.motor_rms_torque - rms_torque) / data.motor_rms_torque,
+            "straightener": ((data.str_max_sp_inch - (spm[None, :] * lengths[column])) / data.str_max_sp_inch
+                             if data.str_max_sp_inch > 0 else np.full(shape, np.inf)),
+        }
+        stacked = np.stack([np.where(np.isnan(margins[check]), -np.inf, margins[check]) for check in FEED_LIMIT_CHECKS])
+        margins["margin"] = stacked.min(axis=0)
+
+        feasible = solvable[column] & (spm[None, :] <= max_spm[column])
+        failing = np.select(
+            [~acceleration_ok[column], ~peak_ok[column], spm[None, :] > (60 / angle_cycle_time)[column],
+             spm[None, :] > (60 / rms_cycle_time)[column]],
+            [0, 1, 2, 3],
+            4,
+        )
+        binding = np.where(feasible, stacked.argmin(axis=0), failing)
+
+    return {
+        "feed_angle": feed_angle,
+        "lengths": lengths.tolist(),
+        "spm": spm.tolist(),
+        "max_spm": max_spm.tolist(),
+        "length_binding": length_binding.tolist(),
+        "feed_check": np.where(feasible, "OK", "").tolist(),
+        "binding": np.array(FEED_LIMIT_CHECKS)[binding].tolist(),
+        "margins": {check: _nullable(np, margins[check]) for check in MAP_MARGINS},
+    }
@@ -0,0 +1,199 @@
+"""
+Memoizing cache for calculator results.
+
+Every calculator is a pure function of its pydantic input model and the lookup
+tables, so a result can be keyed on the calculator name, a hash of the
+canonicalized model and the table version (utils.table_registry, a hash of the
+table files' contents). Reloaded tables therefore never hit results computed
+against the old ones. Results live in an
+in-memory LRU and can optionally be persisted to a SQLite file shared by every
+worker process.
+
+Configuration (environment):
+    PERFORMANCE_SHEET_CACHE_SIZE   entries kept in memory, 0 disables the cache (default 1024)
+    PERFORMANCE_SHEET_CACHE_PATH   SQLite file for the persistent cache (default: memory only)
+
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from utils.table_registry import get_table_version
+
+DEFAULT_MAX_SIZE = 1024
+
+
+def canonical_model_json(model) -> str:
+    """Stable JSON text for a pydantic model (or plain dict): sorted keys, compact."""
+    values = model.dict() if hasattr(model, "dict") else model
+    return json.dumps(values, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def make_key(name: str, model) -> str:
+    """Cache key for one calculator call against the current table version."""
+    digest = hashlib.sha256()
+    digest.update(name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(get_table_version().encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(canonical_model_json(model).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of calculator results with an optional SQLite backing file.
+
+    Values are deep-copied on the way in and out so callers can never alter a
+    cached result.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, path: str = None):
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self):
+        # Forked workers must not share the parent's SQLite handle
+        if self.path is None:
+            return None
+        if self._conn is None or self._conn_pid != os.getpid():
+            import sqlite3
+
+            self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)")
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """
+        Look up a result.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(self._entries[key])
+
+            conn = self._connection()
+            if conn is not None:
+                row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    import pickle
+
+                    value = pickle.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    return True, copy.deepcopy(value)
+
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """Store a result."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+            conn = self._connection()
+            if conn is not None:
+                import pickle
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+                )
+                conn.commit()
+
+    def clear(self):
+        """Drop every entry, including the persisted ones."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            conn = self._connection()
+            if conn is not None:
+                conn.execute("DELETE FROM results")
+                conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+_default_cache = None
+_configured = False
+
+def configure_cache(max_size: int = None, path: str = None) -> ResultCache:
+    """
+    Replace the process-wide cache.
+
+    Args:
+        max_size (int, optional): Entries kept in memory; 0 disables caching. Defaults to
+            PERFORMANCE_SHEET_CACHE_SIZE or DEFAULT_MAX_SIZE.
+        path (str, optional): SQLite file to persist results to. Defaults to
+            PERFORMANCE_SHEET_CACHE_PATH, or memory only when that is unset.
+
+    Returns:
+        ResultCache: The new cache, or None when caching is disabled.
+    """
+    global _default_cache, _configured
+    if max_size is None:
+        max_size = int(os.environ.get("PERFORMANCE_SHEET_CACHE_SIZE", DEFAULT_MAX_SIZE))
+    if path is None:
+        path = os.environ.get("PERFORMANCE_SHEET_CACHE_PATH") or None
+
+    _default_cache = ResultCache(max_size, path) if max_size > 0 else None
+    _configured = True
+    return _default_cache
+
+def get_cache() -> ResultCache:
+    """The process-wide cache, created from the environment on first use."""
+    if not _configured:
+        configure_cache()
+    return _default_cache
+
+
+def cached_calculator(func, name: str = None):
+    """
+    Wrap a calculator taking one pydantic model so repeated inputs are served from the cache.
+
+    Exceptions are not cached; they propagate exactly as before.
+    """
+    name = name or f"{func.__module__}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(model):
+        cache = get_cache()
+        if cache is None:
+            return func(model)
+
+        key = make_key(name, model)
+        hit, value = cache.get(key)
+        if hit:
+            return value
+
+        result = func(model)
+        cache.put(key, result)
+        return result
+
+    return wrapper
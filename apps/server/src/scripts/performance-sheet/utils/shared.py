@@ -57,6 +57,9 @@ DEFAULTS = {
         'acceleration_rate': 0.0,
         'chart_min_length': 0.0,
         'length_increment': 0.0,
+        'chart_rows': 0,
+        'chart_max_length': 0.0,
+        'chart_format': 'rows',
         'feed_angle_1': 180.0,
         'feed_angle_2': 180.0,
         'pull_thru': 'No',
@@ -0,0 +1,270 @@
+"""
+Versioned registry of the lookup tables.
+
+Calculations read lookup data through a TableSnapshot: every source read at the
+same moment, a version derived from their content hashes, and the tables built
+from them (on first use, then kept). When a source file changes, refresh()
+builds a complete new snapshot and swaps it in with a single assignment, so a
+calculation sees either every old table or every new one, never a mix.
+
+calculate() pins the snapshot it starts with for its whole run (a contextvar,
+so other threads and requests are unaffected) and reports its version. The
+same version is part of every result-cache key.
+
+Long-running workers call start_table_watcher(), which polls the source files
+on a daemon thread; rebuilding the indexes happens there, off the request path.
+
+Configuration (environment):
+    PERFORMANCE_SHEET_TABLE_POLL   watcher poll interval in seconds, 0 disables (default 2)
+
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import os
+import sys
+import threading
+
+from utils.lookup_bundle import read_source, source_stamp
+
+# Sources that can be reloaded while a worker is running
+REGISTRY_SOURCES = ("lookup_tables", "feed_model_lookup", "feed_model_pt_lookup", "allen_bradley_lookup")
+
+DEFAULT_POLL_SECONDS = 2.0
+
+# table name -> (source name, build function or None for the parsed source itself)
+_builders = {}
+
+def register_table(name: str, source: str, build=None) -> None:
+    """
+    Declare a table built from one source.
+
+    Args:
+        name (str): Name callers pass to get_table().
+        source (str): One of REGISTRY_SOURCES.
+        build (callable, optional): Turns the parsed source into the table. The result
+            is shared by every calculation on the snapshot and must not be mutated.
+    """
+    _builders[name] = (source, build)
+
+
+def snapshot_version(sources: dict) -> str:
+    """Version of a set of sources: a hash of their names and content hashes."""
+    digest = hashlib.sha256()
+    for name in sorted(sources):
+        digest.update(name.encode("utf-8") + b"\0" + sources[name].sha256.encode("ascii"))
+    return digest.hexdigest()[:16]
+
+
+class TableVersionUnavailable(RuntimeError):
+    """The requested table version has been replaced and can no longer be read."""
+
+
+class TableSnapshot:
+    """One consistent version of every registry source and the tables built from it."""
+
+    def __init__(self, sources: dict):
+        self.sources = sources
+        self.version = snapshot_version(sources)
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str):
+        """Table `name`, built from this snapshot's sources on first use."""
+        try:
+            return self._tables[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._tables:
+                source, build = _builders[name]
+                data = self.sources[source].decode()
+                self._tables[name] = build(data) if build else data
+            return self._tables[name]
+
+    def built(self) -> list:
+        """Names of the tables built so far."""
+        return list(self._tables)
+
+    def is_current(self) -> bool:
+        """True while no source file has changed since this snapshot was read."""
+        try:
+            return all(source_stamp(name) == data.stamp for name, data in self.sources.items())
+        except OSError:
+            return False
+
+    def _adopt(self, other: "TableSnapshot") -> None:
+        # Same content under new stamps (a touched file): the built tables still apply
+        self._tables.update(other._tables)
+
+
+class TableRegistry:
+    """Holds the latest TableSnapshot and swaps in a new one when the sources change."""
+
+    def __init__(self, sources=REGISTRY_SOURCES):
+        self.sources = tuple(sources)
+        self.reloads = 0
+        self._latest = None
+        self._pinned = contextvars.ContextVar("pinned_table_snapshot", default=None)
+        self._reset_locks()
+
+    def _reset_locks(self):
+        self._lock = threading.Lock()
+        # Stamps of the sources the last failed refresh read; only touched while holding _lock
+        self._failed_stamps = None
+        self._watcher = None
+        self._stop = None
+
+    def _read(self) -> TableSnapshot:
+        return TableSnapshot({name: read_source(name) for name in self.sources})
+
+    def _stamps(self) -> dict:
+        return {name: source_stamp(name) for name in self.sources}
+
+    def latest(self) -> TableSnapshot:
+        """The newest snapshot, read on first use."""
+        snapshot = self._latest
+        if snapshot is None:
+            with self._lock:
+                if self._latest is None:
+                    self._latest = self._read()
+                snapshot = self._latest
+        return snapshot
+
+    def current(self) -> TableSnapshot:
+        """The snapshot pinned by the running calculation, else the newest one."""
+        return self._pinned.get() or self.latest()
+
+    @contextlib.contextmanager
+    def pin(self, snapshot: TableSnapshot = None):
+        """
+        Use one snapshot for everything inside the block.
+
+        Nested pins keep the outer snapshot unless one is passed explicitly.
+        """
+        token = self._pinned.set(snapshot or self.current())
+        try:
+            yield self._pinned.get()
+        finally:
+            self._pinned.reset(token)
+
+    def refresh(self) -> bool:
+        """
+        Re-read the sources if any file changed and swap in the new snapshot.
+
+        Tables the old snapshot had built are built on the new one before the swap, so
+        requests never pay for the rebuild. If building fails (a half-written or invalid
+        file), the exception propagates and the old snapshot stays in place; the same
+        files are not retried until they change again.
+
+        Returns:
+            bool: True if a snapshot with a new version was swapped in.
+        """
+        with self._lock:
+            old = self._latest
+            if old is not None and old.is_current():
+                return False
+            stamps = self._stamps()
+            if stamps == self._failed_stamps:
+                return False
+
+            try:
+                new = self._read()
+                if old is not None:
+                    if new.version == old.version:
+                        new._adopt(old)
+                    else:
+                        for name in old.built():
+                            new.get(name)
+            except Exception:
+                self._failed_stamps = stamps
+                raise
+            self._failed_stamps = None
+            self._latest = new
+
+            if old is None or new.version == old.version:
+                return False
+            self.reloads += 1
+            return True
+
+    def ensure(self, version: str) -> TableSnapshot:
+        """
+        Snapshot with `version`, refreshing first if the latest is older (used by forked section workers).
+
+        Raises:
+            TableVersionUnavailable: If the sources have moved past `version`; only the
+                newest snapshot is kept, so the tables it names can no longer be read.
+        """
+        snapshot = self.latest()
+        if snapshot.version != version:
+            self.refresh()
+            snapshot = self.latest()
+            if snapshot.version != version:
+                raise TableVersionUnavailable(f"Lookup tables {version} were replaced by {snapshot.version}")
+        return snapshot
+
+    def start_watcher(self, interval: float = None):
+        """
+        Poll the source files on a daemon thread and refresh when they change.
+
+        Args:
+            interval (float, optional): Seconds between polls. Defaults to
+                PERFORMANCE_SHEET_TABLE_POLL or DEFAULT_POLL_SECONDS; 0 disables watching.
+
+        Returns:
+            threading.Thread: The watcher, or None when watching is disabled.
+        """
+        if interval is None:
+            interval = float(os.environ.get("PERFORMANCE_SHEET_TABLE_POLL", DEFAULT_POLL_SECONDS))
+        if interval <= 0:
+            return None
+        if self._watcher is not None and self._watcher.is_alive():
+            return self._watcher
+
+        stop = threading.Event()
+
+        def watch():
+            while not stop.wait(interval):
+                try:
+                    if self.refresh():
+                        print(f"Lookup tables reloaded, version {self.latest().version}", file=sys.stderr)
+                except Exception as e:
+                    print(f"Lookup table reload failed, keeping version {self.latest().version}: {e}", file=sys.stderr)
+
+        self.latest()
+        self._stop = stop
+        self._watcher = threading.Thread(target=watch, name="lookup-table-watcher", daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def stop_watcher(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+        self._watcher = None
+        self._stop = None
+
+
+registry = TableRegistry()
+
+# A forked child starts without the parent's threads; a lock the watcher held at
+# fork time would otherwise never be released there
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry._reset_locks)
+
+
+def get_table(name: str):
+    """Table `name` from the current (pinned or newest) snapshot."""
+    return registry.current().get(name)
+
+def get_table_version() -> str:
+    """Version of the current (pinned or newest) snapshot."""
+    return registry.current().version
+
+def pin_tables(snapshot: TableSnapshot = None):
+    """Context manager pinning one snapshot for a calculation; yields the snapshot."""
+    return registry.pin(snapshot)
+
+def start_table_watcher(interval: float = None):
+    """Start the registry's watcher thread (long-running workers only)."""
+    return registry.start_watcher(interval)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Performance Sheet Worker Pool
+
+Runs a fixed set of warm calculation workers behind one local dispatcher.
+The dispatcher imports the models, lookup tables, physics helpers and every
+calculations.* module before forking, so the workers start hot and share those
+pages copy-on-write instead of each paying a cold interpreter start.
+
+The lookup tables are shared the same way and no further: each worker keeps the
+parsed tables and record indexes it inherited, and gc.freeze() keeps the
+collector from copying those pages. They are Python objects, so a shared memory
+segment or mapped file could only hold an encoded copy that every worker would
+decode into indexes of its own. Workers started after a crash come from the
+fork server and share its preloaded pages instead.
+
+Usage:
+    python worker_pool.py [--workers N]
+
+Requests are newline-delimited JSON on stdin:
+    {"id": "abc", "entry": "calculate", "data": {...}, "sections": ["feed"]}
+    {"id": "def", "entry": "autofill", "data": {...}}
+    {"id": "ghi", "entry": "feed_limits", "data": {...}, "length": 7.5}
+    {"id": "jkl", "entry": "feed_ranking", "data": {...}, "sort_by": "margin"}
+    {"id": "mno", "entry": "feed_map", "data": {...}, "lengths": [2, 60, 200], "spm": [5, 120, 200]}
+    {"id": "pqr", "entry": "feed_duty_cycle", "data": {...}, "jobs": [[7.5, 40, 20000], [12, 30, 5000]]}
+    {"id": "stu", "entry": "feed_angles", "data": {...}, "feed_angles": [90, 180, 270], "length": 7.5, "spm": 40}
+
+Responses are written to stdout as they complete, tagged with the request id:
+    {"id": "abc", "ok": true, "result": {...}}
+    {"id": "def", "ok": false, "error": "..."}
+
+When every worker is busy the dispatcher stops reading stdin until one frees up.
+"""
+
+import argparse
+import collections
+import contextlib
+import functools
+import gc
+import importlib
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+
+from utils.ndjson import write_line
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules imported up front so forked workers inherit them
+WARM_MODULES = ["models", "utils.lookup_tables", "utils.physics.inertia", "main", "autofill", "feed_queries"]
+
+def discover_calculation_modules():
+    """Return the dotted names of every module under calculations/."""
+    root = os.path.join(_BASE_DIR, "calculations")
+    names = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        package = os.path.relpath(dirpath, _BASE_DIR).replace(os.sep, ".")
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                names.append(f"{package}.{filename[:-3]}")
+    return names
+
+def warm_imports():
+    """Import everything the workers need before they are forked."""
+    for name in WARM_MODULES + discover_calculation_modules():
+        importlib.import_module(name)
+
+    # The feed model configs are otherwise loaded on first use; load them before forking
+    from utils.calculator_loader import preload_calculators
+    preload_calculators()
+
+    # Keep the collector from writing to the inherited objects, which would copy their pages into every worker
+    if hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+
+@functools.lru_cache(maxsize=None)
+def get_entry_points():
+    """Map request entry names to the functions behind main.py, autofill.py and feed_queries.py."""
+    import main
+    import autofill
+    from feed_queries import FEED_QUERIES, run_feed_query
+
+    return {
+        "calculate": main.handle_request,
+        "autofill": lambda request: autofill.generate_autofill(request.get("data", {})),
+        **{name: functools.partial(run_feed_query, name) for name in FEED_QUERIES},
+    }
+
+def run_request(request):
+    """Run one request inside a worker and build its response."""
+    request_id = request.get("id") if isinstance(request, dict) else None
+    try:
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        entry = request.get("entry", "calculate")
+        entry_points = get_entry_points()
+        if entry not in entry_points:
+            raise ValueError(f"Unknown entry point: {entry}")
+
+        # Anything the calculators print must not end up in the response stream
+        with contextlib.redirect_stdout(sys.stderr):
+            result = entry_points[entry](request)
+        return {"id": request_id, "ok": True, "result": result}
+    except Exception as e:
+        print(f"Error handling request {request_id}: {e}", file=sys.stderr)
+        return {"id": request_id, "ok": False, "error": str(e)}
+
+def worker_loop(conn):
+    """Worker process body: answer requests from the dispatcher until the pipe closes."""
+    # Each worker picks up edited lookup tables on its own watcher thread
+    from utils.table_registry import start_table_watcher
+    start_table_watcher()
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+        conn.send(run_request(request))
+
+def _get_context():
+    # fork keeps the warm imports shared; fall back to the platform default elsewhere
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+def get_thread_safe_context():
+    """
+    Start context for processes started while other threads run.
+
+    Forking then could copy a lock another thread holds; a fork server forks from its
+    own single-threaded process instead, with the warm modules preloaded.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(WARM_MODULES + discover_calculation_modules())
+        return context
+    return multiprocessing.get_context("spawn")
+
+class WorkerPool:
+    """
+    Fixed-size pool of pre-forked workers.
+
+    Each worker owns one pipe. A request is handed to whichever worker is idle;
+    submit() blocks while every worker is busy, which gives callers backpressure.
+
+    A worker that dies is replaced by the supervisor thread, the only place workers
+    are started once the pool is running; see get_thread_safe_context(). Idle slots are
+    queued with the generation of their worker, so a slot queued before its worker
+    died is dropped instead of handed out. A slot whose replacement cannot be started
+    is lost: wait_idle() stops waiting for it, and once every slot is lost submit()
+    raises instead of blocking.
+    """
+
+    def __init__(self, workers: int = None):
+        self.size = workers or os.cpu_count() or 1
+        self._context = _get_context()
+        self._respawn_context = None
+        self._idle = collections.deque()
+        self._dead = queue.Queue()
+        self._lock = threading.Lock()
+        # Signalled whenever a slot is queued idle or lost
+        self._changed = threading.Condition(self._lock)
+        self._lost = 0
+        self._callbacks = {}
+        self._workers = []
+        self._generations = [0] * self.size
+        self._closed = False
+
+        # Fork every worker before any dispatcher thread exists
+        for _ in range(self.size):
+            self._workers.append(self._spawn(self._context))
+        for index in range(self.size):
+            self._start_reader(index)
+            self._put_idle(index, 0)
+        self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+        self._supervisor.start()
+
+    def _spawn(self, context):
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(target=worker_loop, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _start_reader(self, index):
+        thread = threading.Thread(target=self._read_responses, args=(index,), daemon=True)
+        thread.start()
+
+    def _read_responses(self, index):
+        """Deliver each response from one worker, then mark that worker idle again."""
+        with self._lock:
+            (process, conn), generation = self._workers[index], self._generations[index]
+        while True:
+            try:
+                response = conn.recv()
+            except (EOFError, OSError):
+                # Take the slot out of service and fail its request in one step, so submit()
+                # either registered its callback before (and gets the error) or sees the slot empty
+                with self._lock:
+                    callback, request_id = self._callbacks.pop(index, (None, None))
+                    self._workers[index] = None
+                if self._closed:
+                    return
+                process.join(timeout=1)
+                if callback:
+                    callback({"id": request_id, "ok": False, "error": f"Worker exited with code {process.exitcode}"})
+                conn.close()
+                self._dead.put(index)
+                return
+
+            with self._lock:
+                callback, _ = self._callbacks.pop(index, (None, None))
+            if callback:
+                callback(response)
+            self._put_idle(index, generation)
+
+    def _supervise(self):
+        """Replace each worker the readers report dead, until close() sends None."""
+        while True:
+            index = self._dead.get()
+            if index is None or self._closed:
+                return
+            if self._respawn_context is None:
+                self._respawn_context = get_thread_safe_context()
+            try:
+                worker = self._spawn(self._respawn_context)
+            except Exception as e:
+                # The slot stays empty, so the pool runs one worker short from now on
+                print(f"Could not replace worker {index}: {e}", file=sys.stderr)
+                with self._changed:
+                    self._lost += 1
+                    self._changed.notify_all()
+                continue
+            with self._lock:
+                self._workers[index] = worker
+                self._generations[index] += 1
+                generation = self._generations[index]
+            self._start_reader(index)
+            self._put_idle(index, generation)
+
+    def _put_idle(self, index, generation):
+        with self._changed:
+            self._idle.append((index, generation))
+            self._changed.notify_all()
+
+    def _drop_stale(self):
+        """Drop idle slots whose worker died after they were queued; call with the lock held."""
+        live = [(index, generation) for index, generation in self._idle
+                if self._workers[index] is not None and self._generations[index] == generation]
+        if len(live) != len(self._idle):
+            self._idle = collections.deque(live)
+
+    def _take_idle(self):
+        """Next idle slot whose worker is still the one it was queued for; call with the lock held."""
+        while True:
+            self._drop_stale()
+            if self._idle:
+                return self._idle.popleft()
+            if self._lost >= self.size:
+                raise RuntimeError("Every worker in the pool has been lost")
+            self._changed.wait()
+
+    def submit(self, request, callback):
+        """
+        Send a request to the next idle worker.
+
+        Blocks while every worker is busy. The callback is invoked from a
+        dispatcher thread with the response dict once the worker answers.
+
+        Raises:
+            RuntimeError: If the pool is closed or every worker has been lost.
+        """
+        if self._closed:
+            raise RuntimeError("Worker pool is closed")
+        request_id = request.get("id") if isinstance(request, dict) else None
+        with self._changed:
+            index, _ = self._take_idle()
+            self._callbacks[index] = (callback, request_id)
+            _, conn = self._workers[index]
+        try:
+            conn.send(request)
+        except (OSError, ValueError):
+            # The worker died after it was taken; its reader answers the callback with the error
+            pass
+
+    def call(self, request):
+        """Run one request and wait for its response."""
+        done = threading.Event()
+        holder = {}
+
+        def _receive(response):
+            holder["response"] = response
+            done.set()
+
+        self.submit(request, _receive)
+        done.wait()
+        return holder["response"]
+
+    def wait_idle(self):
+        """Block until every in-flight request has been answered (every slot not lost is idle)."""
+        with self._changed:
+            while True:
+                self._drop_stale()
+                if len(self._idle) >= self.size - self._lost:
+                    return
+                self._changed.wait()
+
+    def close(self):
+        """Wait for in-flight requests, then stop every worker."""
+        self.wait_idle()
+        self._closed = True
+        self._dead.put(None)
+        with self._lock:
+            workers = [worker for worker in self._workers if worker is not None]
+        for _, conn in workers:
+            with contextlib.suppress(OSError, ValueError):
+                conn.send(None)
+        for process, conn in workers:
+            process.join(timeout=5)
+            conn.close()
+
+def serve(pool: WorkerPool, instream=None, outstream=None):
+    """Dispatch NDJSON requests from a stream to the pool until the stream closes."""
+    instream = instream or sys.stdin
+    outstream = outstream or sys.stdout
+    write_lock = threading.Lock()
+
+    def emit(response):
+        with write_lock:
+            write_line(outstream, response)
+
+    for line in iter(instream.readline, ""):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            emit({"id": None, "ok": False, "error": f"Invalid JSON request: {e}"})
+            continue
+        try:
+            pool.submit(request, emit)
+        except RuntimeError as e:
+            emit({"id": request.get("id") if isinstance(request, dict) else None, "ok": False, "error": str(e)})
+
+    pool.wait_idle()
+
+def main():
+    parser = argparse.ArgumentParser(description="COE Performance Sheet worker pool")
+    parser.add_argument("--workers", type=int, default=None, help="Number of workers (defaults to the CPU count)")
+    args = parser.parse_args()
+
+    warm_imports()
+    pool = WorkerPool(args.workers)
+    print(f"Worker pool ready with {pool.size} workers", file=sys.stderr)
+
+    try:
+        serve(pool)
+    finally:
+        pool.close()
+
+if __name__ == "__main__":
+    main()